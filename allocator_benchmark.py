@@ -0,0 +1,564 @@
+"""
+Allocator Benchmarking Module
+Object churn through pymalloc, malloc and mmap-sized buffers, container growth,
+and an optional LD_PRELOAD jemalloc/mimalloc comparison
+"""
+
+import gc
+import os
+import platform
+import sys
+import json
+import time
+import resource
+import subprocess
+import tracemalloc
+import ctypes.util
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench_utils import format_bytes, geometric_mean, latency_summary
+from resources import detect_resources
+from telemetry import TelemetrySummary
+
+
+# Objects per allocation batch (allocated, then freed together)
+ALLOC_BATCH = 1000
+
+# Buffer batches are capped at this many bytes, so large sizes allocate fewer per batch
+BUFFER_BATCH_BYTES = 64 * 1024 * 1024
+
+# pymalloc serves requests up to PYMALLOC_MAX bytes; glibc malloc hands requests of
+# MMAP_THRESHOLD and up to mmap, until frees raise its adaptive threshold
+PYMALLOC_MAX = 512
+MMAP_THRESHOLD = 128 * 1024
+
+MEDIUM_SIZES = [1024, 4 * 1024, 16 * 1024, 64 * 1024]
+LARGE_SIZES = [256 * 1024, 1024 * 1024, 4 * 1024 * 1024, 16 * 1024 * 1024]
+
+# Elements each container grows to before it is dropped
+GROWTH_ELEMENTS = 1_000_000
+
+# Allocators tried with LD_PRELOAD (library name for ctypes.util.find_library)
+PRELOAD_ALLOCATORS = ["jemalloc", "mimalloc"]
+
+# Default live heap size (GC-tracked objects) for the GC pause test; larger heaps
+# (10M, 50M) take tens of seconds to build and collect and are opt-in. Sizes whose
+# estimated footprint exceeds GC_HEAP_BUDGET_FRACTION of usable memory are skipped
+GC_HEAP_OBJECTS = [1_000_000]
+GC_HEAP_BUDGET_FRACTION = 0.5
+
+# The live heap is made of rings (reference cycles) of GC_RING_SIZE objects
+GC_RING_SIZE = 1000
+
+# Target allocation rate of the mutator while pauses are recorded (GC-tracked objects/sec)
+GC_ALLOC_RATE = 500_000
+
+# Forced full collections timed per heap size and mode (at least one is always run;
+# the rest only while the time budget allows)
+GC_FULL_COLLECTS = 3
+
+# Shortest mutator window, even when building the heap used up the time budget
+GC_MIN_WINDOW = 1.0
+
+
+class _Slotted:
+    __slots__ = ("a", "b")
+    
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+
+# === Kernels ===
+# Each kernel allocates one batch, drops it and returns the number of allocations
+
+SMALL_OBJECT_KERNELS: Dict[str, Callable[[range], list]] = {
+    "object()": lambda r: [object() for _ in r],
+    "tuple (2)": lambda r: [(i, i) for i in r],
+    "list (4)": lambda r: [[i, i, i, i] for i in r],
+    "dict (4 keys)": lambda r: [{"a": i, "b": i, "c": i, "d": i} for i in r],
+    "str (32 chars)": lambda r: [f"{i:032d}" for i in r],
+    "__slots__ instance": lambda r: [_Slotted(i, i) for i in r],
+}
+
+
+def _small_kernel(factory: Callable[[range], list]) -> Callable[[], int]:
+    batch = range(ALLOC_BATCH)
+    
+    def kernel() -> int:
+        factory(batch)
+        return ALLOC_BATCH
+    return kernel
+
+
+def _buffer_kernel(size: int) -> Callable[[], int]:
+    """Allocate (and zero) a batch of bytearrays of one size"""
+    count = max(1, min(ALLOC_BATCH, BUFFER_BATCH_BYTES // size))
+    
+    def kernel() -> int:
+        buffers = [bytearray(size) for _ in range(count)]
+        del buffers
+        return count
+    return kernel
+
+
+def _list_growth() -> int:
+    items = []
+    append = items.append
+    for i in range(GROWTH_ELEMENTS):
+        append(i)
+    return GROWTH_ELEMENTS
+
+
+def _dict_growth() -> int:
+    table = {}
+    for i in range(GROWTH_ELEMENTS):
+        table[i] = i
+    return GROWTH_ELEMENTS
+
+
+def _set_growth() -> int:
+    members = set()
+    add = members.add
+    for i in range(GROWTH_ELEMENTS):
+        add(i)
+    return GROWTH_ELEMENTS
+
+
+def _bytearray_growth() -> int:
+    """Append 4 KB chunks up to 64 MB (amortized realloc)"""
+    chunk = bytes(4096)
+    data = bytearray()
+    for _ in range(16384):
+        data += chunk
+    return 16384
+
+
+GROWTH_KERNELS: Dict[str, Callable[[], int]] = {
+    "list.append": _list_growth,
+    "dict insert": _dict_growth,
+    "set.add": _set_growth,
+    "bytearray += 4 KB": _bytearray_growth,
+}
+
+
+def _allocator_path(size: int) -> str:
+    """Which allocator a CPython buffer request of this size normally reaches"""
+    if size <= PYMALLOC_MAX:
+        return "pymalloc"
+    if size < MMAP_THRESHOLD:
+        return "malloc"
+    return "malloc/mmap"
+
+
+def _mixed_workload(duration: float) -> Dict[str, Any]:
+    """Fixed mix run under each allocator in the LD_PRELOAD comparison (allocations/sec per part)"""
+    parts = {
+        "small": _small_kernel(SMALL_OBJECT_KERNELS["dict (4 keys)"]),
+        "medium": _buffer_kernel(4 * 1024),
+        "large": _buffer_kernel(1024 * 1024),
+        "growth": _dict_growth,
+    }
+    budget = duration / len(parts)
+    rates = {}
+    for name, kernel in parts.items():
+        count = 0
+        start = time.perf_counter()
+        end = start + budget
+        while count == 0 or time.perf_counter() < end:
+            count += kernel()
+        rates[name] = count / (time.perf_counter() - start)
+    
+    # Confirm the preloaded library really is mapped into this process
+    try:
+        with open("/proc/self/maps") as f:
+            maps = f.read()
+        rates["loaded"] = [name for name in PRELOAD_ALLOCATORS if name in maps]
+    except OSError:
+        rates["loaded"] = []
+    return rates
+
+
+def _build_ring(count: int) -> _Slotted:
+    """A reference cycle of count objects (only the cyclic GC can free it)"""
+    first = _Slotted(None, 0)
+    node = first
+    for i in range(1, count):
+        node = _Slotted(node, i & 0xFF)
+    first.a = node
+    return first
+
+
+def _build_heap(objects: int) -> List[_Slotted]:
+    """Live object graph of about `objects` GC-tracked objects, built with the collector paused"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return [_build_ring(GC_RING_SIZE) for _ in range(max(1, objects // GC_RING_SIZE))]
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _count_label(count: int) -> str:
+    """Short object-count label (e.g. '10M', '500K')"""
+    for divisor, suffix in ((1_000_000, "M"), (1_000, "K")):
+        if count >= divisor:
+            value = count / divisor
+            return f"{value:.0f}{suffix}" if value == int(value) else f"{value:.1f}{suffix}"
+    return str(count)
+
+
+class _PauseRecorder:
+    """gc.callbacks hook that records every collection's pause per generation"""
+    
+    def __init__(self):
+        self.pauses: Dict[int, List[float]] = {0: [], 1: [], 2: []}
+        self._start = 0.0
+    
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses[info["generation"]].append(time.perf_counter() - self._start)
+    
+    def __enter__(self) -> "_PauseRecorder":
+        gc.callbacks.append(self)
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def _steady_mutator(heap: List[_Slotted], duration: float) -> int:
+    """Allocate at GC_ALLOC_RATE for duration seconds; returns objects allocated
+    
+    Each step replaces one live ring (the new ring survives and is promoted, the
+    old one becomes cyclic garbage) and allocates GC_RING_SIZE short-lived pairs,
+    so all three generations keep filling up as they would in a long-running service.
+    """
+    step_objects = 2 * GC_RING_SIZE
+    step_time = step_objects / GC_ALLOC_RATE
+    allocated = 0
+    slot = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        heap[slot] = _build_ring(GC_RING_SIZE)
+        slot = (slot + 1) % len(heap)
+        for i in range(GC_RING_SIZE):
+            pair = _Slotted(None, i)
+            pair.a = pair
+        allocated += step_objects
+        
+        # Pace to the target rate (no-op when the host cannot sustain it)
+        ahead = start + allocated * step_time / step_objects - time.perf_counter()
+        if ahead > 0:
+            time.sleep(ahead)
+    return allocated
+
+
+@dataclass
+class AllocatorBenchmarkResult:
+    """Results from an allocator benchmark test"""
+    test_name: str
+    duration: float
+    operations: int
+    ops_per_second: float
+    peak_traced: Optional[int]
+    score: float
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+
+class AllocatorBenchmark:
+    """Python allocator and object-churn benchmarking tool"""
+    
+    def __init__(self):
+        """Initialize allocator benchmark"""
+        self.resources = detect_resources()
+        self.python_version = platform.python_version()
+        self.preload_libraries = {name: ctypes.util.find_library(name) for name in PRELOAD_ALLOCATORS}
+    
+    def _traced_peak(self, kernel: Callable[[], int]) -> int:
+        """Peak traced memory of one kernel call (tracemalloc slows it down, so it runs untimed)"""
+        tracemalloc.start()
+        try:
+            kernel()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    def _run_kernels(self, test_name: str, kernels: List[Tuple[Dict[str, Any], Callable[[], int]]],
+                     duration: float, score_scale: float,
+                     progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Time each kernel for an equal share of the duration; one details row per kernel"""
+        budget = duration / len(kernels)
+        rows = []
+        rates = []
+        peaks = []
+        operations = 0
+        start_time = time.time()
+        
+        for idx, (labels, kernel) in enumerate(kernels):
+            kernel()  # Warm up (fills the allocator's free lists)
+            count = 0
+            faults_before = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+            start = time.perf_counter()
+            end = start + budget
+            while count == 0 or time.perf_counter() < end:
+                count += kernel()
+            elapsed = time.perf_counter() - start
+            faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults_before
+            
+            rate = count / elapsed
+            peak = self._traced_peak(kernel)
+            rows.append({
+                **labels,
+                "ops/sec": rate,
+                "ns/op": elapsed / count * 1e9,
+                "faults/op": faults / count,
+                "traced peak": format_bytes(peak)
+            })
+            rates.append(rate)
+            peaks.append(peak)
+            operations += count
+            
+            if progress_callback:
+                progress_callback((idx + 1) / len(kernels) * 100)
+        
+        ops_per_second = geometric_mean(rates)
+        return AllocatorBenchmarkResult(
+            test_name=test_name,
+            duration=time.time() - start_time,
+            operations=operations,
+            ops_per_second=ops_per_second,
+            peak_traced=max(peaks),
+            score=ops_per_second / score_scale,  # Normalize score
+            details={"python": self.python_version, "rate": "geometric mean", "rows": rows}
+        )
+    
+    def small_object_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Test allocate/free churn of small objects (pymalloc arenas)"""
+        kernels = [({"object": name}, _small_kernel(factory)) for name, factory in SMALL_OBJECT_KERNELS.items()]
+        return self._run_kernels("Small Object Churn", kernels, duration, 1e6, progress_callback)
+    
+    def medium_buffer_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Test allocate/zero/free of 1-64 KB bytearrays (system malloc)"""
+        kernels = [({"size": format_bytes(size), "path": _allocator_path(size)}, _buffer_kernel(size))
+                   for size in MEDIUM_SIZES]
+        return self._run_kernels("Medium Buffers (1-64 KB)", kernels, duration, 1e5, progress_callback)
+    
+    def large_buffer_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Test allocate/zero/free of 256 KB-16 MB bytearrays (around the mmap threshold)
+        
+        faults/op shows whether each buffer gets fresh pages (mmap) or reuses heap
+        memory; glibc raises its mmap threshold after freeing an mmapped chunk, so the
+        smaller sizes usually move back onto the heap.
+        """
+        kernels = [({"size": format_bytes(size), "path": _allocator_path(size)}, _buffer_kernel(size))
+                   for size in LARGE_SIZES]
+        result = self._run_kernels("Large Buffers (256 KB-16 MB)", kernels, duration, 1e3, progress_callback)
+        result.details["bytes/alloc"] = "zeroed by bytearray()"
+        return result
+    
+    def growth_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Test container growth: list/dict/set to 1M elements and bytearray to 64 MB (resize + rehash)"""
+        kernels = [({"pattern": name}, kernel) for name, kernel in GROWTH_KERNELS.items()]
+        result = self._run_kernels("Container Growth", kernels, duration, 1e6, progress_callback)
+        result.details["grows to"] = f"{GROWTH_ELEMENTS:,} elements / 64 MB"
+        return result
+    
+    def preload_test(self, duration: float = 8.0, progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Compare a fixed allocation mix under the default allocators and LD_PRELOADed jemalloc/mimalloc
+        
+        Every configuration runs in a fresh interpreter. Besides the default
+        (pymalloc for small objects), the mix runs with PYTHONMALLOC=malloc so that
+        every allocation reaches malloc, and then with each preloaded library found
+        by ctypes.util.find_library (also with PYTHONMALLOC=malloc).
+        """
+        configs = [("default", {}), ("malloc", {"PYTHONMALLOC": "malloc"})]
+        missing = []
+        if sys.platform.startswith("linux"):
+            for name, library in self.preload_libraries.items():
+                if library:
+                    configs.append((name, {"PYTHONMALLOC": "malloc", "LD_PRELOAD": library}))
+                else:
+                    missing.append(name)
+        else:
+            missing = list(self.preload_libraries)
+        
+        budget = duration / len(configs)
+        script = f"import json, allocator_benchmark as a; print(json.dumps(a._mixed_workload({budget!r})))"
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        rows = []
+        start_time = time.time()
+        
+        for idx, (label, overrides) in enumerate(configs):
+            env = dict(os.environ, **overrides)
+            env["PYTHONPATH"] = module_dir + os.pathsep + env.get("PYTHONPATH", "")
+            completed = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True,
+                                       text=True, timeout=budget + 60)
+            if completed.returncode != 0:
+                raise RuntimeError(f"Allocator run '{label}' failed: {completed.stderr.strip()[-200:]}")
+            rates = json.loads(completed.stdout.strip().splitlines()[-1])
+            loaded = rates.pop("loaded")
+            row = {"allocator": label}
+            row.update(rates)
+            row["mix"] = geometric_mean(list(rates.values()))
+            if "LD_PRELOAD" in overrides and label not in loaded:
+                row["allocator"] += " (not loaded)"
+            rows.append(row)
+            
+            if progress_callback:
+                progress_callback((idx + 1) / len(configs) * 100)
+        
+        baseline = rows[0]["mix"]
+        for row in rows:
+            row["vs default"] = f"{row['mix'] / baseline:.2f}x"
+        best = max(rows, key=lambda row: row["mix"])
+        details: Dict[str, Any] = {"python": self.python_version, "unit": "allocs/s",
+                                   "mix": "geometric mean of the parts"}
+        if missing:
+            details["not found"] = ", ".join(missing)
+        details["rows"] = rows
+        
+        return AllocatorBenchmarkResult(
+            test_name=f"Allocator Mix (best: {best['allocator']})",
+            duration=time.time() - start_time,
+            operations=0,
+            ops_per_second=best["mix"],
+            peak_traced=None,
+            score=best["mix"] / 1e5,  # Normalize score
+            details=details
+        )
+    
+    def _gc_pause_rows(self, label: str, mode: str, recorder: _PauseRecorder, window: float) -> List[Dict[str, Any]]:
+        """One row per generation that collected during the mutator window"""
+        rows = []
+        for generation, pauses in recorder.pauses.items():
+            if not pauses:
+                continue
+            summary = latency_summary(pauses, scale=1e3)
+            rows.append({
+                "heap": label,
+                "gc": mode,
+                "gen": str(generation),
+                "count": len(pauses),
+                "per sec": len(pauses) / window,
+                "p50 ms": summary["p50"],
+                "p99 ms": summary["p99"],
+                "max ms": summary["max"]
+            })
+        return rows
+    
+    def gc_pause_test(self, duration: float = 10.0, heap_objects: Optional[List[int]] = None, freeze: bool = True,
+                      progress_callback: Optional[Callable] = None) -> AllocatorBenchmarkResult:
+        """Measure cyclic-GC pause times against live heaps of increasing size
+        
+        For each heap size a graph of reference cycles is built, then a mutator
+        allocates at a steady GC_ALLOC_RATE while gc.callbacks records every
+        collection's pause per generation. A few forced gc.collect() calls give
+        the full-heap pause directly, since a large heap rarely reaches the gen-2
+        threshold within the window. With freeze=True the same heap is measured
+        again after gc.freeze(), which moves it out of the collector's reach.
+        
+        Building the heap and the forced collections count against `duration`:
+        each heap size gets an equal share, and its mutator windows get what the
+        build leaves. Large heaps can still overrun (one full collection of a 10M
+        heap takes seconds); the overrun is reported in the details.
+        """
+        sizes = heap_objects or GC_HEAP_OBJECTS
+        modes = ["tracked", "frozen"] if freeze and hasattr(gc, "freeze") else ["tracked"]
+        probe = GC_RING_SIZE * 10
+        bytes_per_object = self._traced_peak(lambda: len(_build_heap(probe))) / probe
+        usable = self.resources.usable_memory()
+        budget = usable * GC_HEAP_BUDGET_FRACTION if usable is not None else None
+        
+        runnable = [size for size in sizes if budget is None or size * bytes_per_object <= budget]
+        skipped = [size for size in sizes if size not in runnable]
+        if not runnable:
+            raise RuntimeError(f"No GC heap size fits in {format_bytes(int(budget))} "
+                               f"(~{bytes_per_object:.0f} B/object)")
+        
+        rows = []
+        full_pauses = []
+        allocated = 0
+        mutator_time = 0.0
+        build_times = []
+        steps = len(runnable) * len(modes)
+        start_time = time.time()
+        start = time.perf_counter()
+        
+        for idx, size in enumerate(runnable):
+            size_deadline = start + duration * (idx + 1) / len(runnable)
+            label = _count_label(size)
+            gc.collect()
+            build_start = time.perf_counter()
+            heap = _build_heap(size)
+            gc.collect()  # Promote the whole graph to the oldest generation
+            build_times.append(f"{label} {time.perf_counter() - build_start:.1f}s")
+            
+            for mode_idx, mode in enumerate(modes):
+                # Split what is left of this size's share evenly over the remaining
+                # modes; half of a mode's share goes to the mutator, the rest to the
+                # forced collections
+                mode_deadline = time.perf_counter() + (size_deadline - time.perf_counter()) / (len(modes) - mode_idx)
+                window = max(GC_MIN_WINDOW, (mode_deadline - time.perf_counter()) / 2)
+                if mode == "frozen":
+                    gc.freeze()
+                try:
+                    with _PauseRecorder() as recorder:
+                        mutator_start = time.perf_counter()
+                        allocated += _steady_mutator(heap, window)
+                        mutator_time += time.perf_counter() - mutator_start
+                    full_collects = []
+                    while len(full_collects) < GC_FULL_COLLECTS:
+                        collect_start = time.perf_counter()
+                        gc.collect()
+                        full_collects.append(time.perf_counter() - collect_start)
+                        if time.perf_counter() + full_collects[-1] > mode_deadline:
+                            break
+                finally:
+                    if mode == "frozen":
+                        gc.unfreeze()
+                rows.extend(self._gc_pause_rows(label, mode, recorder, window))
+                full_pauses.append(f"{label} {mode} {latency_summary(full_collects, scale=1e3)['p50']:.1f} ms")
+                
+                if progress_callback:
+                    progress_callback((idx * len(modes) + mode_idx + 1) / steps * 100)
+            
+            del heap
+            gc.collect()
+        
+        # Headline: worst p99 pause the mutator saw on the largest heap with the collector
+        # tracking it (forced full collections are reported separately)
+        largest = _count_label(runnable[-1])
+        worst = max((row["p99 ms"] for row in rows if row["heap"] == largest and row["gc"] == "tracked"),
+                    default=0.0)
+        details: Dict[str, Any] = {
+            "python": self.python_version,
+            "thresholds": "/".join(str(t) for t in gc.get_threshold()),
+            "alloc rate": f"{allocated / mutator_time:,.0f}/s (target {GC_ALLOC_RATE:,})",
+            "bytes/object": f"{bytes_per_object:.0f}",
+            "build": ", ".join(build_times),
+            "forced full collect": ", ".join(full_pauses)
+        }
+        elapsed = time.perf_counter() - start
+        if elapsed > duration * 1.1:
+            details["over budget"] = f"{elapsed:.1f}s for {duration:.1f}s (heap build and full collections)"
+        if skipped:
+            details["skipped"] = (f"{', '.join(_count_label(size) for size in skipped)} "
+                                  f"(over {format_bytes(int(budget))} budget)")
+        details["rows"] = rows
+        
+        return AllocatorBenchmarkResult(
+            test_name=f"GC Pauses ({largest} objects, p99 {worst:.1f} ms)",
+            duration=time.time() - start_time,
+            operations=allocated,
+            ops_per_second=allocated / mutator_time,
+            peak_traced=None,
+            score=100 / max(worst, 0.01),  # Normalize score (shorter pauses score higher)
+            details=details
+        )
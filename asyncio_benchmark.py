@@ -0,0 +1,233 @@
+"""
+asyncio Event-Loop Benchmarking Module
+Task scheduling, call_soon, Queue and stream echo throughput on the stdlib loop and uvloop
+"""
+
+import time
+import socket
+import asyncio
+import platform
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_utils import latency_summary
+from telemetry import TelemetrySummary
+
+try:
+    import uvloop
+    has_uvloop = True
+except ImportError:
+    uvloop = None
+    has_uvloop = False
+
+
+# Operations per scheduling batch (the loop checks the time budget between batches)
+ASYNC_BATCH = 1000
+
+# Bounded queue size for the producer/consumer test
+QUEUE_MAXSIZE = 1024
+
+# Concurrent clients and message size for the echo test
+ECHO_CLIENTS = 16
+ECHO_MESSAGE_SIZE = 64
+
+
+async def _noop_coro() -> None:
+    return None
+
+
+def _new_loop(name: str) -> asyncio.AbstractEventLoop:
+    """Create a fresh event loop of the named implementation"""
+    if name == "uvloop":
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+async def _task_kernel(duration: float) -> int:
+    """Create and await batches of trivial tasks"""
+    loop = asyncio.get_running_loop()
+    count = 0
+    end_time = time.perf_counter() + duration
+    while time.perf_counter() < end_time:
+        await asyncio.gather(*[loop.create_task(_noop_coro()) for _ in range(ASYNC_BATCH)])
+        count += ASYNC_BATCH
+    return count
+
+
+async def _call_soon_kernel(duration: float) -> int:
+    """Schedule batches of plain callbacks and wait for each batch to drain"""
+    loop = asyncio.get_running_loop()
+    counter = [0]
+    
+    def callback():
+        counter[0] += 1
+    
+    end_time = time.perf_counter() + duration
+    while time.perf_counter() < end_time:
+        for _ in range(ASYNC_BATCH):
+            loop.call_soon(callback)
+        # call_soon is FIFO, so this completes after every callback above has run
+        done = loop.create_future()
+        loop.call_soon(done.set_result, None)
+        await done
+    return counter[0]
+
+
+async def _queue_kernel(duration: float) -> int:
+    """One producer and one consumer passing items through a bounded asyncio.Queue"""
+    queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    sentinel = object()
+    
+    async def producer():
+        end_time = time.perf_counter() + duration
+        while time.perf_counter() < end_time:
+            for item in range(ASYNC_BATCH):
+                await queue.put(item)
+        await queue.put(sentinel)
+    
+    async def consumer():
+        received = 0
+        while await queue.get() is not sentinel:
+            received += 1
+        return received
+    
+    _, received = await asyncio.gather(producer(), consumer())
+    return received
+
+
+async def _echo_kernel(duration: float, samples: List[float]) -> int:
+    """ECHO_CLIENTS stream clients doing request/response against an in-loop stream echo server"""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                data = await reader.readexactly(ECHO_MESSAGE_SIZE)
+                writer.write(data)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+    
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    payload = bytes(ECHO_MESSAGE_SIZE)
+    end_time = time.perf_counter() + duration
+    
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        count = 0
+        while time.perf_counter() < end_time:
+            start = time.perf_counter()
+            writer.write(payload)
+            await reader.readexactly(ECHO_MESSAGE_SIZE)
+            samples.append(time.perf_counter() - start)
+            count += 1
+        writer.close()
+        await writer.wait_closed()
+        return count
+    
+    async with server:
+        counts = await asyncio.gather(*[client() for _ in range(ECHO_CLIENTS)])
+    return sum(counts)
+
+
+@dataclass
+class AsyncioBenchmarkResult:
+    """Results from an asyncio benchmark test"""
+    test_name: str
+    duration: float
+    operations: int
+    ops_per_second: float
+    event_loop: str
+    score: float
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+
+class AsyncioBenchmark:
+    """asyncio event-loop overhead benchmarking tool"""
+    
+    def __init__(self):
+        """Initialize asyncio benchmark"""
+        self.loops = ["asyncio"] + (["uvloop"] if has_uvloop else [])
+        self.python_version = platform.python_version()
+    
+    def _compare_loops(self, test_name: str, kernel: Callable, duration: float, score_scale: float,
+                       progress_callback: Optional[Callable] = None, unit: str = "ops/s",
+                       with_latency: bool = False) -> AsyncioBenchmarkResult:
+        """Run kernel(budget[, samples]) on every available loop; headline is the fastest loop"""
+        budget = duration / len(self.loops)
+        rows = []
+        total_ops = 0
+        start_time = time.time()
+        
+        for idx, name in enumerate(self.loops):
+            loop = _new_loop(name)
+            samples: List[float] = []
+            base = idx / len(self.loops) * 100
+            start = time.perf_counter()
+            
+            def tick():
+                # 10 Hz progress updates from inside the loop (negligible next to the kernel)
+                fraction = min((time.perf_counter() - start) / budget, 1.0)
+                progress_callback(base + fraction * 100 / len(self.loops))
+                loop.call_later(0.1, tick)
+            
+            if progress_callback:
+                loop.call_soon(tick)
+            try:
+                operations = loop.run_until_complete(kernel(budget, samples) if with_latency else kernel(budget))
+                elapsed = time.perf_counter() - start
+            finally:
+                loop.close()
+            
+            row = {"event loop": name, unit: operations / elapsed}
+            if with_latency:
+                summary = latency_summary(samples)
+                row["p50 µs"] = summary["p50"]
+                row["p99 µs"] = summary["p99"]
+            rows.append(row)
+            total_ops += operations
+            
+            if progress_callback:
+                progress_callback((idx + 1) / len(self.loops) * 100)
+        
+        baseline = rows[0][unit]
+        for row in rows:
+            row["vs asyncio"] = f"{row[unit] / baseline:.2f}×"
+        best = max(rows, key=lambda row: row[unit])
+        
+        return AsyncioBenchmarkResult(
+            test_name=test_name,
+            duration=time.time() - start_time,
+            operations=total_ops,
+            ops_per_second=best[unit],
+            event_loop=best["event loop"],
+            score=best[unit] / score_scale,  # Normalize score
+            details={
+                "python": self.python_version,
+                "uvloop": uvloop.__version__ if has_uvloop else "not installed",
+                "rows": rows
+            }
+        )
+    
+    def task_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> AsyncioBenchmarkResult:
+        """Test task creation + completion rate"""
+        return self._compare_loops("Task Create/Await", _task_kernel, duration, 10000,
+                                   progress_callback, unit="tasks/s")
+    
+    def call_soon_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> AsyncioBenchmarkResult:
+        """Test loop.call_soon callback throughput"""
+        return self._compare_loops("call_soon Callbacks", _call_soon_kernel, duration, 100000,
+                                   progress_callback, unit="callbacks/s")
+    
+    def queue_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> AsyncioBenchmarkResult:
+        """Test asyncio.Queue producer/consumer throughput"""
+        return self._compare_loops("asyncio.Queue", _queue_kernel, duration, 10000,
+                                   progress_callback, unit="items/s")
+    
+    def echo_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> AsyncioBenchmarkResult:
+        """Test stream echo server requests/sec over a loopback socket"""
+        return self._compare_loops(f"Stream Echo ({ECHO_CLIENTS} clients)", _echo_kernel, duration, 1000,
+                                   progress_callback, unit="req/s", with_latency=True)
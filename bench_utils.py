@@ -0,0 +1,56 @@
+"""
+Shared helpers for BenchLab benchmark modules
+Formatting, small statistics and sysfs/procfs reads used across test categories
+"""
+
+import math
+from typing import Dict, Iterable, Optional, Sequence
+
+
+def read_text(path: str) -> Optional[str]:
+    """Read a small sysfs/procfs text value, stripped (None if missing or unreadable)"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count as a short human-readable label (e.g. '64 B', '16 MB')"""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            if size == int(size):
+                return f"{int(size)} {unit}"
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size} GB"
+
+
+def geometric_mean(values: Iterable[float]) -> float:
+    """Geometric mean of the positive values (0.0 if there are none)"""
+    logs = [math.log(v) for v in values if v > 0]
+    if not logs:
+        return 0.0
+    return math.exp(sum(logs) / len(logs))
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0-100) of the values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def latency_summary(samples: Sequence[float], scale: float = 1e6) -> Dict[str, float]:
+    """p50/p90/p99/max of latency samples in seconds, scaled (default: microseconds)"""
+    return {
+        "p50": percentile(samples, 50) * scale,
+        "p90": percentile(samples, 90) * scale,
+        "p99": percentile(samples, 99) * scale,
+        "max": max(samples) * scale if samples else 0.0,
+    }
@@ -21,15 +21,43 @@ from pathlib import Path
 
 from benchmark import DiskBenchmark, BenchmarkResult
 from cpu_benchmark import CPUBenchmark, CPUBenchmarkResult
-from memory_benchmark import MemoryBenchmark, MemoryBenchmarkResult
+from memory_benchmark import LATENCY_MAX_MB, MemoryBenchmark, MemoryBenchmarkResult
 from gpu_benchmark import GPUBenchmark, GPUBenchmarkResult
+from gpu_backends import BACKEND_ORDER
+from serialization_benchmark import SerializationBenchmark, SerializationBenchmarkResult
+from process_benchmark import ProcessBenchmark, ProcessBenchmarkResult
+from ipc_benchmark import IPCBenchmark, IPCBenchmarkResult
+from network_benchmark import NetworkBenchmark, NetworkBenchmarkResult
+from asyncio_benchmark import AsyncioBenchmark, AsyncioBenchmarkResult
+from allocator_benchmark import AllocatorBenchmark, AllocatorBenchmarkResult
+from telemetry import TelemetrySampler
+from bench_utils import format_bytes
+from topology import describe_caches
+
+
+# All test categories, in run order
+ALL_CATEGORIES = ["disk", "cpu", "memory", "gpu", "serialization", "process", "ipc", "network", "asyncio", "allocator"]
+
+# Test-id prefix for each category (e.g. "mem.copy" belongs to "memory")
+CATEGORY_PREFIXES = {
+    "disk": "disk.",
+    "cpu": "cpu.",
+    "memory": "mem.",
+    "gpu": "gpu.",
+    "serialization": "serial.",
+    "process": "proc.",
+    "ipc": "ipc.",
+    "network": "net.",
+    "asyncio": "async.",
+    "allocator": "alloc.",
+}
 
 
 class BenchLabTUI:
     """Comprehensive animated TUI for system benchmarking"""
     
     def __init__(self, file_size_mb: int = 100, block_size_kb: int = 4, test_dir: Optional[str] = None,
-                 categories: List[str] = None):
+                 categories: List[str] = None, gpu_backend: Optional[str] = None):
         self.console = Console()
         
         # Initialize benchmarks
@@ -37,13 +65,25 @@ class BenchLabTUI:
         self.disk_benchmark = DiskBenchmark(test_dir=test_dir, file_size_mb=file_size_mb, block_size_kb=block_size_kb)
         self.cpu_benchmark = CPUBenchmark()
         self.memory_benchmark = MemoryBenchmark()
-        self.gpu_benchmark = GPUBenchmark()
+        self.gpu_benchmark = GPUBenchmark(backend=gpu_backend)
+        self.serialization_benchmark = SerializationBenchmark()
+        self.process_benchmark = ProcessBenchmark()
+        self.ipc_benchmark = IPCBenchmark()
+        self.network_benchmark = NetworkBenchmark()
+        self.asyncio_benchmark = AsyncioBenchmark()
+        self.allocator_benchmark = AllocatorBenchmark()
         
         # Results storage
         self.disk_results: List[BenchmarkResult] = []
         self.cpu_results: List[CPUBenchmarkResult] = []
         self.memory_results: List[MemoryBenchmarkResult] = []
         self.gpu_results: List[GPUBenchmarkResult] = []
+        self.serialization_results: List[SerializationBenchmarkResult] = []
+        self.process_results: List[ProcessBenchmarkResult] = []
+        self.ipc_results: List[IPCBenchmarkResult] = []
+        self.network_results: List[NetworkBenchmarkResult] = []
+        self.asyncio_results: List[AsyncioBenchmarkResult] = []
+        self.allocator_results: List[AllocatorBenchmarkResult] = []
         
         # Progress tracking
         self.current_progress = 0
@@ -52,7 +92,7 @@ class BenchLabTUI:
         self.is_running = False
         
         # Test categories to run
-        self.categories = categories or ["disk", "cpu", "memory", "gpu"]
+        self.categories = categories or list(ALL_CATEGORIES)
         self.gpu_available = self.gpu_benchmark.is_available()
         
         # Configuration (set by main)
@@ -61,8 +101,11 @@ class BenchLabTUI:
             'disk_block': block_size_kb,
             'cpu_duration': 5,
             'cpu_multi_duration': 10,
+            'cpu_sustained_duration': 60,
+            'cpu_sustained_interval': 5,
             'mem_size': 100,
             'gpu_iterations': 100,
+            'telemetry_interval': 0.5,
             'selected_tests': None,
             'preset': 'standard'
         }
@@ -97,8 +140,15 @@ class BenchLabTUI:
         # System info
         config_table.add_row("💾 Disk Test:", f"{self.disk_benchmark.file_size_mb} MB file")
         config_table.add_row("🔲 Block Size:", f"{self.disk_benchmark.block_size_kb} KB")
-        config_table.add_row("🧠 CPU Cores:", f"{self.cpu_benchmark.cpu_count}")
-        config_table.add_row("🎮 GPU:", "Metal (Apple Silicon)" if self.gpu_available else "Not Available")
+        resources = self.cpu_benchmark.resources
+        cpu_text = f"{resources.effective_cpus}"
+        if resources.effective_cpus != resources.logical_cpus:
+            cpu_text += f" of {resources.logical_cpus} (quota/affinity)"
+        config_table.add_row("🧠 CPU Cores:", cpu_text)
+        usable = resources.usable_memory()
+        config_table.add_row("💿 Memory Budget:", format_bytes(usable) if usable is not None else "Unknown")
+        config_table.add_row("🧱 Caches:", describe_caches(self.memory_benchmark.caches))
+        config_table.add_row("🎮 GPU:", self.gpu_benchmark.describe() if self.gpu_available else "Not Available")
         
         categories_enabled = ", ".join([c.upper() for c in self.categories])
         config_table.add_row("📊 Categories:", categories_enabled)
@@ -139,7 +189,9 @@ class BenchLabTUI:
     
     def create_results_panel(self) -> Panel:
         """Create comprehensive results panel"""
-        if not any([self.disk_results, self.cpu_results, self.memory_results, self.gpu_results]):
+        if not any([self.disk_results, self.cpu_results, self.memory_results, self.gpu_results,
+                    self.serialization_results, self.process_results, self.ipc_results,
+                    self.network_results, self.asyncio_results, self.allocator_results]):
             content = Align.center(
                 Text("No results yet...", style="dim italic"),
                 vertical="middle"
@@ -198,7 +250,7 @@ class BenchLabTUI:
                     mem_table.add_row(
                         f"✓ {result.test_name}",
                         f"{result.duration:.2f}s",
-                        f"{result.bandwidth_gbps:.2f} GB/s",
+                        f"{result.latency_ns:.1f} ns/load" if result.latency_ns is not None else f"{result.bandwidth_gbps:.2f} GB/s",
                         result.buffer_size or "N/A"
                     )
                 tables.append(mem_table)
@@ -220,6 +272,120 @@ class BenchLabTUI:
                     )
                 tables.append(gpu_table)
             
+            # Serialization Results
+            if self.serialization_results and "serialization" in self.categories:
+                serial_table = Table(show_header=True, header_style="bold blue", box=box.ROUNDED, title="📦 SERIALIZATION")
+                serial_table.add_column("Test", style="blue", no_wrap=True)
+                serial_table.add_column("Duration", style="yellow", justify="right")
+                serial_table.add_column("Encode", style="green", justify="right")
+                serial_table.add_column("Decode", style="green", justify="right")
+                serial_table.add_column("Objects/sec", style="cyan", justify="right")
+                
+                for result in self.serialization_results:
+                    serial_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.duration:.2f}s",
+                        f"{result.encode_mbps:.1f} MB/s",
+                        f"{result.decode_mbps:.1f} MB/s",
+                        f"{result.ops_per_second:,.0f}"
+                    )
+                tables.append(serial_table)
+            
+            # Process Results
+            if self.process_results and "process" in self.categories:
+                proc_table = Table(show_header=True, header_style="bold red", box=box.ROUNDED, title="🧬 PROCESS")
+                proc_table.add_column("Test", style="red", no_wrap=True)
+                proc_table.add_column("Count", style="yellow", justify="right")
+                proc_table.add_column("p50", style="green", justify="right")
+                proc_table.add_column("p99", style="green", justify="right")
+                proc_table.add_column("Rate/sec", style="cyan", justify="right")
+                
+                for result in self.process_results:
+                    proc_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.operations:,}",
+                        f"{result.p50_ms:.3f} ms",
+                        f"{result.p99_ms:.3f} ms",
+                        f"{result.ops_per_second:,.1f}"
+                    )
+                tables.append(proc_table)
+            
+            # IPC Results
+            if self.ipc_results and "ipc" in self.categories:
+                ipc_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED, title="🔁 IPC")
+                ipc_table.add_column("Test", style="cyan", no_wrap=True)
+                ipc_table.add_column("RTT p50", style="green", justify="right")
+                ipc_table.add_column("RTT p99", style="green", justify="right")
+                ipc_table.add_column("Round trips/sec", style="yellow", justify="right")
+                ipc_table.add_column("Peak MB/s", style="magenta", justify="right")
+                
+                for result in self.ipc_results:
+                    ipc_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.p50_us:.1f} µs",
+                        f"{result.p99_us:.1f} µs",
+                        f"{result.ops_per_second:,.0f}",
+                        f"{result.throughput_mbps:,.0f}"
+                    )
+                tables.append(ipc_table)
+            
+            # Network Results
+            if self.network_results and "network" in self.categories:
+                net_table = Table(show_header=True, header_style="bold green", box=box.ROUNDED, title="🌐 NETWORK (loopback)")
+                net_table.add_column("Test", style="green", no_wrap=True)
+                net_table.add_column("p50", style="yellow", justify="right")
+                net_table.add_column("p99", style="yellow", justify="right")
+                net_table.add_column("Rate/sec", style="cyan", justify="right")
+                net_table.add_column("Peak MB/s", style="magenta", justify="right")
+                
+                for result in self.network_results:
+                    net_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.p50_us:.1f} µs" if result.p50_us else "-",
+                        f"{result.p99_us:.1f} µs" if result.p99_us else "-",
+                        f"{result.ops_per_second:,.0f}",
+                        f"{result.throughput_mbps:,.0f}" if result.throughput_mbps else "-"
+                    )
+                tables.append(net_table)
+            
+            # asyncio Results
+            if self.asyncio_results and "asyncio" in self.categories:
+                async_table = Table(show_header=True, header_style="bold yellow", box=box.ROUNDED, title="⏱️ ASYNCIO")
+                async_table.add_column("Test", style="yellow", no_wrap=True)
+                async_table.add_column("Duration", style="cyan", justify="right")
+                async_table.add_column("Ops/sec", style="green", justify="right")
+                async_table.add_column("Loop", style="magenta", justify="right")
+                async_table.add_column("Score", style="bold green", justify="right")
+                
+                for result in self.asyncio_results:
+                    async_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.duration:.2f}s",
+                        f"{result.ops_per_second:,.0f}",
+                        result.event_loop,
+                        f"{result.score:.2f}"
+                    )
+                tables.append(async_table)
+            
+            # Allocator Results
+            if self.allocator_results and "allocator" in self.categories:
+                alloc_table = Table(show_header=True, header_style="bold cyan", box=box.ROUNDED, title="🧮 ALLOCATOR")
+                alloc_table.add_column("Test", style="cyan", no_wrap=True)
+                alloc_table.add_column("Duration", style="yellow", justify="right")
+                alloc_table.add_column("Ops/sec", style="green", justify="right")
+                alloc_table.add_column("Traced Peak", style="blue", justify="right")
+                alloc_table.add_column("Score", style="bold green", justify="right")
+                
+                for result in self.allocator_results:
+                    alloc_table.add_row(
+                        f"✓ {result.test_name}",
+                        f"{result.duration:.2f}s",
+                        f"{result.ops_per_second:,.0f}",
+                        format_bytes(result.peak_traced) if result.peak_traced is not None else "-",
+                        f"{result.score:.2f}"
+                    )
+                tables.append(alloc_table)
+            
             # Combine tables using Group for proper rendering
             from rich.console import Group as RenderGroup
             content = RenderGroup(*tables)
@@ -231,6 +397,70 @@ class BenchLabTUI:
             border_style="magenta"
         )
     
+    def create_details_table(self, result) -> Optional[Table]:
+        """Create a table for the per-size/per-item series attached to a result"""
+        details = getattr(result, 'details', None)
+        if not details or not details.get('rows'):
+            return None
+        
+        rows = details['rows']
+        unit = details.get('unit')
+        title = f"📈 {result.test_name}" + (f" ({unit})" if unit else "")
+        notes = [f"{key}: {value}" for key, value in details.items()
+                 if key not in ('rows', 'unit') and not isinstance(value, (list, dict))]
+        
+        table = Table(show_header=True, header_style="bold cyan", box=box.SIMPLE, title=title,
+                      caption=" | ".join(notes) if notes else None)
+        columns = list(rows[0].keys())
+        for idx, column in enumerate(columns):
+            table.add_column(str(column), style="cyan" if idx == 0 else "green",
+                             justify="left" if idx == 0 else "right", no_wrap=idx == 0)
+        
+        for row in rows:
+            cells = []
+            for column in columns:
+                value = row.get(column)
+                if value is None:
+                    cells.append("-")
+                elif isinstance(value, float):
+                    cells.append(f"{value:,.0f}" if abs(value) >= 1000 else f"{value:,.2f}")
+                else:
+                    cells.append(str(value))
+            table.add_row(*cells)
+        
+        return table
+    
+    def create_telemetry_table(self) -> Optional[Table]:
+        """Create a per-test table of temperature/frequency telemetry"""
+        all_results = (self.disk_results + self.cpu_results + self.memory_results + self.gpu_results +
+                       self.serialization_results + self.process_results + self.ipc_results +
+                       self.network_results + self.asyncio_results + self.allocator_results)
+        sampled = [r for r in all_results if getattr(r, 'telemetry', None) and r.telemetry.has_data()]
+        if not sampled:
+            return None
+        
+        def fmt(value, suffix):
+            return f"{value:.0f}{suffix}" if value is not None else "-"
+        
+        table = Table(show_header=True, header_style="bold red", box=box.SIMPLE, title="🌡️ Telemetry")
+        table.add_column("Test", style="cyan", no_wrap=True)
+        table.add_column("Temp min/avg/max", style="red", justify="right")
+        table.add_column("Freq min/avg/max", style="yellow", justify="right")
+        table.add_column("Throttle", style="magenta", justify="right")
+        table.add_column("Samples", style="dim", justify="right")
+        
+        for result in sampled:
+            t = result.telemetry
+            table.add_row(
+                result.test_name,
+                f"{fmt(t.temp_min, '')}/{fmt(t.temp_avg, '')}/{fmt(t.temp_max, '°C')}",
+                f"{fmt(t.freq_min_mhz, '')}/{fmt(t.freq_avg_mhz, '')}/{fmt(t.freq_max_mhz, ' MHz')}",
+                str(t.throttle_events) if t.throttle_events is not None else "-",
+                str(t.samples)
+            )
+        
+        return table
+    
     def create_footer(self) -> Panel:
         """Create footer with controls"""
         footer_text = Text()
@@ -279,8 +509,19 @@ class BenchLabTUI:
         self.is_running = True
         self.current_progress = 0
         
+        # Sample temperature/frequency/throttling in the background while the test runs
+        sampler = TelemetrySampler(interval=self.config.get('telemetry_interval', 0.5))
+        sampler.start()
+        
         try:
-            result = test_func(progress_callback=self.progress_callback)
+            try:
+                result = test_func(progress_callback=self.progress_callback)
+            finally:
+                telemetry = sampler.stop()
+            
+            result.telemetry = telemetry
+            if isinstance(result, CPUBenchmarkResult) and result.temperature is None:
+                result.temperature = telemetry.temp_max
             
             # Store result in appropriate category
             if category == "DISK":
@@ -291,6 +532,18 @@ class BenchLabTUI:
                 self.memory_results.append(result)
             elif category == "GPU":
                 self.gpu_results.append(result)
+            elif category == "SERIALIZATION":
+                self.serialization_results.append(result)
+            elif category == "PROCESS":
+                self.process_results.append(result)
+            elif category == "IPC":
+                self.ipc_results.append(result)
+            elif category == "NETWORK":
+                self.network_results.append(result)
+            elif category == "ASYNCIO":
+                self.asyncio_results.append(result)
+            elif category == "ALLOCATOR":
+                self.allocator_results.append(result)
                 
         except Exception as e:
             self.console.print(f"[bold red]Error in {test_name}: {e}[/bold red]")
@@ -313,7 +566,11 @@ class BenchLabTUI:
         disk_block = self.config['disk_block']
         cpu_dur = self.config['cpu_duration']
         cpu_multi_dur = self.config['cpu_multi_duration']
+        cpu_sustained_dur = self.config.get('cpu_sustained_duration', 60)
+        cpu_sustained_int = self.config.get('cpu_sustained_interval', 5)
         mem_size = self.config['mem_size']
+        gc_heap = self.config.get('gc_heap')
+        latency_max = self.config.get('latency_max') or LATENCY_MAX_MB
         gpu_iter = self.config['gpu_iterations']
         
         try:
@@ -357,6 +614,14 @@ class BenchLabTUI:
                                              file_size_mb=disk_size,
                                              block_size_kb=disk_block))
                         self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("disk.read-paths"):
+                        self.run_benchmark("DISK", "Read Paths 🗺️", 
+                                         lambda progress_callback: self.disk_benchmark.read_paths_test(
+                                             progress_callback=progress_callback,
+                                             file_size_mb=disk_size))
+                        self.update_layout(layout)
                         time.sleep(0.5)
                 
                 # === CPU TESTS ===
@@ -389,6 +654,30 @@ class BenchLabTUI:
                         self.run_benchmark("CPU", "Cryptography 🔒", 
                                          lambda progress_callback: self.cpu_benchmark.crypto_test(duration=cpu_dur, progress_callback=progress_callback))
                         self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("cpu.python"):
+                        self.run_benchmark("CPU", "Python Interpreter 🐍", 
+                                         lambda progress_callback: self.cpu_benchmark.interpreter_suite(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("cpu.per-core") and self.cpu_benchmark.has_affinity:
+                        self.run_benchmark("CPU", "Per-Core Pinned 📌", 
+                                         lambda progress_callback: self.cpu_benchmark.per_core_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("cpu.smt") and self.cpu_benchmark.has_smt():
+                        self.run_benchmark("CPU", "SMT Interference 👯", 
+                                         lambda progress_callback: self.cpu_benchmark.smt_interference_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("cpu.sustained") and cpu_sustained_dur > 0:
+                        self.run_benchmark("CPU", "Sustained All-Core 🔥", 
+                                         lambda progress_callback: self.cpu_benchmark.sustained_test(duration=cpu_sustained_dur, interval=cpu_sustained_int, progress_callback=progress_callback))
+                        self.update_layout(layout)
                         time.sleep(0.5)
                 
                 # === MEMORY TESTS ===
@@ -423,16 +712,64 @@ class BenchLabTUI:
                         self.update_layout(layout)
                         time.sleep(0.3)
                     
+                    if self.should_run_test("mem.l4") and self.memory_benchmark.has_cache_level(4):
+                        self.run_benchmark("MEMORY", "L4 Cache 🏔️", 
+                                         lambda progress_callback: self.memory_benchmark.cache_test_l4(duration=5.0, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
                     if self.should_run_test("mem.copy"):
                         self.run_benchmark("MEMORY", "Memory Copy 📋", 
                                          lambda progress_callback: self.memory_benchmark.memory_copy(size_mb=mem_size, progress_callback=progress_callback))
                         self.update_layout(layout)
                         time.sleep(0.3)
                     
+                    if self.should_run_test("mem.stride"):
+                        self.run_benchmark("MEMORY", "Stride Sweep 👣", 
+                                         lambda progress_callback: self.memory_benchmark.stride_sweep_test(size_mb=mem_size, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.parallel"):
+                        self.run_benchmark("MEMORY", "Parallel Bandwidth 👥", 
+                                         lambda progress_callback: self.memory_benchmark.parallel_bandwidth_test(size_mb=mem_size, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.numa") and self.cpu_benchmark.has_affinity:
+                        self.run_benchmark("MEMORY", "NUMA Matrix 🧭", 
+                                         lambda progress_callback: self.memory_benchmark.numa_test(size_mb=mem_size, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
                     if self.should_run_test("mem.random"):
                         self.run_benchmark("MEMORY", "Random Access 🎲", 
                                          lambda progress_callback: self.memory_benchmark.random_access(size_mb=mem_size, progress_callback=progress_callback))
                         self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.stream"):
+                        self.run_benchmark("MEMORY", "STREAM 🌊", 
+                                         lambda progress_callback: self.memory_benchmark.stream_test(size_mb=mem_size, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.hugepages"):
+                        self.run_benchmark("MEMORY", "Page Faults & THP 🐘", 
+                                         lambda progress_callback: self.memory_benchmark.huge_pages_test(progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.latency"):
+                        self.run_benchmark("MEMORY", "Load Latency Sweep 🪜", 
+                                         lambda progress_callback: self.memory_benchmark.latency_sweep_test(max_size_mb=latency_max, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("mem.tlb"):
+                        self.run_benchmark("MEMORY", "TLB Reach Sweep 🗺️", 
+                                         lambda progress_callback: self.memory_benchmark.tlb_sweep_test(progress_callback=progress_callback))
+                        self.update_layout(layout)
                         time.sleep(0.5)
                 
                 # === GPU TESTS ===
@@ -473,6 +810,187 @@ class BenchLabTUI:
                         self.update_layout(layout)
                         time.sleep(0.5)
                 
+                # === SERIALIZATION TESTS ===
+                if "serialization" in self.categories:
+                    if self.should_run_test("serial.pickle"):
+                        self.run_benchmark("SERIALIZATION", "Pickle 🥒", 
+                                         lambda progress_callback: self.serialization_benchmark.pickle_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("serial.json"):
+                        self.run_benchmark("SERIALIZATION", "JSON 📄", 
+                                         lambda progress_callback: self.serialization_benchmark.json_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("serial.marshal"):
+                        self.run_benchmark("SERIALIZATION", "Marshal 🧾", 
+                                         lambda progress_callback: self.serialization_benchmark.marshal_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("serial.struct"):
+                        self.run_benchmark("SERIALIZATION", "Struct 🧱", 
+                                         lambda progress_callback: self.serialization_benchmark.struct_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
+                # === PROCESS TESTS ===
+                if "process" in self.categories:
+                    if self.should_run_test("proc.fork") and self.process_benchmark.has_fork:
+                        self.run_benchmark("PROCESS", "Fork + Exit 🍴", 
+                                         lambda progress_callback: self.process_benchmark.fork_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("proc.exec"):
+                        self.run_benchmark("PROCESS", "Subprocess Exec 🚀", 
+                                         lambda progress_callback: self.process_benchmark.exec_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("proc.start-methods"):
+                        self.run_benchmark("PROCESS", "Process Start Methods 🧬", 
+                                         lambda progress_callback: self.process_benchmark.start_method_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("proc.pool"):
+                        self.run_benchmark("PROCESS", "Pool Startup 🏊", 
+                                         lambda progress_callback: self.process_benchmark.pool_startup_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("proc.thread"):
+                        self.run_benchmark("PROCESS", "Thread Start/Join 🧵", 
+                                         lambda progress_callback: self.process_benchmark.thread_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
+                # === IPC TESTS ===
+                if "ipc" in self.categories:
+                    if self.should_run_test("ipc.pipe") and self.ipc_benchmark.has_fork:
+                        self.run_benchmark("IPC", "os.pipe 🚰", 
+                                         lambda progress_callback: self.ipc_benchmark.pipe_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("ipc.socketpair"):
+                        self.run_benchmark("IPC", "Unix Socketpair 🔌", 
+                                         lambda progress_callback: self.ipc_benchmark.socketpair_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("ipc.mp-pipe"):
+                        self.run_benchmark("IPC", "mp.Pipe 🔗", 
+                                         lambda progress_callback: self.ipc_benchmark.mp_pipe_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("ipc.mp-queue"):
+                        self.run_benchmark("IPC", "mp.Queue 📬", 
+                                         lambda progress_callback: self.ipc_benchmark.mp_queue_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("ipc.shm") and self.ipc_benchmark.has_ordered_stores:
+                        self.run_benchmark("IPC", "Shared Memory Ring 💍", 
+                                         lambda progress_callback: self.ipc_benchmark.shared_memory_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
+                # === NETWORK TESTS ===
+                if "network" in self.categories:
+                    if self.should_run_test("net.tcp-stream"):
+                        self.run_benchmark("NETWORK", "TCP Throughput 🌊", 
+                                         lambda progress_callback: self.network_benchmark.tcp_throughput_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("net.tcp-rr"):
+                        self.run_benchmark("NETWORK", "TCP Request/Response 🏓", 
+                                         lambda progress_callback: self.network_benchmark.tcp_latency_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("net.tcp-connect"):
+                        self.run_benchmark("NETWORK", "TCP Connect Rate 🤝", 
+                                         lambda progress_callback: self.network_benchmark.tcp_connect_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("net.udp"):
+                        self.run_benchmark("NETWORK", "UDP Packet Rate 📡", 
+                                         lambda progress_callback: self.network_benchmark.udp_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
+                # === ASYNCIO TESTS ===
+                if "asyncio" in self.categories:
+                    if self.should_run_test("async.tasks"):
+                        self.run_benchmark("ASYNCIO", "Task Create/Await 🧵", 
+                                         lambda progress_callback: self.asyncio_benchmark.task_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("async.call-soon"):
+                        self.run_benchmark("ASYNCIO", "call_soon Callbacks 📞", 
+                                         lambda progress_callback: self.asyncio_benchmark.call_soon_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("async.queue"):
+                        self.run_benchmark("ASYNCIO", "asyncio.Queue 📬", 
+                                         lambda progress_callback: self.asyncio_benchmark.queue_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("async.echo"):
+                        self.run_benchmark("ASYNCIO", "Stream Echo 🔊", 
+                                         lambda progress_callback: self.asyncio_benchmark.echo_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
+                # === ALLOCATOR TESTS ===
+                if "allocator" in self.categories:
+                    if self.should_run_test("alloc.small"):
+                        self.run_benchmark("ALLOCATOR", "Small Object Churn 🫧", 
+                                         lambda progress_callback: self.allocator_benchmark.small_object_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("alloc.medium"):
+                        self.run_benchmark("ALLOCATOR", "Medium Buffers 📦", 
+                                         lambda progress_callback: self.allocator_benchmark.medium_buffer_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("alloc.large"):
+                        self.run_benchmark("ALLOCATOR", "Large Buffers 🚛", 
+                                         lambda progress_callback: self.allocator_benchmark.large_buffer_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("alloc.growth"):
+                        self.run_benchmark("ALLOCATOR", "Container Growth 📈", 
+                                         lambda progress_callback: self.allocator_benchmark.growth_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("alloc.preload"):
+                        self.run_benchmark("ALLOCATOR", "Allocator Comparison 🔀", 
+                                         lambda progress_callback: self.allocator_benchmark.preload_test(duration=cpu_dur, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.3)
+                    
+                    if self.should_run_test("alloc.gc"):
+                        heap_objects = [millions * 1_000_000 for millions in gc_heap] if gc_heap else None
+                        self.run_benchmark("ALLOCATOR", "GC Pauses ♻️", 
+                                         lambda progress_callback: self.allocator_benchmark.gc_pause_test(duration=cpu_dur, heap_objects=heap_objects, progress_callback=progress_callback))
+                        self.update_layout(layout)
+                        time.sleep(0.5)
+                
                 # Show final results
                 self.current_test = "✅ All tests completed!"
                 self.update_layout(layout)
@@ -514,10 +1032,10 @@ class BenchLabTUI:
         menu_table.add_column(style="bold cyan", justify="center")
         menu_table.add_column(style="white")
         
-        menu_table.add_row("[1]", "[bold green]⚡ Quick Test[/bold green] - Fast validation (2-3 min)")
-        menu_table.add_row("[2]", "[bold cyan]📊 Standard Test[/bold cyan] - Balanced benchmark (8-12 min)")
-        menu_table.add_row("[3]", "[bold yellow]🔍 Thorough Test[/bold yellow] - Comprehensive analysis (20-30 min)")
-        menu_table.add_row("[4]", "[bold red]🔥 Stress Test[/bold red] - Maximum load testing (45-60 min)")
+        menu_table.add_row("[1]", "[bold green]⚡ Quick Test[/bold green] - Fast validation (3-4 min)")
+        menu_table.add_row("[2]", "[bold cyan]📊 Standard Test[/bold cyan] - Balanced benchmark (9-13 min)")
+        menu_table.add_row("[3]", "[bold yellow]🔍 Thorough Test[/bold yellow] - Comprehensive analysis (25-35 min)")
+        menu_table.add_row("[4]", "[bold red]🔥 Stress Test[/bold red] - Maximum load testing (65-80 min)")
         menu_table.add_row("", "")
         menu_table.add_row("[5]", "[bold magenta]🎨 Custom Configuration[/bold magenta] - Choose your own settings")
         menu_table.add_row("[6]", "[bold blue]💾 Load Saved Config[/bold blue] - Use previously saved settings")
@@ -556,7 +1074,7 @@ class BenchLabTUI:
         elif choice == "2":
             # Standard preset - All tests in all categories
             self.apply_preset('standard')
-            self.categories = ["disk", "cpu", "memory", "gpu"]
+            self.categories = list(ALL_CATEGORIES)
             self.config['selected_tests'] = None  # Run all tests in categories
             self.console.print("\n[cyan]📊 Standard test mode selected![/cyan]")
             time.sleep(1)
@@ -564,7 +1082,7 @@ class BenchLabTUI:
         elif choice == "3":
             # Thorough preset - All tests with longer durations
             self.apply_preset('thorough')
-            self.categories = ["disk", "cpu", "memory", "gpu"]
+            self.categories = list(ALL_CATEGORIES)
             self.config['selected_tests'] = None  # Run all tests in categories
             self.console.print("\n[yellow]🔍 Thorough test mode selected![/yellow]")
             time.sleep(1)
@@ -572,7 +1090,7 @@ class BenchLabTUI:
         elif choice == "4":
             # Stress preset - All tests with maximum settings
             self.apply_preset('stress')
-            self.categories = ["disk", "cpu", "memory", "gpu"]
+            self.categories = list(ALL_CATEGORIES)
             self.config['selected_tests'] = None  # Run all tests in categories
             self.console.print("\n[red]🔥 Stress test mode selected![/red]")
             self.console.print("[bold red]⚠ Warning: This will run intensive tests for up to 60 minutes![/bold red]")
@@ -593,7 +1111,8 @@ class BenchLabTUI:
             # Include disk random tests + all memory tests
             self.config['selected_tests'] = [
                 'disk.rand-read', 'disk.rand-write',
-                'mem.seq-read', 'mem.seq-write', 'mem.l1', 'mem.l2', 'mem.l3', 'mem.copy', 'mem.random'
+                'mem.seq-read', 'mem.seq-write', 'mem.l1', 'mem.l2', 'mem.l3', 'mem.l4', 'mem.copy', 'mem.stride',
+                'mem.parallel', 'mem.numa', 'mem.random', 'mem.stream', 'mem.hugepages', 'mem.latency', 'mem.tlb'
             ]
             self.console.print("\n[white]🗄️ Database workload profile selected![/white]")
             self.console.print("[dim]Running: Random disk I/O + All memory tests[/dim]")
@@ -690,24 +1209,31 @@ class BenchLabTUI:
         # Step 1: Select categories
         self.console.print("[bold yellow]Step 1: Select Test Categories[/bold yellow]\n")
         self.console.print("Available categories:")
-        self.console.print("  [1] Disk I/O (4 tests)")
-        self.console.print("  [2] CPU (5 tests)")
-        self.console.print("  [3] Memory (7 tests)")
+        self.console.print("  [1] Disk I/O (5 tests)")
+        self.console.print("  [2] CPU (9 tests)")
+        self.console.print("  [3] Memory (15 tests)")
         gpu_text = "  [4] GPU/AI (6 tests)"
         if not self.gpu_available:
             gpu_text += " [dim](not available)[/dim]"
         self.console.print(gpu_text)
-        self.console.print("  [5] All categories")
+        self.console.print("  [5] Serialization (4 tests)")
+        self.console.print("  [6] Process/Thread creation (5 tests)")
+        self.console.print("  [7] IPC (5 tests)")
+        self.console.print("  [8] Network loopback (4 tests)")
+        self.console.print("  [9] asyncio event loop (4 tests)")
+        self.console.print("  [10] Allocator (6 tests)")
+        all_choice = str(len(ALL_CATEGORIES) + 1)
+        self.console.print(f"  [{all_choice}] All categories")
         
-        cat_choice = Prompt.ask("\nSelect categories (comma-separated numbers)", default="5")
+        cat_choice = Prompt.ask("\nSelect categories (comma-separated numbers)", default=all_choice)
         
         # Parse category selection
-        cat_map = {"1": "disk", "2": "cpu", "3": "memory", "4": "gpu"}
-        if cat_choice.strip() == "5":
-            self.categories = ["disk", "cpu", "memory", "gpu"]
+        cat_map = {str(idx): category for idx, category in enumerate(ALL_CATEGORIES, 1)}
+        if cat_choice.strip() == all_choice:
+            self.categories = list(ALL_CATEGORIES)
         else:
             selected = [cat_map[c.strip()] for c in cat_choice.split(",") if c.strip() in cat_map]
-            self.categories = selected if selected else ["disk", "cpu", "memory", "gpu"]
+            self.categories = selected if selected else list(ALL_CATEGORIES)
         
         # Step 2: Specific tests or all in category?
         self.console.print("\n[bold yellow]Step 2: Test Selection[/bold yellow]\n")
@@ -733,7 +1259,8 @@ class BenchLabTUI:
         else:
             self.console.print("Tests: [cyan]All in selected categories[/cyan]")
         self.console.print(f"Disk: [cyan]{self.config['disk_size']} MB, {self.config['disk_block']} KB blocks[/cyan]")
-        self.console.print(f"CPU: [cyan]{self.config['cpu_duration']}s single, {self.config['cpu_multi_duration']}s multi[/cyan]")
+        self.console.print(f"CPU: [cyan]{self.config['cpu_duration']}s single, {self.config['cpu_multi_duration']}s multi, "
+                           f"{self.config.get('cpu_sustained_duration', 60)}s sustained[/cyan]")
         self.console.print(f"Memory: [cyan]{self.config['mem_size']} MB buffer[/cyan]")
         self.console.print(f"GPU: [cyan]{self.config['gpu_iterations']} iterations[/cyan]")
         
@@ -766,13 +1293,18 @@ class BenchLabTUI:
                 ("disk.seq-read", "Sequential read"),
                 ("disk.rand-write", "Random write"),
                 ("disk.rand-read", "Random read"),
+                ("disk.read-paths", "readinto vs mmap vs read(), hot and cold"),
             ],
             "cpu": [
                 ("cpu.single-int", "Single-core integer"),
                 ("cpu.single-float", "Single-core float"),
                 ("cpu.multi", "Multi-core hash"),
                 ("cpu.compress", "Compression"),
-                ("cpu.crypto", "Cryptography"),
+                ("cpu.crypto", "Hash/cipher throughput sweep"),
+                ("cpu.python", "Python interpreter suite"),
+                ("cpu.per-core", "Per-core pinned scores"),
+                ("cpu.smt", "SMT sibling interference"),
+                ("cpu.sustained", "Sustained all-core (throttling)"),
             ],
             "memory": [
                 ("mem.seq-read", "Sequential read"),
@@ -780,8 +1312,16 @@ class BenchLabTUI:
                 ("mem.l1", "L1 cache"),
                 ("mem.l2", "L2 cache"),
                 ("mem.l3", "L3 cache"),
+                ("mem.l4", "L4 cache (if present)"),
                 ("mem.copy", "Memory copy"),
+                ("mem.stride", "Strided access sweep (8 B - 64 KB)"),
+                ("mem.parallel", "Multi-process bandwidth scaling"),
+                ("mem.numa", "NUMA node-to-node bandwidth/latency"),
                 ("mem.random", "Random access"),
+                ("mem.stream", "STREAM Copy/Scale/Add/Triad"),
+                ("mem.hugepages", "Page faults and THP vs 4 KB pages"),
+                ("mem.latency", "Load latency sweep (cache boundaries)"),
+                ("mem.tlb", "TLB reach sweep"),
             ],
             "gpu": [
                 ("gpu.matrix", "Matrix multiply"),
@@ -790,6 +1330,46 @@ class BenchLabTUI:
                 ("gpu.transformer", "Transformer attention"),
                 ("gpu.memory", "GPU memory bandwidth"),
                 ("gpu.inference", "AI inference"),
+            ],
+            "serialization": [
+                ("serial.pickle", "Pickle (all protocols)"),
+                ("serial.json", "JSON"),
+                ("serial.marshal", "Marshal"),
+                ("serial.struct", "Struct"),
+            ],
+            "process": [
+                ("proc.fork", "Fork + exit"),
+                ("proc.exec", "Subprocess exec"),
+                ("proc.start-methods", "multiprocessing start methods"),
+                ("proc.pool", "Pool startup"),
+                ("proc.thread", "Thread start/join"),
+            ],
+            "ipc": [
+                ("ipc.pipe", "os.pipe"),
+                ("ipc.socketpair", "Unix socketpair"),
+                ("ipc.mp-pipe", "multiprocessing.Pipe"),
+                ("ipc.mp-queue", "multiprocessing.Queue"),
+                ("ipc.shm", "Shared-memory ring buffer"),
+            ],
+            "network": [
+                ("net.tcp-stream", "TCP throughput (single/multi-stream)"),
+                ("net.tcp-rr", "TCP request/response latency"),
+                ("net.tcp-connect", "TCP connection rate"),
+                ("net.udp", "UDP packet rate"),
+            ],
+            "asyncio": [
+                ("async.tasks", "Task create/await rate"),
+                ("async.call-soon", "call_soon callback throughput"),
+                ("async.queue", "asyncio.Queue producer/consumer"),
+                ("async.echo", "Stream echo server req/s"),
+            ],
+            "allocator": [
+                ("alloc.small", "Small object churn (pymalloc)"),
+                ("alloc.medium", "1-64 KB buffer allocation"),
+                ("alloc.large", "256 KB-16 MB buffer allocation (mmap threshold)"),
+                ("alloc.growth", "list/dict/set/bytearray growth"),
+                ("alloc.preload", "Default vs PYTHONMALLOC=malloc vs jemalloc/mimalloc"),
+                ("alloc.gc", "GC pause percentiles with 1M-50M object heaps, gc.freeze"),
             ]
         }
         
@@ -844,6 +1424,10 @@ class BenchLabTUI:
                 "  Multi-core test duration (seconds)",
                 default=self.config['cpu_multi_duration']
             )
+            self.config['cpu_sustained_duration'] = IntPrompt.ask(
+                "  Sustained all-core duration (seconds, 0 to skip)",
+                default=self.config.get('cpu_sustained_duration', 60)
+            )
         
         if "memory" in self.categories:
             self.console.print("\n[bold] Memory Configuration[/bold]")
@@ -864,42 +1448,58 @@ class BenchLabTUI:
         return {
             'quick': {
                 'name': '⚡ Quick',
-                'desc': 'Fast validation (~2-3 min)',
+                'desc': 'Fast validation (~3-4 min)',
                 'disk_size': 50,
                 'disk_block': 4,
                 'cpu_duration': 3,
                 'cpu_multi_duration': 5,
+                'cpu_sustained_duration': 30,
+                'cpu_sustained_interval': 5,
                 'mem_size': 50,
+                'gc_heap': [1],
+                'latency_max': 256,
                 'gpu_iterations': 50
             },
             'standard': {
                 'name': '📊 Standard',
-                'desc': 'Balanced testing (~8-12 min)',
+                'desc': 'Balanced testing (~9-13 min)',
                 'disk_size': 100,
                 'disk_block': 4,
                 'cpu_duration': 5,
                 'cpu_multi_duration': 10,
+                'cpu_sustained_duration': 60,
+                'cpu_sustained_interval': 5,
                 'mem_size': 100,
+                'gc_heap': [1],
+                'latency_max': 1024,
                 'gpu_iterations': 100
             },
             'thorough': {
                 'name': '🔍 Thorough',
-                'desc': 'Comprehensive analysis (~20-30 min)',
+                'desc': 'Comprehensive analysis (~25-35 min)',
                 'disk_size': 500,
                 'disk_block': 4,
                 'cpu_duration': 15,
                 'cpu_multi_duration': 30,
+                'cpu_sustained_duration': 300,
+                'cpu_sustained_interval': 10,
                 'mem_size': 200,
+                'gc_heap': [1, 10],
+                'latency_max': 2048,
                 'gpu_iterations': 200
             },
             'stress': {
                 'name': '🔥 Stress Test',
-                'desc': 'Maximum load testing (~45-60 min)',
+                'desc': 'Maximum load testing (~65-80 min)',
                 'disk_size': 1000,
                 'disk_block': 4,
                 'cpu_duration': 30,
                 'cpu_multi_duration': 60,
+                'cpu_sustained_duration': 1200,
+                'cpu_sustained_interval': 15,
                 'mem_size': 500,
+                'gc_heap': [1, 10, 50],
+                'latency_max': 4096,
                 'gpu_iterations': 500
             },
             'database': {
@@ -909,7 +1509,11 @@ class BenchLabTUI:
                 'disk_block': 4,
                 'cpu_duration': 10,
                 'cpu_multi_duration': 20,
+                'cpu_sustained_duration': 60,
+                'cpu_sustained_interval': 5,
                 'mem_size': 200,
+                'gc_heap': [1],
+                'latency_max': 2048,
                 'gpu_iterations': 100
             },
             'video': {
@@ -919,7 +1523,11 @@ class BenchLabTUI:
                 'disk_block': 128,
                 'cpu_duration': 10,
                 'cpu_multi_duration': 20,
+                'cpu_sustained_duration': 120,
+                'cpu_sustained_interval': 10,
                 'mem_size': 500,
+                'gc_heap': [1],
+                'latency_max': 1024,
                 'gpu_iterations': 200
             }
         }
@@ -933,7 +1541,11 @@ class BenchLabTUI:
             self.config['disk_block'] = preset['disk_block']
             self.config['cpu_duration'] = preset['cpu_duration']
             self.config['cpu_multi_duration'] = preset['cpu_multi_duration']
+            self.config['cpu_sustained_duration'] = preset['cpu_sustained_duration']
+            self.config['cpu_sustained_interval'] = preset['cpu_sustained_interval']
             self.config['mem_size'] = preset['mem_size']
+            self.config['gc_heap'] = preset['gc_heap']
+            self.config['latency_max'] = preset['latency_max']
             self.config['gpu_iterations'] = preset['gpu_iterations']
             self.config['preset'] = preset_name
             # Update disk benchmark with new settings
@@ -1023,10 +1635,15 @@ class BenchLabTUI:
         
         self.console.print(summary_panel)
         
+        # Resources the results were measured under
+        self.console.print(f"\n[bold white]🖥️ Resources:[/bold white] [dim]{self.cpu_benchmark.resources.describe()}[/dim]")
+        if self.memory_results:
+            self.console.print(f"[bold white]🧱 Caches:[/bold white] [dim]{describe_caches(self.memory_benchmark.caches)}[/dim]")
+        
         # Calculate category summaries
         if self.disk_results:
             avg_throughput = sum(r.throughput_mbps for r in self.disk_results) / len(self.disk_results)
-            self.console.print(f"\n[bold cyan]💾 Disk Average:[/bold cyan] [bold yellow]{avg_throughput:.2f} MB/s[/bold yellow]")
+            self.console.print(f"[bold cyan]💾 Disk Average:[/bold cyan] [bold yellow]{avg_throughput:.2f} MB/s[/bold yellow]")
         
         if self.cpu_results:
             avg_score = sum(r.score for r in self.cpu_results) / len(self.cpu_results)
@@ -1037,13 +1654,64 @@ class BenchLabTUI:
             else:
                 self.console.print()
         
-        if self.memory_results:
-            avg_bandwidth = sum(r.bandwidth_gbps for r in self.memory_results) / len(self.memory_results)
+        bandwidth_results = [r for r in self.memory_results if r.latency_ns is None]
+        if bandwidth_results:
+            avg_bandwidth = sum(r.bandwidth_gbps for r in bandwidth_results) / len(bandwidth_results)
             self.console.print(f"[bold yellow]💿 Memory Average:[/bold yellow] [bold yellow]{avg_bandwidth:.2f} GB/s[/bold yellow]")
+        for result in self.memory_results:
+            if result.downscaled:
+                self.console.print(f"[yellow]⚠️ {result.test_name} downscaled:[/yellow] [dim]{result.downscaled}[/dim]")
         
         if self.gpu_results:
             avg_score = sum(r.score for r in self.gpu_results) / len(self.gpu_results)
-            self.console.print(f"[bold green]🎮 GPU Average Score:[/bold green] [bold yellow]{avg_score:.2f}[/bold yellow]")
+            self.console.print(f"[bold green]🎮 GPU Average Score:[/bold green] [bold yellow]{avg_score:.2f}[/bold yellow] "
+                               f"[dim]({self.gpu_results[0].gpu_type})[/dim]")
+        
+        if self.serialization_results:
+            avg_encode = sum(r.encode_mbps for r in self.serialization_results) / len(self.serialization_results)
+            avg_decode = sum(r.decode_mbps for r in self.serialization_results) / len(self.serialization_results)
+            self.console.print(f"[bold blue]📦 Serialization Average:[/bold blue] [bold yellow]{avg_encode:.1f} MB/s encode, {avg_decode:.1f} MB/s decode[/bold yellow]")
+        
+        if self.process_results:
+            summary = ", ".join(f"{r.test_name} {r.p50_ms:.2f} ms" for r in self.process_results)
+            self.console.print(f"[bold red]🧬 Process p50:[/bold red] [bold yellow]{summary}[/bold yellow]")
+        
+        if self.ipc_results:
+            fastest = min(self.ipc_results, key=lambda r: r.p50_us)
+            widest = max(self.ipc_results, key=lambda r: r.throughput_mbps)
+            self.console.print(f"[bold cyan]🔁 IPC Best:[/bold cyan] [bold yellow]{fastest.p50_us:.1f} µs RTT ({fastest.test_name}), "
+                               f"{widest.throughput_mbps:,.0f} MB/s ({widest.test_name})[/bold yellow]")
+        
+        if self.network_results:
+            summary = ", ".join(f"{r.test_name} {r.ops_per_second:,.0f}/s" for r in self.network_results
+                                if not r.test_name.startswith("TCP Throughput"))
+            peak = max(r.throughput_mbps for r in self.network_results)
+            self.console.print(f"[bold green]🌐 Network:[/bold green] [bold yellow]{peak:,.0f} MB/s peak"
+                               f"{', ' + summary if summary else ''}[/bold yellow]")
+        
+        if self.asyncio_results:
+            summary = ", ".join(f"{r.test_name} {r.ops_per_second:,.0f}/s" for r in self.asyncio_results)
+            self.console.print(f"[bold yellow]⏱️ asyncio ({self.asyncio_results[0].details['python']}):[/bold yellow] "
+                               f"[bold yellow]{summary}[/bold yellow]")
+        
+        if self.allocator_results:
+            summary = ", ".join(f"{r.test_name} {r.ops_per_second:,.0f}/s" for r in self.allocator_results)
+            self.console.print(f"[bold cyan]🧮 Allocator ({self.allocator_results[0].details['python']}):[/bold cyan] "
+                               f"[bold yellow]{summary}[/bold yellow]")
+        
+        # Detailed series (size sweeps, per-item tables)
+        for result in (self.disk_results + self.cpu_results + self.memory_results + self.gpu_results +
+                       self.serialization_results + self.process_results + self.ipc_results +
+                       self.network_results + self.asyncio_results + self.allocator_results):
+            details_table = self.create_details_table(result)
+            if details_table:
+                self.console.print()
+                self.console.print(details_table)
+        
+        telemetry_table = self.create_telemetry_table()
+        if telemetry_table:
+            self.console.print()
+            self.console.print(telemetry_table)
 
 
 def main():
@@ -1063,16 +1731,22 @@ Examples:
   ./run.sh --tests disk.seq-read,cpu.multi    # Run specific tests
 
 Test Categories:
-  disk    - Disk I/O (sequential/random read/write, 4 tests)
-  cpu     - CPU performance (integer/float/multi-core/compression/crypto, 5 tests)
-  memory  - Memory bandwidth (sequential/cache/random/copy, 6 tests)
-  gpu     - GPU/AI performance (matrix/conv/transformer/inference, 6 tests)
+  disk    - Disk I/O (sequential/random read/write, readinto/mmap/read() hot and cold, 5 tests)
+  cpu     - CPU performance (integer/float/multi-core/compression/crypto/python/per-core/smt/sustained, 9 tests)
+  memory  - Memory bandwidth and latency (STREAM/sequential/cache/random/copy/stride/parallel/NUMA/THP/latency/TLB, 15 tests)
+  gpu     - GPU/AI performance (matrix/conv/transformer/inference on CUDA/MPS/CPU, 6 tests)
+  serialization - Encode/decode throughput (pickle/json/marshal/struct, 4 tests)
+  process - Process/thread creation latency (fork/exec/start methods/pool/thread, 5 tests)
+  ipc     - IPC round-trip latency and throughput (pipe/socketpair/mp.Pipe/mp.Queue/shm, 5 tests)
+  network - Loopback TCP/UDP throughput, latency and connect rate (4 tests)
+  asyncio - Event-loop overhead (tasks/call_soon/queue/echo, uvloop if installed, 4 tests)
+  allocator - Allocation churn (small objects/buffers/mmap-sized/growth, jemalloc/mimalloc if found, GC pauses, 6 tests)
         """
     )
     
     # Category selection
     parser.add_argument("--categories", type=str, default="all", 
-                       help="Categories to test: all, disk, cpu, memory, gpu (comma-separated)")
+                       help="Categories to test: all, disk, cpu, memory, gpu, serialization, process, ipc, network, asyncio, allocator (comma-separated)")
     
     # Individual test selection
     parser.add_argument("--tests", type=str, default=None,
@@ -1094,14 +1768,24 @@ Test Categories:
                        help="CPU single-core test duration in seconds (default: 5)")
     parser.add_argument("--cpu-multi-duration", type=int, default=10,
                        help="CPU multi-core test duration in seconds (default: 10)")
+    parser.add_argument("--cpu-sustained-duration", type=int, default=60,
+                       help="CPU sustained all-core test duration in seconds, 0 to skip (default: 60)")
+    parser.add_argument("--cpu-sustained-interval", type=int, default=5,
+                       help="CPU sustained test scoring interval in seconds (default: 5)")
     
     # Memory configuration  
     parser.add_argument("--mem-size", type=int, default=100,
                        help="Memory test buffer size in MB (default: 100)")
+    parser.add_argument("--gc-heap", type=str, default=None,
+                       help="GC pause test live heap sizes in millions of objects, comma-separated (default: 1; 10 and 50 take minutes)")
+    parser.add_argument("--latency-max", type=int, default=None,
+                       help=f"Largest load latency sweep working set in MB (default: {LATENCY_MAX_MB}; capped to the memory budget)")
     
     # GPU configuration
     parser.add_argument("--gpu-iterations", type=int, default=100,
                        help="GPU test iterations (default: 100)")
+    parser.add_argument("--gpu-backend", type=str, default="auto", choices=["auto"] + BACKEND_ORDER,
+                       help="GPU/AI test backend (default: auto = first available of cuda, mps, torch-cpu, numpy)")
     
     # Interactive mode control
     parser.add_argument("--no-interactive", action="store_true",
@@ -1122,10 +1806,17 @@ Test Categories:
          args.block == 4 and
          args.cpu_duration == 5 and
          args.cpu_multi_duration == 10 and
+         args.cpu_sustained_duration == 60 and
+         args.cpu_sustained_interval == 5 and
          args.mem_size == 100 and
-         args.gpu_iterations == 100)
+         args.gc_heap is None and
+         args.latency_max is None and
+         args.gpu_iterations == 100 and
+         args.gpu_backend == "auto")
     )
     
+    gpu_backend = None if args.gpu_backend == "auto" else args.gpu_backend
+    
     # List tests if requested
     if args.list_tests:
         console = Console()
@@ -1136,13 +1827,18 @@ Test Categories:
         console.print("  disk.seq-read     - Sequential read")
         console.print("  disk.rand-write   - Random write with IOPS")
         console.print("  disk.rand-read    - Random read with IOPS")
+        console.print("  disk.read-paths   - Whole-file load via readinto/mmap/read(), hot and cold GB/s")
         
         console.print("\n[bold magenta]🧠 CPU:[/bold magenta]")
         console.print("  cpu.single-int    - Single-core integer")
         console.print("  cpu.single-float  - Single-core floating point")
         console.print("  cpu.multi         - Multi-core hash")
         console.print("  cpu.compress      - Compression test")
-        console.print("  cpu.crypto        - Cryptography test")
+        console.print("  cpu.crypto        - Hash/cipher MB/s across 64 B-16 MB buffers")
+        console.print("  cpu.python        - Python interpreter suite (dict/string/regex/calls/objects)")
+        console.print("  cpu.per-core      - Pin to each logical CPU in turn, flag slow/fast cores (Linux)")
+        console.print("  cpu.smt           - SMT sibling vs separate-core pairing, SMT yield (Linux)")
+        console.print("  cpu.sustained     - Sustained all-core load with per-interval scores")
         
         console.print("\n[bold magenta]💿 Memory:[/bold magenta]")
         console.print("  mem.seq-read      - Sequential read")
@@ -1150,8 +1846,16 @@ Test Categories:
         console.print("  mem.l1            - L1 cache test")
         console.print("  mem.l2            - L2 cache test")
         console.print("  mem.l3            - L3 cache test")
+        console.print("  mem.l4            - L4 cache test (only where sysfs reports an L4)")
         console.print("  mem.copy          - Memory copy")
+        console.print("  mem.stride        - Strided read sweep 8 B - 64 KB (ns/element, effective GB/s)")
+        console.print("  mem.parallel      - Aggregate bandwidth for 1..N processes, saturation point")
+        console.print("  mem.numa          - NUMA node-to-node bandwidth/latency matrix (Linux)")
         console.print("  mem.random        - Random access")
+        console.print("  mem.stream        - STREAM Copy/Scale/Add/Triad")
+        console.print("  mem.hugepages     - First-touch faults, bandwidth, latency: 4 KB pages vs THP")
+        console.print("  mem.latency       - Load latency sweep (cache boundaries)")
+        console.print("  mem.tlb           - TLB reach sweep")
         
         console.print("\n[bold magenta]🎮 GPU/AI:[/bold magenta]")
         console.print("  gpu.matrix        - Matrix multiply")
@@ -1161,6 +1865,46 @@ Test Categories:
         console.print("  gpu.memory        - GPU memory bandwidth")
         console.print("  gpu.inference     - AI inference")
         
+        console.print("\n[bold magenta]📦 Serialization:[/bold magenta]")
+        console.print("  serial.pickle     - Pickle round-trip, every protocol")
+        console.print("  serial.json       - JSON round-trip")
+        console.print("  serial.marshal    - Marshal round-trip")
+        console.print("  serial.struct     - Struct pack/unpack (fixed layouts)")
+        
+        console.print("\n[bold magenta]🧬 Process:[/bold magenta]")
+        console.print("  proc.fork         - os.fork + exit + waitpid")
+        console.print("  proc.exec         - Subprocess exec of /bin/true")
+        console.print("  proc.start-methods - multiprocessing.Process per start method")
+        console.print("  proc.pool         - Pool(N) startup per start method")
+        console.print("  proc.thread       - threading.Thread start + join")
+        
+        console.print("\n[bold magenta]🔁 IPC:[/bold magenta]")
+        console.print("  ipc.pipe          - os.pipe ping-pong and bulk")
+        console.print("  ipc.socketpair    - Unix domain socketpair")
+        console.print("  ipc.mp-pipe       - multiprocessing.Pipe")
+        console.print("  ipc.mp-queue      - multiprocessing.Queue")
+        console.print("  ipc.shm           - Shared-memory ring buffer")
+        
+        console.print("\n[bold magenta]🌐 Network (loopback):[/bold magenta]")
+        console.print("  net.tcp-stream    - TCP single/multi-stream throughput")
+        console.print("  net.tcp-rr        - TCP request/response latency")
+        console.print("  net.tcp-connect   - TCP connect + teardown rate")
+        console.print("  net.udp           - UDP packet rate and loss")
+        
+        console.print("\n[bold magenta]⏱️ asyncio:[/bold magenta]")
+        console.print("  async.tasks       - Task create + await rate")
+        console.print("  async.call-soon   - loop.call_soon callbacks/sec")
+        console.print("  async.queue       - asyncio.Queue producer/consumer")
+        console.print("  async.echo        - Stream echo server requests/sec")
+        
+        console.print("\n[bold magenta]🧮 Allocator:[/bold magenta]")
+        console.print("  alloc.small       - Small object allocate/free churn (pymalloc)")
+        console.print("  alloc.medium      - 1-64 KB bytearray allocation (malloc)")
+        console.print("  alloc.large       - 256 KB-16 MB bytearray allocation (mmap threshold)")
+        console.print("  alloc.growth      - list/dict/set/bytearray growth")
+        console.print("  alloc.preload     - Allocation mix under pymalloc, libc malloc, jemalloc/mimalloc")
+        console.print("  alloc.gc          - GC pause percentiles per generation vs live heap size (gc.freeze)")
+        
         console.print("\n[bold yellow]Examples:[/bold yellow]")
         console.print("  --tests disk.seq-read,disk.seq-write")
         console.print("  --tests cpu.single-int,cpu.multi")
@@ -1175,7 +1919,8 @@ Test Categories:
             file_size_mb=args.size,
             block_size_kb=args.block,
             test_dir=args.dir,
-            categories=["disk", "cpu", "memory", "gpu"]
+            categories=list(ALL_CATEGORIES),
+            gpu_backend=gpu_backend
         )
         
         # Show interactive menu and get configuration
@@ -1194,19 +1939,12 @@ Test Categories:
         # Individual test selection
         selected_tests = [t.strip().lower() for t in args.tests.split(",")]
         # Determine categories from tests
-        categories = []
-        if any(t.startswith("disk.") for t in selected_tests):
-            categories.append("disk")
-        if any(t.startswith("cpu.") for t in selected_tests):
-            categories.append("cpu")
-        if any(t.startswith("mem.") for t in selected_tests):
-            categories.append("memory")
-        if any(t.startswith("gpu.") for t in selected_tests):
-            categories.append("gpu")
+        categories = [category for category in ALL_CATEGORIES
+                      if any(t.startswith(CATEGORY_PREFIXES[category]) for t in selected_tests)]
     else:
         # Category selection
         if args.categories.lower() == "all":
-            categories = ["disk", "cpu", "memory", "gpu"]
+            categories = list(ALL_CATEGORIES)
         else:
             categories = [c.strip().lower() for c in args.categories.split(",")]
         selected_tests = None
@@ -1216,7 +1954,8 @@ Test Categories:
         file_size_mb=args.size,
         block_size_kb=args.block,
         test_dir=args.dir,
-        categories=categories
+        categories=categories,
+        gpu_backend=gpu_backend
     )
     
     # Store test configuration in TUI
@@ -1225,7 +1964,11 @@ Test Categories:
         'disk_block': args.block,
         'cpu_duration': args.cpu_duration,
         'cpu_multi_duration': args.cpu_multi_duration,
+        'cpu_sustained_duration': args.cpu_sustained_duration,
+        'cpu_sustained_interval': args.cpu_sustained_interval,
         'mem_size': args.mem_size,
+        'gc_heap': [int(millions) for millions in args.gc_heap.split(",")] if args.gc_heap else None,
+        'latency_max': args.latency_max,
         'gpu_iterations': args.gpu_iterations,
         'selected_tests': selected_tests
     }
@@ -3,14 +3,286 @@ CPU Performance Benchmarking Module
 Provides single-core, multi-core, and various computational tests
 """
 
+import os
+import re
 import time
 import math
 import hashlib
 import multiprocessing
 import platform
-import subprocess
+import statistics
 from dataclasses import dataclass
-from typing import Callable, Optional, List
+from typing import Any, Callable, Dict, Optional, List
+
+from bench_utils import format_bytes, geometric_mean
+from resources import detect_resources
+from topology import hybrid_core_types, isolated_cpus, smt_sibling_groups, usable_cpus
+from telemetry import (TelemetrySummary, find_frequency_sources, find_temperature_sources,
+                       read_cpu_frequency, read_cpu_temperature)
+
+
+# Buffer sizes for the crypto sweep: 64 B to 16 MB in 4x steps
+CRYPTO_BUFFER_SIZES = [64 * (4 ** i) for i in range(10)]
+
+
+# === Python interpreter kernels ===
+# Each kernel performs a fixed amount of deterministic work per loop and
+# returns the number of operations it completed.
+
+_WORDS = [f"key_{i:04d}" for i in range(1000)]
+_LOG_LINES = [
+    f"2024-01-{i % 28 + 1:02d} 12:{i % 60:02d}:{(i * 7) % 60:02d} GET /api/v1/items/{i} status={200 + i % 5} size={i * 37}"
+    for i in range(200)
+]
+_LOG_PATTERN = re.compile(r"GET (/api/v1/items/(\d+)) status=(\d+) size=(\d+)")
+
+
+def _kernel_dict_lookup(loops: int) -> int:
+    """Dict lookups with string keys (hits and misses)"""
+    table = {word: idx for idx, word in enumerate(_WORDS)}
+    missing = "not_a_key"
+    total = 0
+    for _ in range(loops):
+        for word in _WORDS:
+            total += table[word]
+        total += table.get(missing, 0)
+    return loops * (len(_WORDS) + 1)
+
+
+def _kernel_dict_churn(loops: int) -> int:
+    """Dict insert, update and delete"""
+    for _ in range(loops):
+        table = {}
+        for idx, word in enumerate(_WORDS):
+            table[word] = idx
+        for word in _WORDS[::2]:
+            table[word] += 1
+        for word in _WORDS[1::2]:
+            del table[word]
+    return loops * len(_WORDS) * 2
+
+
+def _kernel_string_build(loops: int) -> int:
+    """String formatting, concatenation and join"""
+    for _ in range(loops):
+        parts = []
+        for idx in range(200):
+            parts.append(f"{idx}:{_WORDS[idx]}")
+        line = ",".join(parts)
+        text = ""
+        for word in _WORDS[:200]:
+            text += word
+        line.upper()
+    return loops * 400
+
+
+def _kernel_string_methods(loops: int) -> int:
+    """split/strip/replace/startswith on log lines"""
+    count = 0
+    for _ in range(loops):
+        for line in _LOG_LINES:
+            fields = line.split()
+            if fields[2].startswith("GET"):
+                count += 1
+            line.replace("status", "code").strip()
+    return loops * len(_LOG_LINES)
+
+
+def _kernel_regex(loops: int) -> int:
+    """Precompiled regex search and substitution"""
+    total = 0
+    for _ in range(loops):
+        for line in _LOG_LINES:
+            match = _LOG_PATTERN.search(line)
+            if match:
+                total += int(match.group(4))
+        _LOG_PATTERN.sub("REDACTED", _LOG_LINES[0])
+    return loops * (len(_LOG_LINES) + 1)
+
+
+def _kernel_function_calls(loops: int) -> int:
+    """Positional, keyword and closure calls"""
+    def add(a, b):
+        return a + b
+    
+    def scaled(value, factor=2, offset=0):
+        return value * factor + offset
+    
+    def make_counter():
+        count = 0
+        
+        def increment():
+            nonlocal count
+            count += 1
+            return count
+        return increment
+    
+    counter = make_counter()
+    total = 0
+    for _ in range(loops):
+        for i in range(100):
+            total = add(total, i)
+            total = scaled(total, factor=1, offset=i)
+            counter()
+    return loops * 300
+
+
+class _Point:
+    """Plain class used by attribute and churn kernels"""
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+    
+    @property
+    def norm1(self):
+        return abs(self.x) + abs(self.y)
+    
+    def move(self, dx, dy):
+        self.x += dx
+        self.y += dy
+
+
+class _SlotPoint:
+    """__slots__ variant used by the churn kernel"""
+    __slots__ = ("x", "y")
+    
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _kernel_attribute_access(loops: int) -> int:
+    """Instance attribute get/set, property and method calls"""
+    point = _Point(1, 2)
+    total = 0
+    for _ in range(loops):
+        for i in range(100):
+            point.move(1, -1)
+            total += point.x + point.y
+            total += point.norm1
+    return loops * 400
+
+
+def _kernel_object_churn(loops: int) -> int:
+    """Short-lived objects, tuples and lists"""
+    for _ in range(loops):
+        points = [_Point(i, i) for i in range(100)]
+        slots = [_SlotPoint(i, i) for i in range(100)]
+        pairs = [(p.x, s.y) for p, s in zip(points, slots)]
+        del points, slots, pairs
+    return loops * 300
+
+
+def _kernel_sort(loops: int) -> int:
+    """Sorting records by key"""
+    records = [(_WORDS[(i * 7919) % len(_WORDS)], i) for i in range(500)]
+    for _ in range(loops):
+        sorted(records)
+        sorted(records, key=lambda record: record[1], reverse=True)
+    return loops * len(records) * 2
+
+
+INTERPRETER_KERNELS = {
+    "dict_lookup": _kernel_dict_lookup,
+    "dict_churn": _kernel_dict_churn,
+    "string_build": _kernel_string_build,
+    "string_methods": _kernel_string_methods,
+    "regex": _kernel_regex,
+    "function_calls": _kernel_function_calls,
+    "attribute_access": _kernel_attribute_access,
+    "object_churn": _kernel_object_churn,
+    "sort": _kernel_sort,
+}
+
+
+def _constant_work_chunk(x: float) -> float:
+    """Fixed chunk of integer + float work (200 ops); identical cost on every call"""
+    for n in range(100003, 100203):
+        for i in range(2, int(math.sqrt(n)) + 1):
+            if n % i == 0:
+                break
+        x = math.sqrt(x + 1.0) * math.cos(x)
+    return x
+
+
+CONSTANT_CHUNK_OPS = 200
+
+
+def _sustained_worker(counters, slot: int, stop_event) -> None:
+    """All-core sustained load, publishing op counts to a shared slot"""
+    operations = 0
+    x = 1.0
+    while not stop_event.is_set():
+        # Identical chunk every time so any score change comes from the hardware
+        x = _constant_work_chunk(x)
+        operations += CONSTANT_CHUNK_OPS
+        counters[slot] = operations
+
+
+def _per_core_worker(conn, cpus: List[int], chunks: int, repeats: int) -> None:
+    """Pin this process to each CPU in turn and report the best ops/sec on each"""
+    for cpu in cpus:
+        os.sched_setaffinity(0, {cpu})
+        x = _constant_work_chunk(1.0)  # Warm up on the new CPU
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            for _ in range(chunks):
+                x = _constant_work_chunk(x)
+            best = min(best, time.perf_counter() - start)
+        conn.send((cpu, chunks * CONSTANT_CHUNK_OPS / best))
+    conn.close()
+
+
+def _smt_kernel_int() -> int:
+    """Integer chunk for SMT pairing"""
+    for n in range(100003, 100203):
+        for i in range(2, int(math.sqrt(n)) + 1):
+            if n % i == 0:
+                break
+    return 200
+
+
+def _smt_kernel_float() -> int:
+    """Floating-point chunk for SMT pairing"""
+    x = 1.0
+    for _ in range(500):
+        x = math.sqrt(x + 1.0)
+        x = math.sin(x) * math.cos(x)
+        x = math.exp(x / 100.0)
+    return 1500
+
+
+_SMT_HASH_BLOCK = bytes(range(256)) * 16
+
+
+def _smt_kernel_hash() -> int:
+    """SHA-256 chunk (4 KB blocks) for SMT pairing"""
+    for _ in range(50):
+        hashlib.sha256(_SMT_HASH_BLOCK).digest()
+    return 50
+
+
+SMT_KERNELS = {
+    "integer": _smt_kernel_int,
+    "float": _smt_kernel_float,
+    "hash": _smt_kernel_hash,
+}
+
+
+def _pinned_kernel_worker(cpu: int, kernel_name: str, duration: float, barrier, results) -> None:
+    """Pin to one CPU, wait for the other workers, then run a kernel for `duration` seconds"""
+    os.sched_setaffinity(0, {cpu})
+    kernel = SMT_KERNELS[kernel_name]
+    kernel()  # Warm up
+    barrier.wait()
+    operations = 0
+    start = time.perf_counter()
+    end = start + duration
+    while time.perf_counter() < end:
+        operations += kernel()
+    results.put((cpu, operations / (time.perf_counter() - start)))
 
 
 @dataclass
@@ -23,6 +295,9 @@ class CPUBenchmarkResult:
     score: float
     cores_used: int = 1
     temperature: Optional[float] = None
+    throughput_mbps: Optional[float] = None
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
 
 
 class CPUBenchmark:
@@ -30,31 +305,20 @@ class CPUBenchmark:
     
     def __init__(self):
         """Initialize CPU benchmark"""
-        self.cpu_count = multiprocessing.cpu_count()
+        # Honour cgroup CPU quotas and affinity, not just the host's logical CPU count
+        self.resources = detect_resources()
+        self.cpu_count = self.resources.effective_cpus
         self.platform = platform.system()
+        self._temp_sources = find_temperature_sources()
+        self._freq_sources = find_frequency_sources()
+        self.has_affinity = hasattr(os, "sched_setaffinity")
         
     def _get_cpu_temperature(self) -> Optional[float]:
-        """Get CPU temperature (macOS specific)"""
-        try:
-            if self.platform == "Darwin":  # macOS
-                result = subprocess.run(
-                    ["sudo", "powermetrics", "--samplers", "smc", "-i1", "-n1"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                # Parse output for CPU die temperature
-                for line in result.stdout.split('\n'):
-                    if 'CPU die temperature' in line:
-                        temp_str = line.split(':')[1].strip().split()[0]
-                        return float(temp_str)
-            return None
-        except Exception:
-            return None
+        """Get current CPU temperature from sysfs (None if unavailable)"""
+        return read_cpu_temperature(self._temp_sources)
     
     def single_core_integer(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
         """Test single-core integer performance"""
-        start_temp = self._get_cpu_temperature()
         operations = 0
         start_time = time.time()
         end_time = start_time + duration
@@ -94,7 +358,6 @@ class CPUBenchmark:
     
     def single_core_floating_point(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
         """Test single-core floating point performance"""
-        start_temp = self._get_cpu_temperature()
         operations = 0
         start_time = time.time()
         end_time = start_time + duration
@@ -139,7 +402,6 @@ class CPUBenchmark:
     
     def multi_core_hash(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
         """Test multi-core performance with hashing"""
-        start_temp = self._get_cpu_temperature()
         start_time = time.time()
         
         # Calculate iterations per worker
@@ -195,7 +457,6 @@ class CPUBenchmark:
     def compression_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
         """Test CPU with compression workload"""
         import zlib
-        start_temp = self._get_cpu_temperature()
         start_time = time.time()
         end_time = start_time + duration
         
@@ -229,29 +490,121 @@ class CPUBenchmark:
             temperature=end_temp
         )
     
-    def crypto_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
-        """Test CPU with cryptographic operations"""
-        start_temp = self._get_cpu_temperature()
-        start_time = time.time()
-        end_time = start_time + duration
+    def _get_crypto_acceleration(self) -> List[str]:
+        """Detect hardware crypto acceleration hints (SHA-NI, AES-NI, ARMv8 crypto)"""
+        hints = []
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    key = line.split(":")[0].strip().lower()
+                    if key in ("flags", "features"):
+                        flags = set(line.split(":", 1)[1].split())
+                        break
+                else:
+                    flags = set()
+        except OSError:
+            flags = set()
+        
+        if platform.machine().lower() in ("x86_64", "amd64", "i386", "i686"):
+            for flag, label in (("sha_ni", "SHA-NI"), ("aes", "AES-NI"), ("vaes", "VAES")):
+                if flag in flags:
+                    hints.append(label)
+            if "avx512f" in flags:
+                hints.append("AVX-512")
+            elif "avx2" in flags:
+                hints.append("AVX2")
+        else:
+            # ARMv8 crypto extensions show up as individual 'Features' entries
+            arm_features = [name for name in ("aes", "pmull", "sha1", "sha2", "sha3", "sha512") if name in flags]
+            if arm_features:
+                hints.append("ARMv8 crypto (" + ", ".join(arm_features) + ")")
+        
+        # Apple Silicon always ships the ARMv8 crypto extensions
+        if not flags and self.platform == "Darwin" and platform.machine() == "arm64":
+            hints.append("ARMv8 crypto (Apple Silicon)")
+        
+        return hints
+    
+    def _get_crypto_algorithms(self) -> Dict[str, Callable[[bytes], bytes]]:
+        """Build one-shot hash/cipher functions for every usable algorithm"""
+        algorithms = {}
+        
+        for name in sorted(hashlib.algorithms_available):
+            try:
+                hashlib.new(name, b"")
+            except (ValueError, TypeError):
+                # Listed by OpenSSL but disabled (e.g. md4 under OpenSSL 3)
+                continue
+            constructor = getattr(hashlib, name, None) or (lambda data, _name=name: hashlib.new(_name, data))
+            if name.startswith("shake"):
+                algorithms[name] = lambda data, _c=constructor: _c(data).digest(32)
+            else:
+                algorithms[name] = lambda data, _c=constructor: _c(data).digest()
+        
+        # Optional AEAD ciphers (requires the 'cryptography' package)
+        try:
+            from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+            nonce = bytes(12)
+            aes = AESGCM(bytes(range(32)))
+            chacha = ChaCha20Poly1305(bytes(range(32)))
+            algorithms["aes-256-gcm"] = lambda data: aes.encrypt(nonce, data, None)
+            algorithms["chacha20-poly1305"] = lambda data: chacha.encrypt(nonce, data, None)
+        except ImportError:
+            pass
         
+        return algorithms
+    
+    def crypto_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None,
+                    buffer_sizes: Optional[List[int]] = None) -> CPUBenchmarkResult:
+        """Test hash/cipher throughput (MB/s) across buffer sizes for every available algorithm"""
+        sizes = buffer_sizes or CRYPTO_BUFFER_SIZES
+        algorithms = self._get_crypto_algorithms()
+        
+        # One random source buffer; smaller sizes are zero-copy slices of it
+        source = memoryview(os.urandom(max(sizes)))
+        
+        total_cells = len(algorithms) * len(sizes)
+        cell_budget = max(duration / total_cells, 0.005)
+        cells_done = 0
         operations = 0
-        data = b"BenchLab benchmark data for cryptographic testing"
         
-        while time.time() < end_time:
-            # Multiple hash algorithms
-            hashlib.sha256(data).digest()
-            hashlib.sha512(data).digest()
-            hashlib.md5(data).digest()
-            operations += 3
+        rows = []
+        peak_mbps = []
+        start_time = time.time()
+        
+        for name, func in algorithms.items():
+            row = {"algorithm": name}
+            best = 0.0
+            for size in sizes:
+                data = source[:size]
+                # Batch small buffers so the clock isn't read on every call
+                batch = max(1, (256 * 1024) // size)
+                calls = 0
+                cell_start = time.perf_counter()
+                while True:
+                    for _ in range(batch):
+                        func(data)
+                    calls += batch
+                    elapsed = time.perf_counter() - cell_start
+                    if elapsed >= cell_budget:
+                        break
+                
+                mbps = (calls * size / (1024 * 1024)) / elapsed
+                row[format_bytes(size)] = mbps
+                best = max(best, mbps)
+                operations += calls
+                
+                cells_done += 1
+                if progress_callback:
+                    progress_callback(cells_done / total_cells * 100)
             
-            if progress_callback and operations % 100 == 0:
-                progress = ((time.time() - start_time) / duration) * 100
-                progress_callback(min(progress, 100))
+            rows.append(row)
+            peak_mbps.append(best)
         
         actual_duration = time.time() - start_time
         ops_per_second = operations / actual_duration
-        score = ops_per_second / 10000  # Normalize score
+        throughput_mbps = geometric_mean(peak_mbps)
+        score = throughput_mbps / 100  # Normalize score
         end_temp = self._get_cpu_temperature()
         
         return CPUBenchmarkResult(
@@ -261,5 +614,350 @@ class CPUBenchmark:
             ops_per_second=ops_per_second,
             score=score,
             cores_used=1,
-            temperature=end_temp
+            temperature=end_temp,
+            throughput_mbps=throughput_mbps,
+            details={
+                "unit": "MB/s",
+                "acceleration": ", ".join(self._get_crypto_acceleration()) or "none detected",
+                "rows": rows
+            }
+        )
+    
+    def _run_fixed_work(self, kernel: Callable[[int], int], budget: float) -> float:
+        """Run a kernel with a calibrated fixed loop count; returns best ops/sec"""
+        # Calibrate: double the loop count until one call takes >= 10ms
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            kernel(loops)
+            elapsed = time.perf_counter() - start
+            if elapsed >= 0.01:
+                break
+            loops *= 2
+        
+        # Repeat the same fixed work and keep the fastest round
+        rounds = max(3, int(budget / elapsed))
+        best = elapsed
+        ops = kernel(loops)
+        for _ in range(rounds):
+            start = time.perf_counter()
+            kernel(loops)
+            best = min(best, time.perf_counter() - start)
+        return ops / best
+    
+    def interpreter_suite(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
+        """Test Python interpreter speed with dict/string/regex/call/object kernels"""
+        start_time = time.time()
+        budget = duration / len(INTERPRETER_KERNELS)
+        
+        rows = []
+        rates = []
+        for idx, (name, kernel) in enumerate(INTERPRETER_KERNELS.items()):
+            ops_per_second = self._run_fixed_work(kernel, budget)
+            rates.append(ops_per_second)
+            rows.append({
+                "kernel": name,
+                "ops/sec": ops_per_second,
+                "ns/op": 1e9 / ops_per_second
+            })
+            
+            if progress_callback:
+                progress_callback((idx + 1) / len(INTERPRETER_KERNELS) * 100)
+        
+        actual_duration = time.time() - start_time
+        geomean = geometric_mean(rates)
+        score = geomean / 1000000  # Normalize score
+        end_temp = self._get_cpu_temperature()
+        
+        return CPUBenchmarkResult(
+            test_name="Python Interpreter",
+            duration=actual_duration,
+            operations=int(geomean * actual_duration),
+            ops_per_second=geomean,
+            score=score,
+            cores_used=1,
+            temperature=end_temp,
+            details={
+                "python": f"{platform.python_implementation()} {platform.python_version()}",
+                "score": "geometric mean of kernel ops/sec",
+                "rows": rows
+            }
+        )
+    
+    def sustained_test(self, duration: float = 60.0, interval: float = 5.0,
+                       progress_callback: Optional[Callable] = None,
+                       drop_threshold: float = 0.05) -> CPUBenchmarkResult:
+        """Run an all-core load for `duration` seconds and record the score per interval
+        
+        Reports peak and sustained score, throttle onset time and percentage drop.
+        Sustained score is the mean of the final quarter of intervals; throttle onset
+        is the point after which the score never returns within `drop_threshold` of peak.
+        """
+        workers = self.cpu_count
+        counters = multiprocessing.Array('Q', workers, lock=False)
+        stop_event = multiprocessing.Event()
+        processes = [
+            multiprocessing.Process(target=_sustained_worker, args=(counters, slot, stop_event), daemon=True)
+            for slot in range(workers)
+        ]
+        
+        intervals = []
+        for process in processes:
+            process.start()
+        
+        try:
+            # Start the clock once every worker is running
+            wait_until = time.time() + 10
+            while not all(counters) and time.time() < wait_until:
+                time.sleep(0.01)
+            start_time = time.time()
+            
+            last_total = sum(counters)
+            last_time = start_time
+            next_tick = start_time + interval
+            while True:
+                time.sleep(max(0.0, next_tick - time.time()))
+                now = time.time()
+                total = sum(counters)
+                elapsed = now - start_time
+                intervals.append({
+                    "time (s)": round(elapsed, 1),
+                    "ops/sec": (total - last_total) / (now - last_time),
+                    "temp (°C)": self._get_cpu_temperature(),
+                    "freq (MHz)": read_cpu_frequency(self._freq_sources)
+                })
+                last_total, last_time = total, now
+                next_tick += interval
+                
+                if progress_callback:
+                    progress_callback(min(elapsed / duration * 100, 100))
+                if elapsed >= duration:
+                    break
+        finally:
+            stop_event.set()
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        
+        actual_duration = time.time() - start_time
+        total_operations = int(sum(row["ops/sec"] for row in intervals) * interval)
+        for row in intervals:
+            row["score"] = row["ops/sec"] / 10000  # Normalize score
+        
+        rates = [row["ops/sec"] for row in intervals]
+        peak = max(rates) if rates else 0.0
+        tail = rates[-max(1, len(rates) // 4):]
+        sustained = sum(tail) / len(tail) if tail else 0.0
+        drop_percent = (peak - sustained) / peak * 100 if peak else 0.0
+        
+        # Onset: end of the last interval still within threshold of peak,
+        # provided the score stays below it for the rest of the run
+        throttle_onset = None
+        recovered = [i for i, rate in enumerate(rates) if rate >= peak * (1 - drop_threshold)]
+        if recovered and recovered[-1] < len(rates) - 1:
+            throttle_onset = intervals[recovered[-1]]["time (s)"]
+        
+        return CPUBenchmarkResult(
+            test_name="Sustained All-Core",
+            duration=actual_duration,
+            operations=total_operations,
+            ops_per_second=sustained,
+            score=sustained / 10000,  # Normalize score
+            cores_used=workers,
+            temperature=max((row["temp (°C)"] for row in intervals if row["temp (°C)"] is not None), default=None),
+            details={
+                "peak score": f"{peak / 10000:.2f}",
+                "sustained score": f"{sustained / 10000:.2f}",
+                "drop": f"{drop_percent:.1f}%",
+                "throttle onset": f"{throttle_onset:.0f}s" if throttle_onset is not None else "none",
+                "rows": intervals
+            }
+        )
+    
+    def per_core_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None,
+                      outlier_threshold: float = 0.10) -> CPUBenchmarkResult:
+        """Pin a worker to each logical CPU in turn and score every core
+        
+        Cores more than `outlier_threshold` away from the median are flagged, and
+        scores are grouped into clusters (e.g. P/E cores) where sorted scores jump
+        by more than the same threshold.
+        """
+        if not self.has_affinity:
+            raise RuntimeError("Per-core pinning requires os.sched_setaffinity (Linux only).")
+        
+        cpus = usable_cpus()
+        repeats = 3
+        
+        # Size the fixed kernel so the whole pass takes roughly `duration`
+        start = time.perf_counter()
+        _constant_work_chunk(1.0)
+        chunk_time = time.perf_counter() - start
+        chunks = max(1, int(duration / (len(cpus) * repeats * chunk_time)))
+        
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(target=_per_core_worker, args=(child_conn, cpus, chunks, repeats), daemon=True)
+        
+        start_time = time.time()
+        worker.start()
+        child_conn.close()
+        
+        rates = {}
+        try:
+            while len(rates) < len(cpus):
+                cpu, rate = parent_conn.recv()
+                rates[cpu] = rate
+                if progress_callback:
+                    progress_callback(len(rates) / len(cpus) * 100)
+        except EOFError:
+            pass
+        finally:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        
+        if not rates:
+            raise RuntimeError("Per-core worker exited without reporting results.")
+        
+        actual_duration = time.time() - start_time
+        ordered = sorted(rates.values())
+        median = statistics.median(ordered)
+        
+        # Clusters: split sorted scores wherever consecutive values jump by > threshold
+        clusters = 1
+        for low, high in zip(ordered, ordered[1:]):
+            if high > low * (1 + outlier_threshold):
+                clusters += 1
+        
+        core_types = hybrid_core_types()
+        isolated = set(isolated_cpus())
+        rows = []
+        outliers = 0
+        for cpu in sorted(rates):
+            relative = rates[cpu] / median * 100
+            if relative < (1 - outlier_threshold) * 100:
+                flag = "SLOW"
+            elif relative > (1 + outlier_threshold) * 100:
+                flag = "FAST"
+            else:
+                flag = ""
+            if flag:
+                outliers += 1
+            if cpu in isolated:
+                flag = (flag + " isolated").strip()
+            rows.append({
+                "cpu": cpu,
+                "type": core_types.get(cpu, "-"),
+                "ops/sec": rates[cpu],
+                "vs median": f"{relative:.0f}%",
+                "flag": flag
+            })
+        
+        return CPUBenchmarkResult(
+            test_name="Per-Core Pinned",
+            duration=actual_duration,
+            operations=len(rates) * repeats * chunks * CONSTANT_CHUNK_OPS,
+            ops_per_second=median,
+            score=median / 10000,  # Normalize score
+            cores_used=len(rates),
+            temperature=self._get_cpu_temperature(),
+            details={
+                "outliers": outliers,
+                "clusters": clusters,
+                "spread": f"{(ordered[-1] - ordered[0]) / median * 100:.1f}%",
+                "isolated": ",".join(str(cpu) for cpu in sorted(isolated)) or "none",
+                "rows": rows
+            }
+        )
+    
+    def _run_pinned(self, cpus: List[int], kernel_name: str, duration: float) -> List[float]:
+        """Run one pinned kernel worker per CPU simultaneously; returns per-thread ops/sec"""
+        barrier = multiprocessing.Barrier(len(cpus))
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_pinned_kernel_worker, args=(cpu, kernel_name, duration, barrier, results), daemon=True)
+            for cpu in cpus
+        ]
+        for worker in workers:
+            worker.start()
+        rates = [results.get(timeout=duration + 30)[1] for _ in workers]
+        for worker in workers:
+            worker.join()
+        return rates
+    
+    def has_smt(self) -> bool:
+        """Check if any usable physical core has two or more SMT siblings"""
+        return self.has_affinity and any(len(group) >= 2 for group in smt_sibling_groups())
+    
+    def smt_interference_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> CPUBenchmarkResult:
+        """Compare paired kernels on two separate physical cores vs two SMT siblings of one core
+        
+        SMT yield is the combined throughput of two sibling threads relative to one
+        thread alone on that core (100% = no gain from SMT, 200% = perfect scaling).
+        """
+        if not self.has_affinity:
+            raise RuntimeError("SMT pairing requires os.sched_setaffinity (Linux only).")
+        
+        groups = smt_sibling_groups()
+        smt_core = next((group for group in groups if len(group) >= 2), None)
+        if smt_core is None:
+            raise RuntimeError("No SMT siblings detected (SMT disabled or not supported).")
+        
+        sibling_pair = smt_core[:2]
+        other_cores = [group for group in groups if group is not smt_core]
+        separate_pair = [smt_core[0], other_cores[0][0]] if other_cores else None
+        
+        # Each kernel runs alone, on separate cores (if possible) and on siblings
+        runs_per_kernel = 3 if separate_pair else 2
+        phase_duration = duration / (len(SMT_KERNELS) * runs_per_kernel)
+        total_phases = len(SMT_KERNELS) * runs_per_kernel
+        phases_done = 0
+        
+        rows = []
+        yields = []
+        operations = 0
+        start_time = time.time()
+        
+        for kernel_name in SMT_KERNELS:
+            phases = [("single", [sibling_pair[0]])]
+            if separate_pair:
+                phases.append(("separate", separate_pair))
+            phases.append(("siblings", sibling_pair))
+            
+            per_thread = {}
+            for label, cpus in phases:
+                rates = self._run_pinned(cpus, kernel_name, phase_duration)
+                per_thread[label] = sum(rates) / len(rates)
+                operations += int(sum(rates) * phase_duration)
+                phases_done += 1
+                if progress_callback:
+                    progress_callback(phases_done / total_phases * 100)
+            
+            smt_yield = (per_thread["siblings"] * 2) / per_thread["single"] * 100
+            yields.append(smt_yield)
+            rows.append({
+                "workload": kernel_name,
+                "1 thread ops/s": per_thread["single"],
+                "separate cores ops/s/thread": per_thread.get("separate"),
+                "SMT siblings ops/s/thread": per_thread["siblings"],
+                "SMT yield": f"{smt_yield:.0f}%"
+            })
+        
+        actual_duration = time.time() - start_time
+        mean_yield = sum(yields) / len(yields)
+        
+        return CPUBenchmarkResult(
+            test_name="SMT Interference",
+            duration=actual_duration,
+            operations=operations,
+            ops_per_second=operations / actual_duration,
+            score=mean_yield / 100,  # 1.0 = no SMT gain, 2.0 = perfect scaling
+            cores_used=2,
+            temperature=self._get_cpu_temperature(),
+            details={
+                "sibling CPUs": ",".join(str(cpu) for cpu in sibling_pair),
+                "separate-core CPUs": ",".join(str(cpu) for cpu in separate_pair) if separate_pair else "n/a (one physical core)",
+                "mean SMT yield": f"{mean_yield:.0f}%",
+                "rows": rows
+            }
         )
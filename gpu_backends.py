@@ -0,0 +1,374 @@
+"""
+Compute Backends for the GPU/AI Benchmarks
+Device selection, synchronize, timing and memory stats for CUDA, MPS, torch on the
+CPU and NumPy on the CPU, plus the six GPU/AI workloads built for each
+"""
+
+import time
+import platform
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench_utils import format_bytes
+from resources import read_process_memory, reset_peak_rss
+
+try:
+    import torch
+    import torch.nn as nn
+    has_torch = True
+except ImportError:
+    torch = None
+    nn = None
+    has_torch = False
+
+try:
+    import numpy as np
+    has_numpy = True
+except ImportError:
+    np = None
+    has_numpy = False
+
+
+# Backends in order of preference for automatic selection
+BACKEND_ORDER = ["cuda", "mps", "torch-cpu", "numpy"]
+
+# Shapes shared by both libraries, so every backend runs the same work per iteration
+CONV_SHAPE = (16, 64, 224, 224)  # batch, channels, height, width
+CONV_OUT_CHANNELS = 128
+ATTENTION_SHAPE = (128, 32, 512)  # sequence length, batch, embed dim
+ATTENTION_HEADS = 8
+INFERENCE_SHAPE = (1, 3, 224, 224)
+
+
+def cpu_model() -> str:
+    """CPU model string (/proc/cpuinfo, sysctl on macOS), falling back to the architecture"""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key.strip() in ("model name", "Model") and value.strip():
+                    return value.strip()
+    except OSError:
+        pass
+    if platform.system() == "Darwin":
+        try:
+            brand = subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"], capture_output=True,
+                                   text=True, timeout=5).stdout.strip()
+            if brand:
+                return brand
+        except (OSError, subprocess.SubprocessError):
+            pass
+    return platform.processor() or platform.machine() or "unknown CPU"
+
+
+class ComputeBackend(ABC):
+    """A device the GPU/AI tests run on
+    
+    Subclasses provide synchronize() and memory stats for their device, and must
+    implement a builder per workload that returns a zero-argument step running
+    one iteration (a backend missing one cannot be instantiated).
+    """
+    name = ""
+    library = ""
+    is_gpu = False
+    warmup_iterations = 5
+    
+    def __init__(self):
+        self.device_name = cpu_model()
+        self._rss_before: Optional[int] = None
+    
+    def synchronize(self) -> None:
+        """Wait for queued device work to finish (a no-op for synchronous CPU backends)"""
+    
+    def time_steps(self, step: Callable[[], Any], iterations: int, time_budget: float,
+                   progress_callback: Optional[Callable] = None) -> Tuple[int, float]:
+        """Run step up to iterations times, stopping early once time_budget seconds have passed
+        
+        Returns (iterations completed, seconds); the device is synchronized on both sides.
+        """
+        self.synchronize()
+        start = time.perf_counter()
+        completed = 0
+        while completed < iterations:
+            step()
+            completed += 1
+            if progress_callback:
+                progress_callback(completed / iterations * 100)
+            if time.perf_counter() - start > time_budget:
+                break
+        self.synchronize()
+        return completed, time.perf_counter() - start
+    
+    def reset_memory_stats(self) -> None:
+        """Start a new peak-memory window (peak RSS growth for CPU backends)"""
+        self._rss_before = read_process_memory()[0] if reset_peak_rss() else None
+    
+    def memory_stats(self) -> Dict[str, str]:
+        """Memory used since reset_memory_stats(), for the result details"""
+        peak = read_process_memory()[1]
+        if self._rss_before is None or peak is None:
+            return {}
+        return {"peak RSS +": format_bytes(max(0, peak - self._rss_before))}
+    
+    @abstractmethod
+    def matmul(self, size: int) -> Callable[[], Any]:
+        """size x size float32 matrix multiply"""
+    
+    @abstractmethod
+    def conv2d(self, batch: int = CONV_SHAPE[0]) -> Callable[[], Any]:
+        """3x3 convolution, CONV_SHAPE in (with `batch` images), CONV_OUT_CHANNELS out"""
+    
+    @abstractmethod
+    def elementwise(self, size: int) -> Callable[[], Any]:
+        """a * b + sin(a) * cos(b) over size-element vectors"""
+    
+    @abstractmethod
+    def attention(self) -> Callable[[], Any]:
+        """Multi-head self-attention over ATTENTION_SHAPE inputs"""
+    
+    @abstractmethod
+    def bandwidth(self, size_mb: int) -> Callable[[], Any]:
+        """data * 2 + 1 over a size_mb float32 buffer (one read, one write)"""
+    
+    @abstractmethod
+    def inference(self) -> Callable[[], Any]:
+        """One forward pass of a small CNN on one INFERENCE_SHAPE image"""
+
+
+# === torch (CUDA, MPS, CPU) ===
+
+if has_torch:
+    class _SimpleNet(nn.Module):
+        """Small convolutional network for the inference test (similar to MobileNet's early layers)"""
+        
+        def __init__(self):
+            super().__init__()
+            self.conv1 = nn.Conv2d(3, 32, 3, padding=1)
+            self.conv2 = nn.Conv2d(32, 64, 3, padding=1)
+            self.conv3 = nn.Conv2d(64, 128, 3, padding=1)
+            self.pool = nn.MaxPool2d(2, 2)
+            self.fc = nn.Linear(128 * 28 * 28, 10)
+            self.relu = nn.ReLU()
+        
+        def forward(self, x):
+            x = self.pool(self.relu(self.conv1(x)))
+            x = self.pool(self.relu(self.conv2(x)))
+            x = self.pool(self.relu(self.conv3(x)))
+            x = x.view(-1, 128 * 28 * 28)
+            return self.fc(x)
+
+
+class TorchBackend(ComputeBackend):
+    """PyTorch on a CUDA GPU, Apple MPS or the CPU"""
+    library = "torch"
+    
+    def __init__(self, device_type: str):
+        super().__init__()
+        self.device = torch.device(device_type)
+        self.name = "torch-cpu" if device_type == "cpu" else device_type
+        self.is_gpu = device_type != "cpu"
+        if device_type == "cuda":
+            self.device_name = f"{torch.cuda.get_device_name(0)} (CUDA)"
+        elif device_type == "mps":
+            self.device_name = f"{self.device_name} GPU (MPS)"
+        else:
+            self.warmup_iterations = 1
+            self.device_name = f"{self.device_name} (CPU, torch, {torch.get_num_threads()} threads)"
+    
+    def synchronize(self) -> None:
+        if self.device.type == "cuda":
+            torch.cuda.synchronize()
+        elif self.device.type == "mps":
+            torch.mps.synchronize()
+    
+    def time_steps(self, step: Callable[[], Any], iterations: int, time_budget: float,
+                   progress_callback: Optional[Callable] = None) -> Tuple[int, float]:
+        """As ComputeBackend.time_steps; on CUDA the seconds come from device events"""
+        if self.device.type != "cuda":
+            return super().time_steps(step, iterations, time_budget, progress_callback)
+        begin = torch.cuda.Event(enable_timing=True)
+        end = torch.cuda.Event(enable_timing=True)
+        self.synchronize()
+        begin.record()
+        completed, _ = super().time_steps(step, iterations, time_budget, progress_callback)
+        end.record()
+        end.synchronize()
+        return completed, begin.elapsed_time(end) / 1000
+    
+    def reset_memory_stats(self) -> None:
+        if self.device.type == "cuda":
+            torch.cuda.reset_peak_memory_stats()
+        elif self.device.type == "cpu":
+            super().reset_memory_stats()
+    
+    def memory_stats(self) -> Dict[str, str]:
+        if self.device.type == "cuda":
+            return {"peak allocated": format_bytes(torch.cuda.max_memory_allocated())}
+        if self.device.type == "mps":
+            return {"allocated": format_bytes(torch.mps.current_allocated_memory()),
+                    "driver allocated": format_bytes(torch.mps.driver_allocated_memory())}
+        return super().memory_stats()
+    
+    def _randn(self, *shape: int):
+        return torch.randn(*shape, device=self.device)
+    
+    def matmul(self, size: int) -> Callable[[], Any]:
+        a = self._randn(size, size)
+        b = self._randn(size, size)
+        return lambda: torch.matmul(a, b)
+    
+    def conv2d(self, batch: int = CONV_SHAPE[0]) -> Callable[[], Any]:
+        conv = nn.Conv2d(CONV_SHAPE[1], CONV_OUT_CHANNELS, kernel_size=3, padding=1).to(self.device)
+        x = self._randn(batch, *CONV_SHAPE[1:])
+        return lambda: conv(x)
+    
+    def elementwise(self, size: int) -> Callable[[], Any]:
+        a = self._randn(size)
+        b = self._randn(size)
+        return lambda: a * b + torch.sin(a) * torch.cos(b)
+    
+    def attention(self) -> Callable[[], Any]:
+        seq_len, batch_size, embed_dim = ATTENTION_SHAPE
+        layer = nn.MultiheadAttention(embed_dim, ATTENTION_HEADS).to(self.device)
+        query, key, value = (self._randn(seq_len, batch_size, embed_dim) for _ in range(3))
+        return lambda: layer(query, key, value)
+    
+    def bandwidth(self, size_mb: int) -> Callable[[], Any]:
+        data = self._randn(size_mb * 1024 * 1024 // 4)  # 4 bytes per float32
+        return lambda: data * 2.0 + 1.0
+    
+    def inference(self) -> Callable[[], Any]:
+        model = _SimpleNet().to(self.device)
+        model.eval()
+        x = self._randn(*INFERENCE_SHAPE)
+        
+        def step():
+            with torch.no_grad():
+                return model(x)
+        return step
+
+
+# === NumPy (CPU) ===
+
+def _np_conv2d(x, weight, bias):
+    """3x3 'same' convolution, NCHW in and out: one BLAS tensordot per kernel tap"""
+    batch, _, height, width = x.shape
+    padded = np.pad(x, ((0, 0), (0, 0), (1, 1), (1, 1)))
+    out = np.zeros((batch, height, width, weight.shape[0]), dtype=x.dtype)
+    for i in range(3):
+        for j in range(3):
+            out += np.tensordot(padded[:, :, i:i + height, j:j + width], weight[:, :, i, j], axes=([1], [1]))
+    out += bias
+    return out.transpose(0, 3, 1, 2)
+
+
+def _np_max_pool(x):
+    """2x2 max pooling with stride 2 (NCHW)"""
+    batch, channels, height, width = x.shape
+    return x.reshape(batch, channels, height // 2, 2, width // 2, 2).max(axis=(3, 5))
+
+
+class NumpyBackend(ComputeBackend):
+    """NumPy on the CPU (the same workloads written with NumPy/BLAS operations)"""
+    name = "numpy"
+    library = "numpy"
+    warmup_iterations = 1
+    
+    def __init__(self):
+        super().__init__()
+        self.device_name = f"{self.device_name} (CPU, NumPy {np.__version__})"
+        self.rng = np.random.default_rng()
+    
+    def _randn(self, *shape: int):
+        return self.rng.standard_normal(shape, dtype=np.float32)
+    
+    def _layer(self, out_features: int, in_features: int, *kernel: int):
+        """Random weight and bias scaled like torch's default init"""
+        fan_in = in_features * int(np.prod(kernel)) if kernel else in_features
+        scale = np.float32(1 / np.sqrt(fan_in))
+        return self._randn(out_features, in_features, *kernel) * scale, self._randn(out_features) * scale
+    
+    def matmul(self, size: int) -> Callable[[], Any]:
+        a = self._randn(size, size)
+        b = self._randn(size, size)
+        return lambda: np.matmul(a, b)
+    
+    def conv2d(self, batch: int = CONV_SHAPE[0]) -> Callable[[], Any]:
+        weight, bias = self._layer(CONV_OUT_CHANNELS, CONV_SHAPE[1], 3, 3)
+        x = self._randn(batch, *CONV_SHAPE[1:])
+        return lambda: _np_conv2d(x, weight, bias)
+    
+    def elementwise(self, size: int) -> Callable[[], Any]:
+        a = self._randn(size)
+        b = self._randn(size)
+        return lambda: a * b + np.sin(a) * np.cos(b)
+    
+    def attention(self) -> Callable[[], Any]:
+        seq_len, batch_size, embed_dim = ATTENTION_SHAPE
+        head_dim = embed_dim // ATTENTION_HEADS
+        in_weight, in_bias = self._layer(3 * embed_dim, embed_dim)
+        out_weight, out_bias = self._layer(embed_dim, embed_dim)
+        query, key, value = (self._randn(seq_len, batch_size, embed_dim) for _ in range(3))
+        scale = np.float32(1 / np.sqrt(head_dim))
+        
+        def heads(x):
+            # (L, N, E) -> (N * heads, L, head_dim), as torch's MultiheadAttention lays them out
+            return x.reshape(seq_len, batch_size * ATTENTION_HEADS, head_dim).transpose(1, 0, 2)
+        
+        def step():
+            q_weight, k_weight, v_weight = np.split(in_weight, 3)
+            q_bias, k_bias, v_bias = np.split(in_bias, 3)
+            q = heads(query @ q_weight.T + q_bias) * scale
+            k = heads(key @ k_weight.T + k_bias)
+            v = heads(value @ v_weight.T + v_bias)
+            scores = q @ k.transpose(0, 2, 1)
+            weights = np.exp(scores - scores.max(axis=-1, keepdims=True))
+            weights /= weights.sum(axis=-1, keepdims=True)
+            context = (weights @ v).transpose(1, 0, 2).reshape(seq_len, batch_size, embed_dim)
+            return context @ out_weight.T + out_bias
+        return step
+    
+    def bandwidth(self, size_mb: int) -> Callable[[], Any]:
+        data = self._randn(size_mb * 1024 * 1024 // 4)  # 4 bytes per float32
+        return lambda: data * np.float32(2.0) + np.float32(1.0)
+    
+    def inference(self) -> Callable[[], Any]:
+        layers = [self._layer(32, 3, 3, 3), self._layer(64, 32, 3, 3), self._layer(128, 64, 3, 3)]
+        fc_weight, fc_bias = self._layer(10, 128 * 28 * 28)
+        x = self._randn(*INFERENCE_SHAPE)
+        
+        def step():
+            y = x
+            for weight, bias in layers:
+                y = _np_max_pool(np.maximum(_np_conv2d(y, weight, bias), 0))
+            return y.reshape(-1, 128 * 28 * 28) @ fc_weight.T + fc_bias
+        return step
+
+
+def available_backends() -> List[str]:
+    """Names of the backends usable on this machine, in BACKEND_ORDER"""
+    available = []
+    if has_torch:
+        if torch.cuda.is_available():
+            available.append("cuda")
+        if getattr(torch.backends, "mps", None) is not None and torch.backends.mps.is_available():
+            available.append("mps")
+        available.append("torch-cpu")
+    if has_numpy:
+        available.append("numpy")
+    return available
+
+
+def create_backend(name: Optional[str] = None) -> Optional[ComputeBackend]:
+    """The named backend, or the first available one in BACKEND_ORDER (None if nothing is usable)"""
+    available = available_backends()
+    if name is None:
+        if not available:
+            return None
+        name = available[0]
+    elif name not in available:
+        return None
+    if name == "numpy":
+        return NumpyBackend()
+    return TorchBackend("cpu" if name == "torch-cpu" else name)
@@ -1,13 +1,27 @@
 """
 GPU/AI Performance Benchmarking Module
-Provides GPU compute and AI inference testing for Apple Silicon
+Provides GPU compute and AI inference testing on CUDA, Apple Silicon (MPS) or the CPU
 """
 
-import time
+import math
 import platform
 from dataclasses import dataclass
-from typing import Callable, Optional
-import sys
+from typing import Any, Callable, Dict, Optional
+
+from gpu_backends import BACKEND_ORDER, CONV_SHAPE, ComputeBackend, available_backends, create_backend
+from resources import MemoryPlan, detect_resources, plan_memory
+from telemetry import TelemetrySummary
+
+
+# Tests stop early once this many seconds of timed iterations have run (CPU backends
+# may take seconds per iteration of the GPU-sized workloads)
+GPU_TIME_BUDGET = 30.0
+
+# Peak host memory of a CPU backend's step, in multiples of its input buffer: the
+# bandwidth test holds data, data * 2 and the result; the NumPy convolution holds
+# the input, its padded copy, the output and BLAS temporaries
+BANDWIDTH_HOST_COPIES = 3
+CONV_HOST_COPIES = 8
 
 
 @dataclass
@@ -19,314 +33,142 @@ class GPUBenchmarkResult:
     ops_per_second: float
     score: float
     gpu_type: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
 
 
 class GPUBenchmark:
     """GPU performance benchmarking tool"""
     
-    def __init__(self):
-        """Initialize GPU benchmark"""
-        self.platform = platform.system()
-        self.has_metal = False
-        self.has_torch = False
-        self.metal_device = None
+    def __init__(self, backend: Optional[str] = None):
+        """
+        Initialize GPU benchmark
         
-        # Check for Metal support (Apple Silicon)
-        if self.platform == "Darwin":
-            try:
-                import torch
-                self.has_torch = True
-                if torch.backends.mps.is_available():
-                    self.has_metal = True
-                    self.metal_device = torch.device("mps")
-            except ImportError:
-                pass
+        Args:
+            backend: One of BACKEND_ORDER, or None for the first one available
+        """
+        self.platform = platform.system()
+        self.available = available_backends()
+        self.backend: Optional[ComputeBackend] = create_backend(backend)
+        self.has_torch = self.backend is not None and self.backend.library == "torch"
+        self.has_metal = self.backend is not None and self.backend.name == "mps"
+        self.metal_device = self.backend.device if self.has_metal else None
+        if self.backend is not None:
+            self.unavailable_reason = None
+        elif backend is not None and backend not in BACKEND_ORDER:
+            self.unavailable_reason = f"unknown backend '{backend}' (choose from {', '.join(BACKEND_ORDER)})"
+        elif backend is not None:
+            self.unavailable_reason = (f"backend '{backend}' not available "
+                                       f"(available: {', '.join(self.available) or 'none'})")
+        else:
+            self.unavailable_reason = "no backend available (install PyTorch or NumPy)"
     
     def is_available(self) -> bool:
         """Check if GPU benchmarking is available"""
-        return self.has_metal and self.has_torch
+        return self.backend is not None
+    
+    def describe(self) -> str:
+        """Device the tests run on, or why they cannot run"""
+        if self.backend is None:
+            return f"Not Available: {self.unavailable_reason}"
+        return f"{self.backend.device_name} [{self.backend.name}]"
+    
+    def _run(self, build: Callable[[], Callable[[], Any]], iterations: int,
+             progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
+        """Build one workload on the backend, warm it up and time up to `iterations` steps
+        
+        Returns the completed iteration count, seconds and details (backend, memory stats).
+        """
+        if not self.is_available():
+            raise RuntimeError(f"GPU/AI tests unavailable: {self.unavailable_reason}")
+        
+        backend = self.backend
+        backend.reset_memory_stats()
+        step = build()
+        for _ in range(backend.warmup_iterations):
+            step()
+        completed, duration = backend.time_steps(step, iterations, GPU_TIME_BUDGET, progress_callback)
+        
+        details: Dict[str, Any] = {"backend": backend.name, "warmup": backend.warmup_iterations}
+        if completed < iterations:
+            details["stopped"] = f"after {completed} of {iterations} iterations ({GPU_TIME_BUDGET:.0f}s budget)"
+        details.update(backend.memory_stats())
+        return {"completed": completed, "duration": duration, "details": details}
+    
+    def _host_plan(self, size_mb: int, copies: float) -> MemoryPlan:
+        """Fit a workload's buffers into the memory budget on CPU backends (GPUs run it as requested)"""
+        if self.backend is None or self.backend.is_gpu:
+            return MemoryPlan(size_mb, size_mb)
+        return plan_memory(size_mb, detect_resources().usable_memory(), copies)
+    
+    def _result(self, test_name: str, run: Dict[str, Any], score: float,
+                extra: Optional[Dict[str, Any]] = None) -> GPUBenchmarkResult:
+        """Result for one timed run, reporting the backend's real device"""
+        return GPUBenchmarkResult(
+            test_name=test_name,
+            duration=run["duration"],
+            operations=run["completed"],
+            ops_per_second=run["completed"] / run["duration"],
+            score=score,
+            gpu_type=self.backend.device_name,
+            details={**(extra or {}), **run["details"]}
+        )
     
     def matrix_multiply(self, size: int = 2048, iterations: int = 100, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Test GPU matrix multiplication performance"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        
-        # Create matrices on GPU
-        a = torch.randn(size, size, device=self.metal_device)
-        b = torch.randn(size, size, device=self.metal_device)
+        run = self._run(lambda: self.backend.matmul(size), iterations, progress_callback)
         
-        # Warmup
-        for _ in range(5):
-            c = torch.matmul(a, b)
-        
-        # Benchmark
-        start_time = time.time()
-        
-        for i in range(iterations):
-            c = torch.matmul(a, b)
-            
-            if progress_callback:
-                progress = ((i + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        # Ensure completion
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
         # FLOPs for matrix multiply: 2 * size^3 per operation
-        flops = 2 * (size ** 3) * iterations
-        gflops = (flops / duration) / 1e9
+        flops = 2 * (size ** 3) * run["completed"]
+        gflops = (flops / run["duration"]) / 1e9
         score = gflops / 100  # Normalize
-        
-        return GPUBenchmarkResult(
-            test_name="Matrix Multiply",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=iterations / duration,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        return self._result("Matrix Multiply", run, score, {"size": f"{size}x{size}", "GFLOPS": f"{gflops:.1f}"})
     
     def convolution_2d(self, iterations: int = 100, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Test GPU 2D convolution performance (common in AI)"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        import torch.nn as nn
-        
-        # Create a typical convolution layer
-        conv = nn.Conv2d(64, 128, kernel_size=3, padding=1).to(self.metal_device)
-        
-        # Create input tensor (batch_size=16, channels=64, height=224, width=224)
-        x = torch.randn(16, 64, 224, 224, device=self.metal_device)
-        
-        # Warmup
-        for _ in range(5):
-            y = conv(x)
-        
-        # Benchmark
-        start_time = time.time()
-        
-        for i in range(iterations):
-            y = conv(x)
-            
-            if progress_callback:
-                progress = ((i + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
-        ops_per_second = iterations / duration
-        score = ops_per_second
-        
-        return GPUBenchmarkResult(
-            test_name="2D Convolution",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=ops_per_second,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        # On CPU backends the batch shrinks until the step fits in the memory budget
+        input_mb = math.ceil(math.prod(CONV_SHAPE) * 4 / (1024 * 1024))  # 4 bytes per float32
+        plan = self._host_plan(input_mb, CONV_HOST_COPIES)
+        batch = max(1, CONV_SHAPE[0] * plan.size_mb // plan.requested_mb)
+        run = self._run(lambda: self.backend.conv2d(batch), iterations, progress_callback)
+        
+        # Normalize to full batches, so a capped batch scores by images per second
+        score = run["completed"] / run["duration"] * batch / CONV_SHAPE[0]
+        extra = {"batch": batch}
+        if batch < CONV_SHAPE[0]:
+            extra["batch"] = f"{batch} (capped from {CONV_SHAPE[0]})"
+            extra["downscaled"] = f"{CONV_HOST_COPIES} x {plan.note}"
+        return self._result("2D Convolution", run, score, extra)
     
     def element_wise_ops(self, size: int = 10000000, iterations: int = 100, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Test GPU element-wise operations"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        
-        # Create tensors
-        a = torch.randn(size, device=self.metal_device)
-        b = torch.randn(size, device=self.metal_device)
-        
-        # Warmup
-        for _ in range(5):
-            c = a * b + torch.sin(a) * torch.cos(b)
-        
-        # Benchmark
-        start_time = time.time()
-        
-        for i in range(iterations):
-            c = a * b + torch.sin(a) * torch.cos(b)
-            
-            if progress_callback:
-                progress = ((i + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
-        ops_per_second = iterations / duration
-        score = ops_per_second * 10  # Normalize
-        
-        return GPUBenchmarkResult(
-            test_name="Element-wise Ops",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=ops_per_second,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        run = self._run(lambda: self.backend.elementwise(size), iterations, progress_callback)
+        score = run["completed"] / run["duration"] * 10  # Normalize
+        return self._result("Element-wise Ops", run, score)
     
     def transformer_attention(self, iterations: int = 50, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Test transformer attention mechanism (key AI workload)"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        import torch.nn as nn
-        
-        # Create multi-head attention layer
-        embed_dim = 512
-        num_heads = 8
-        attention = nn.MultiheadAttention(embed_dim, num_heads).to(self.metal_device)
-        
-        # Create input (sequence_length=128, batch_size=32, embed_dim=512)
-        seq_len, batch_size = 128, 32
-        query = torch.randn(seq_len, batch_size, embed_dim, device=self.metal_device)
-        key = torch.randn(seq_len, batch_size, embed_dim, device=self.metal_device)
-        value = torch.randn(seq_len, batch_size, embed_dim, device=self.metal_device)
-        
-        # Warmup
-        for _ in range(5):
-            output, _ = attention(query, key, value)
-        
-        # Benchmark
-        start_time = time.time()
-        
-        for i in range(iterations):
-            output, _ = attention(query, key, value)
-            
-            if progress_callback:
-                progress = ((i + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
-        ops_per_second = iterations / duration
-        score = ops_per_second * 20  # Normalize
-        
-        return GPUBenchmarkResult(
-            test_name="Transformer Attention",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=ops_per_second,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        run = self._run(lambda: self.backend.attention(), iterations, progress_callback)
+        score = run["completed"] / run["duration"] * 20  # Normalize
+        return self._result("Transformer Attention", run, score)
     
     def memory_bandwidth(self, size_mb: int = 500, iterations: int = 20, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Test GPU memory bandwidth"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        
-        size = size_mb * 1024 * 1024 // 4  # 4 bytes per float32
-        
-        # Create large tensor
-        data = torch.randn(size, device=self.metal_device)
+        plan = self._host_plan(size_mb, BANDWIDTH_HOST_COPIES)
+        run = self._run(lambda: self.backend.bandwidth(plan.size_mb), iterations, progress_callback)
         
-        # Warmup
-        for _ in range(3):
-            result = data * 2.0
-        
-        # Benchmark
-        start_time = time.time()
-        
-        for i in range(iterations):
-            # Read and write to memory
-            result = data * 2.0 + 1.0
-            
-            if progress_callback:
-                progress = ((i + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
         # Each iteration reads and writes the data
-        bytes_transferred = size_mb * 1024 * 1024 * iterations * 2
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / duration
+        bytes_transferred = plan.size_mb * 1024 * 1024 * run["completed"] * 2
+        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / run["duration"]
         score = bandwidth_gbps
-        
-        return GPUBenchmarkResult(
-            test_name="GPU Memory Bandwidth",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=iterations / duration,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        extra = {"buffer": plan.label, "GB/s": f"{bandwidth_gbps:.2f}"}
+        if plan.note:
+            extra["downscaled"] = f"{BANDWIDTH_HOST_COPIES} x {plan.note}"
+        return self._result("GPU Memory Bandwidth", run, score, extra)
     
     def ai_inference_simulation(self, iterations: int = 50, progress_callback: Optional[Callable] = None) -> GPUBenchmarkResult:
         """Simulate AI inference workload"""
-        if not self.is_available():
-            raise RuntimeError("GPU/Metal not available. Install PyTorch with Metal support.")
-        
-        import torch
-        import torch.nn as nn
-        
-        # Create a small neural network (similar to MobileNet)
-        class SimpleNet(nn.Module):
-            def __init__(self):
-                super(SimpleNet, self).__init__()
-                self.conv1 = nn.Conv2d(3, 32, 3, padding=1)
-                self.conv2 = nn.Conv2d(32, 64, 3, padding=1)
-                self.conv3 = nn.Conv2d(64, 128, 3, padding=1)
-                self.pool = nn.MaxPool2d(2, 2)
-                self.fc = nn.Linear(128 * 28 * 28, 10)
-                self.relu = nn.ReLU()
-            
-            def forward(self, x):
-                x = self.relu(self.conv1(x))
-                x = self.pool(x)
-                x = self.relu(self.conv2(x))
-                x = self.pool(x)
-                x = self.relu(self.conv3(x))
-                x = self.pool(x)
-                x = x.view(-1, 128 * 28 * 28)
-                x = self.fc(x)
-                return x
-        
-        model = SimpleNet().to(self.metal_device)
-        model.eval()
-        
-        # Create input (batch_size=1, channels=3, height=224, width=224)
-        x = torch.randn(1, 3, 224, 224, device=self.metal_device)
-        
-        # Warmup
-        with torch.no_grad():
-            for _ in range(5):
-                output = model(x)
-        
-        # Benchmark
-        start_time = time.time()
-        
-        with torch.no_grad():
-            for i in range(iterations):
-                output = model(x)
-                
-                if progress_callback:
-                    progress = ((i + 1) / iterations) * 100
-                    progress_callback(progress)
-        
-        torch.mps.synchronize()
-        
-        duration = time.time() - start_time
-        inferences_per_second = iterations / duration
+        run = self._run(lambda: self.backend.inference(), iterations, progress_callback)
+        inferences_per_second = run["completed"] / run["duration"]
         score = inferences_per_second * 50  # Normalize
-        
-        return GPUBenchmarkResult(
-            test_name="AI Inference",
-            duration=duration,
-            operations=iterations,
-            ops_per_second=inferences_per_second,
-            score=score,
-            gpu_type="Apple Silicon Metal"
-        )
+        return self._result("AI Inference", run, score)
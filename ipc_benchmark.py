@@ -0,0 +1,537 @@
+"""
+IPC Benchmarking Module
+Ping-pong round-trip latency and bulk throughput over pipes, Unix sockets,
+multiprocessing Pipe/Queue and a shared-memory ring buffer
+"""
+
+import os
+import time
+import queue
+import select
+import socket
+import struct
+import platform
+import multiprocessing
+from multiprocessing import shared_memory
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_utils import format_bytes, latency_summary
+from telemetry import TelemetrySummary
+
+
+# Message sizes for the latency/throughput sweep: 64 B - 1 MB
+IPC_MESSAGE_SIZES = [64, 1024, 16 * 1024, 256 * 1024, 1024 * 1024]
+
+# Bytes sent per throughput batch (one ack per batch)
+THROUGHPUT_BATCH_BYTES = 4 * 1024 * 1024
+
+# Round trips per latency batch
+LATENCY_BATCH = 50
+
+# Data capacity of each shared-memory ring
+RING_CAPACITY = 1024 * 1024
+
+# The ring publishes its counters with plain stores after the data copy, which is
+# only safe where the CPU keeps stores in program order (x86 total store order);
+# Python has no portable memory barrier to order them on ARM and other weakly
+# ordered CPUs
+RING_MACHINES = ("x86_64", "amd64", "i386", "i686")
+
+# A parent waiting on the echo child checks every IPC_POLL_INTERVAL seconds that
+# the child is still alive, and gives up after IPC_RECV_TIMEOUT seconds without data
+IPC_POLL_INTERVAL = 0.5
+IPC_RECV_TIMEOUT = 30.0
+
+# Control header sent before every batch: (mode, message size, message count)
+_HEADER = struct.Struct("<QQQ")
+_STOP, _ECHO, _SINK = 0, 1, 2
+_ACK = b"\x01"
+
+_yield = getattr(os, "sched_yield", lambda: time.sleep(0))
+
+
+def _check_peer(peer, since: float) -> None:
+    """Raise if the peer process has exited, or a wait that began at `since` ran past IPC_RECV_TIMEOUT"""
+    if not peer.is_alive():
+        raise EOFError(f"IPC child exited unexpectedly (exit code {peer.exitcode})")
+    if time.monotonic() - since > IPC_RECV_TIMEOUT:
+        raise TimeoutError(f"IPC child sent nothing for {IPC_RECV_TIMEOUT:.0f}s")
+
+
+def _wait_readable(fileobj, peer) -> None:
+    """Block until fileobj is readable; with a peer process, a bounded wait that checks it is alive"""
+    if peer is None:
+        select.select([fileobj], [], [])
+        return
+    since = time.monotonic()
+    while not select.select([fileobj], [], [], IPC_POLL_INTERVAL)[0]:
+        _check_peer(peer, since)
+
+
+class _FileChannel:
+    """Byte stream over a pair of unbuffered file objects (os.pipe)"""
+    
+    # Each end holds its own descriptors: the parent closes the child's copies
+    owns_ends = True
+    
+    def __init__(self, read_fd: int, write_fd: int):
+        self.reader = open(read_fd, "rb", buffering=0)
+        self.writer = open(write_fd, "wb", buffering=0)
+        self.buffer = bytearray(max(IPC_MESSAGE_SIZES))
+        self.peer = None
+    
+    def watch(self, peer):
+        """Bound every receive by checks that the peer process is alive"""
+        self.peer = peer
+        os.set_blocking(self.reader.fileno(), False)
+    
+    def send(self, data):
+        view = memoryview(data)
+        while view:
+            written = self.writer.write(view)
+            view = view[written:]
+    
+    def recv(self, size: int) -> memoryview:
+        view = memoryview(self.buffer)[:size]
+        received = 0
+        while received < size:
+            count = self.reader.readinto(view[received:])
+            if count is None:  # Non-blocking read found no data yet
+                _wait_readable(self.reader, self.peer)
+                continue
+            if not count:
+                raise EOFError("IPC peer closed the pipe")
+            received += count
+        return view
+    
+    def close(self):
+        self.reader.close()
+        self.writer.close()
+
+
+class _SocketChannel:
+    """Byte stream over a connected Unix domain socket"""
+    
+    owns_ends = True
+    
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.buffer = bytearray(max(IPC_MESSAGE_SIZES))
+        self.peer = None
+    
+    def watch(self, peer):
+        """Bound every receive by checks that the peer process is alive"""
+        self.peer = peer
+    
+    def send(self, data):
+        self.sock.sendall(data)
+    
+    def recv(self, size: int) -> memoryview:
+        view = memoryview(self.buffer)[:size]
+        received = 0
+        while received < size:
+            if self.peer is not None:
+                try:
+                    count = self.sock.recv_into(view[received:], 0, socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    _wait_readable(self.sock, self.peer)
+                    continue
+            else:
+                count = self.sock.recv_into(view[received:])
+            if not count:
+                raise EOFError("IPC peer closed the socket")
+            received += count
+        return view
+    
+    def close(self):
+        self.sock.close()
+
+
+class _ConnectionChannel:
+    """Message channel over a multiprocessing.Pipe connection"""
+    
+    owns_ends = True
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.buffer = bytearray(max(IPC_MESSAGE_SIZES))
+        self.peer = None
+    
+    def watch(self, peer):
+        """Bound every receive by checks that the peer process is alive"""
+        self.peer = peer
+    
+    def send(self, data):
+        self.conn.send_bytes(data)
+    
+    def recv(self, size: int) -> memoryview:
+        if self.peer is not None:
+            since = time.monotonic()
+            while not self.conn.poll(IPC_POLL_INTERVAL):
+                _check_peer(self.peer, since)
+        count = self.conn.recv_bytes_into(self.buffer)
+        return memoryview(self.buffer)[:count]
+    
+    def close(self):
+        self.conn.close()
+
+
+class _QueueChannel:
+    """Message channel over a pair of multiprocessing.Queue objects"""
+    
+    # Both ends share the same queues, so the parent keeps them open
+    owns_ends = False
+    
+    def __init__(self, send_queue, recv_queue):
+        self.send_queue = send_queue
+        self.recv_queue = recv_queue
+        self.peer = None
+    
+    def watch(self, peer):
+        """Bound every receive by checks that the peer process is alive"""
+        self.peer = peer
+    
+    def send(self, data):
+        # Queue pickles lazily in a feeder thread, so it must own an immutable copy
+        self.send_queue.put(bytes(data))
+    
+    def recv(self, size: int) -> bytes:
+        if self.peer is None:
+            return self.recv_queue.get()
+        since = time.monotonic()
+        while True:
+            try:
+                return self.recv_queue.get(timeout=IPC_POLL_INTERVAL)
+            except queue.Empty:
+                _check_peer(self.peer, since)
+    
+    def close(self):
+        self.send_queue.close()
+        self.recv_queue.close()
+
+
+class _SharedRing:
+    """Single-producer/single-consumer byte ring in a SharedMemory block
+    
+    Layout: two monotonically increasing uint64 counters (bytes written, bytes read)
+    followed by the data area. Each counter has exactly one writer, so no lock is needed.
+    A counter is published with a plain store after the data copy, so the ring relies
+    on stores becoming visible in order (RING_MACHINES only).
+    """
+    
+    HEADER_SIZE = 16
+    
+    def __init__(self, shm: shared_memory.SharedMemory, peer=None):
+        self.shm = shm
+        self.peer = peer
+        self.counters = shm.buf[:self.HEADER_SIZE].cast("Q")
+        self.data = shm.buf[self.HEADER_SIZE:self.HEADER_SIZE + RING_CAPACITY]
+        self.capacity = len(self.data)
+        self._next_check = 0.0
+    
+    def _idle(self, since: Optional[float]) -> float:
+        """Yield while the other side catches up; returns when the wait began
+        
+        With a peer process, checks every IPC_POLL_INTERVAL that it is still alive.
+        """
+        _yield()
+        now = time.monotonic()
+        if since is None:
+            self._next_check = now + IPC_POLL_INTERVAL
+            return now
+        if self.peer is not None and now >= self._next_check:
+            _check_peer(self.peer, since)
+            self._next_check = now + IPC_POLL_INTERVAL
+        return since
+    
+    def write(self, data):
+        view = memoryview(data).cast("B")
+        offset = 0
+        waiting = None
+        while offset < len(view):
+            written, read = self.counters[0], self.counters[1]
+            free = self.capacity - (written - read)
+            if free == 0:
+                waiting = self._idle(waiting)
+                continue
+            waiting = None
+            chunk = min(free, len(view) - offset)
+            pos = written % self.capacity
+            first = min(chunk, self.capacity - pos)
+            self.data[pos:pos + first] = view[offset:offset + first]
+            if chunk > first:
+                self.data[:chunk - first] = view[offset + first:offset + chunk]
+            self.counters[0] = written + chunk
+            offset += chunk
+    
+    def read_into(self, view: memoryview):
+        offset = 0
+        waiting = None
+        while offset < len(view):
+            written, read = self.counters[0], self.counters[1]
+            available = written - read
+            if available == 0:
+                waiting = self._idle(waiting)
+                continue
+            waiting = None
+            chunk = min(available, len(view) - offset)
+            pos = read % self.capacity
+            first = min(chunk, self.capacity - pos)
+            view[offset:offset + first] = self.data[pos:pos + first]
+            if chunk > first:
+                view[offset + first:offset + chunk] = self.data[:chunk - first]
+            self.counters[1] = read + chunk
+            offset += chunk
+    
+    def close(self):
+        # Exported views must be released before the mapping can close
+        self.counters.release()
+        self.data.release()
+        self.shm.close()
+
+
+class _RingChannel:
+    """Byte stream over two shared-memory rings (one per direction)"""
+    
+    # Both ends share the same SharedMemory handles, so the parent keeps them open
+    owns_ends = False
+    
+    def __init__(self, send_shm: shared_memory.SharedMemory, recv_shm: shared_memory.SharedMemory):
+        self.send_shm = send_shm
+        self.recv_shm = recv_shm
+        self.send_ring: Optional[_SharedRing] = None
+        self.recv_ring: Optional[_SharedRing] = None
+        self.buffer = bytearray(max(IPC_MESSAGE_SIZES))
+        self.peer = None
+    
+    def watch(self, peer):
+        """Bound every wait on the rings by checks that the peer process is alive"""
+        self.peer = peer
+    
+    def _attach(self):
+        # Attach lazily so the views are created in whichever process uses the channel
+        if self.send_ring is None:
+            self.send_ring = _SharedRing(self.send_shm, self.peer)
+            self.recv_ring = _SharedRing(self.recv_shm, self.peer)
+    
+    def send(self, data):
+        self._attach()
+        self.send_ring.write(data)
+    
+    def recv(self, size: int) -> memoryview:
+        self._attach()
+        view = memoryview(self.buffer)[:size]
+        self.recv_ring.read_into(view)
+        return view
+    
+    def close(self):
+        if self.send_ring is not None:
+            self.send_ring.close()
+            self.recv_ring.close()
+        else:
+            self.send_shm.close()
+            self.recv_shm.close()
+    
+    def __getstate__(self):
+        # Only the SharedMemory handles travel to a spawned child
+        return {"send_shm": self.send_shm, "recv_shm": self.recv_shm}
+    
+    def __setstate__(self, state):
+        self.__init__(state["send_shm"], state["recv_shm"])
+
+
+def _ipc_echo_worker(channel):
+    """Child side: echo or sink batches described by control headers until told to stop"""
+    try:
+        while True:
+            mode, size, count = _HEADER.unpack(bytes(channel.recv(_HEADER.size)))
+            if mode == _STOP:
+                break
+            if mode == _ECHO:
+                for _ in range(count):
+                    channel.send(channel.recv(size))
+            else:
+                for _ in range(count):
+                    channel.recv(size)
+                channel.send(_ACK)
+    finally:
+        channel.close()
+
+
+@dataclass
+class IPCBenchmarkResult:
+    """Results from an IPC benchmark test"""
+    test_name: str
+    duration: float
+    operations: int
+    ops_per_second: float
+    p50_us: float
+    p99_us: float
+    throughput_mbps: float
+    score: float
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+
+class IPCBenchmark:
+    """Inter-process communication benchmarking tool"""
+    
+    def __init__(self):
+        """Initialize IPC benchmark"""
+        methods = multiprocessing.get_all_start_methods()
+        self.has_fork = "fork" in methods
+        # fork keeps child start-up cheap and lets raw pipe fds be inherited
+        self.context = multiprocessing.get_context("fork" if self.has_fork else None)
+        self.has_ordered_stores = platform.machine().lower() in RING_MACHINES
+    
+    def _latency_phase(self, channel, size: int, budget: float) -> List[float]:
+        """Round-trip times (seconds) for size-byte echo messages until the budget is spent"""
+        payload = os.urandom(size)
+        samples = []
+        end_time = time.perf_counter() + budget
+        while not samples or time.perf_counter() < end_time:
+            channel.send(_HEADER.pack(_ECHO, size, LATENCY_BATCH))
+            for _ in range(LATENCY_BATCH):
+                start = time.perf_counter()
+                channel.send(payload)
+                channel.recv(size)
+                samples.append(time.perf_counter() - start)
+        return samples
+    
+    def _throughput_phase(self, channel, size: int, budget: float) -> float:
+        """One-way bulk throughput in MB/s for size-byte messages"""
+        payload = os.urandom(size)
+        count = max(1, THROUGHPUT_BATCH_BYTES // size)
+        total_bytes = 0
+        start = time.perf_counter()
+        end_time = start + budget
+        while not total_bytes or time.perf_counter() < end_time:
+            channel.send(_HEADER.pack(_SINK, size, count))
+            for _ in range(count):
+                channel.send(payload)
+            channel.recv(len(_ACK))
+            total_bytes += size * count
+        elapsed = time.perf_counter() - start
+        return (total_bytes / (1024 * 1024)) / elapsed
+    
+    def _run_transport(self, test_name: str, parent_channel, child_channel, duration: float,
+                       progress_callback: Optional[Callable], message_sizes: Optional[List[int]]) -> IPCBenchmarkResult:
+        """Run the latency/throughput sweep against an echo child on the given channel pair"""
+        sizes = message_sizes or IPC_MESSAGE_SIZES
+        budget = duration / (2 * len(sizes))
+        
+        process = self.context.Process(target=_ipc_echo_worker, args=(child_channel,), daemon=True)
+        process.start()
+        # Drop the parent's copies of the child's ends, so a dead child reads as EOF
+        # instead of a hang; waits without EOF check that the child is still alive
+        if child_channel.owns_ends:
+            child_channel.close()
+        parent_channel.watch(process)
+        
+        rows = []
+        headline = None
+        start_time = time.time()
+        try:
+            for idx, size in enumerate(sizes):
+                samples = self._latency_phase(parent_channel, size, budget)
+                throughput = self._throughput_phase(parent_channel, size, budget)
+                summary = latency_summary(samples)
+                rows.append({
+                    "message": format_bytes(size),
+                    "round trips": len(samples),
+                    "rtt p50 µs": summary["p50"],
+                    "rtt p99 µs": summary["p99"],
+                    "MB/s": throughput
+                })
+                if headline is None:
+                    headline = (samples, summary)
+                
+                if progress_callback:
+                    progress_callback((idx + 1) / len(sizes) * 100)
+            
+            parent_channel.send(_HEADER.pack(_STOP, 0, 0))
+        finally:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            # Parent side first: its ring views pin the shared mappings the child end also holds
+            parent_channel.close()
+            child_channel.close()
+        
+        duration = time.time() - start_time
+        samples, summary = headline
+        peak_mbps = max(row["MB/s"] for row in rows)
+        
+        return IPCBenchmarkResult(
+            test_name=test_name,
+            duration=duration,
+            operations=sum(row["round trips"] for row in rows),
+            ops_per_second=len(samples) / sum(samples),
+            p50_us=summary["p50"],
+            p99_us=summary["p99"],
+            throughput_mbps=peak_mbps,
+            score=peak_mbps / 100,  # Normalize score
+            details={
+                "latency": f"round trip at {format_bytes(sizes[0])}",
+                "throughput": "one-way bulk",
+                "rows": rows
+            }
+        )
+    
+    def pipe_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None,
+                  message_sizes: Optional[List[int]] = None) -> IPCBenchmarkResult:
+        """Test a pair of anonymous pipes (os.pipe)"""
+        if not self.has_fork:
+            raise RuntimeError("os.pipe test requires the fork start method (not available on this platform).")
+        
+        down_read, down_write = os.pipe()
+        up_read, up_write = os.pipe()
+        parent = _FileChannel(up_read, down_write)
+        child = _FileChannel(down_read, up_write)
+        return self._run_transport("os.pipe", parent, child, duration, progress_callback, message_sizes)
+    
+    def socketpair_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None,
+                        message_sizes: Optional[List[int]] = None) -> IPCBenchmarkResult:
+        """Test a connected Unix domain socket pair"""
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("Unix domain sockets are not available on this platform.")
+        
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        return self._run_transport("Unix socketpair", _SocketChannel(parent_sock), _SocketChannel(child_sock),
+                                   duration, progress_callback, message_sizes)
+    
+    def mp_pipe_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None,
+                     message_sizes: Optional[List[int]] = None) -> IPCBenchmarkResult:
+        """Test multiprocessing.Pipe (duplex connection, send_bytes/recv_bytes_into)"""
+        parent_conn, child_conn = self.context.Pipe(duplex=True)
+        return self._run_transport("multiprocessing.Pipe", _ConnectionChannel(parent_conn),
+                                   _ConnectionChannel(child_conn), duration, progress_callback, message_sizes)
+    
+    def mp_queue_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None,
+                      message_sizes: Optional[List[int]] = None) -> IPCBenchmarkResult:
+        """Test multiprocessing.Queue (pickled messages via a feeder thread)"""
+        down_queue = self.context.Queue()
+        up_queue = self.context.Queue()
+        return self._run_transport("multiprocessing.Queue", _QueueChannel(down_queue, up_queue),
+                                   _QueueChannel(up_queue, down_queue), duration, progress_callback, message_sizes)
+    
+    def shared_memory_test(self, duration: float = 10.0, progress_callback: Optional[Callable] = None,
+                           message_sizes: Optional[List[int]] = None) -> IPCBenchmarkResult:
+        """Test a lock-free ring buffer in multiprocessing.shared_memory (no syscalls on the data path)"""
+        if not self.has_ordered_stores:
+            raise RuntimeError(f"Shared-memory ring needs x86 store ordering (not {platform.machine()}); "
+                               f"Python has no portable memory barrier.")
+        size = _SharedRing.HEADER_SIZE + RING_CAPACITY
+        down_shm = shared_memory.SharedMemory(create=True, size=size)
+        up_shm = shared_memory.SharedMemory(create=True, size=size)
+        try:
+            down_shm.buf[:_SharedRing.HEADER_SIZE] = bytes(_SharedRing.HEADER_SIZE)
+            up_shm.buf[:_SharedRing.HEADER_SIZE] = bytes(_SharedRing.HEADER_SIZE)
+            parent = _RingChannel(down_shm, up_shm)
+            child = _RingChannel(up_shm, down_shm)
+            return self._run_transport("SharedMemory ring", parent, child, duration, progress_callback, message_sizes)
+        finally:
+            down_shm.unlink()
+            up_shm.unlink()
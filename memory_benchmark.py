@@ -1,13 +1,287 @@
 """
 Memory Performance Benchmarking Module
-Provides memory bandwidth and cache hierarchy testing
+Provides memory bandwidth, latency and cache hierarchy testing
+
+Kernels run as bulk buffer operations (memchr, memset, memcpy, NumPy ufuncs)
+so the reported bandwidth is the memory system's, not the interpreter's.
 """
 
+import os
+import mmap
 import time
 import array
+import ctypes
 import random
+import resource
+import operator
+import multiprocessing
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench_utils import format_bytes
+from resources import (MemoryPlan, detect_resources, plan_memory, read_anon_huge_pages, read_process_memory,
+                       reset_peak_rss, transparent_hugepage_mode)
+from telemetry import TelemetrySummary
+from topology import CacheInfo, data_caches, numa_balancing_enabled, numa_nodes, spread_cpu_order
+
+try:
+    import numpy as np
+    has_numpy = True
+except ImportError:
+    np = None
+    has_numpy = False
+
+
+# Buffers are filled with FILL_BYTE; the read kernel searches for READ_NEEDLE,
+# which is never present, so bytearray.find() (memchr) streams the whole buffer
+FILL_BYTE = 0x02
+READ_NEEDLE = b"\x01"
+
+# Bytes per timed sample for the cache tests (many passes over a small buffer)
+CACHE_SAMPLE_BYTES = 4 * 1024 * 1024
+
+# Cache tests use this fraction of the level's sysfs size (the rest is left for
+# the interpreter's own data); the sizes below are used when sysfs has no cache info
+CACHE_FILL_FRACTION = 0.5
+FALLBACK_CACHE_SIZES = {1: 16 * 1024, 2: 256 * 1024, 3: 8 * 1024 * 1024}
+
+# STREAM's sizing rule: each array at least this many times the last-level cache
+STREAM_LLC_MULTIPLE = 4
+
+# Indices per bulk gather in the random access test
+GATHER_CHUNK = 4096
+
+# Distinct values in the random-access array pattern (repeated to fill the array)
+PATTERN_ELEMENTS = 4096
+
+# STREAM kernels: (name, arrays touched per element)
+STREAM_KERNELS = [("Copy", 2), ("Scale", 2), ("Add", 3), ("Triad", 3)]
+
+# Parallel bandwidth kernels: name -> (C routine, bytes moved per buffer byte)
+PARALLEL_KERNELS = {"read": ("memchr", 1), "write": ("memset", 1), "copy": ("memcpy", 2)}
+# Bandwidth counts as saturated at the first worker count reaching this fraction of the peak
+SATURATION_FRACTION = 0.9
+
+# Stride sweep: 8 B .. 64 KB, over a buffer at least STRIDE_LLC_MULTIPLE x the last-level cache
+STRIDES = [8 << shift for shift in range(14)]
+STRIDE_LLC_MULTIPLE = 2
+# Elements gathered per timed sample (large strides take several passes at shifted offsets)
+STRIDE_SAMPLE_ELEMENTS = 1 << 20
+
+# Huge page test modes: (label, madvise advice name); advice missing on this platform skips the mode
+HUGE_PAGE_MODES = [("4 KB pages", "MADV_NOHUGEPAGE"), ("THP", "MADV_HUGEPAGE")]
+
+# Pointer-chase geometry: one node per cache line (latency sweep) or per page (TLB sweep)
+CACHE_LINE = 64
+PAGE_SIZE = 4096
+CHASE_MIN_BYTES = 4 * 1024
+# Default largest working set of the load latency sweep: several times any current
+# L3 and past the STLB's reach, so the last points show DRAM latency, while the chain
+# (~1.3x the working set) still fits the memory budget of small hosts and builds in
+# seconds. Larger sweeps (several GB) come from the thorough/stress presets or --latency-max
+LATENCY_MAX_MB = 1024
+# Unused slots ahead of every chain: slot values then start above CPython's small-int
+# cache (-5..256), so every load pays the same int allocation as the baseline chain
+CHASE_PAD_SLOTS = PAGE_SIZE // 8
+# Without NumPy the chain is built with a Python loop, which gets slow past this size
+CHASE_MAX_MB_WITHOUT_NUMPY = 256
+# Timed walks per chain (the fastest is kept)
+CHASE_REPEATS = 5
+
+# A latency step counts as a boundary when it rises by both of these
+BOUNDARY_RATIO = 1.15
+BOUNDARY_MIN_NS = 1.5
+
+
+def _buffer_address(buf: bytearray) -> int:
+    """Address of a bytearray's storage (for ctypes.memset)"""
+    return ctypes.addressof(ctypes.c_char.from_buffer(buf))
+
+
+def _fill(buf: bytearray, value: int):
+    """Write every byte of buf (memset)"""
+    ctypes.memset(_buffer_address(buf), value, len(buf))
+
+
+def _make_buffer(size: int) -> bytearray:
+    """Allocate a buffer and touch every page so reads hit real memory, not the zero page"""
+    buf = bytearray(size)
+    _fill(buf, FILL_BYTE)
+    return buf
+
+
+def _read_pass(buf: bytearray):
+    """Read every byte of buf once (memchr for a byte that isn't there)"""
+    buf.find(READ_NEEDLE)
+
+
+def _make_double_array(count: int) -> array.array:
+    """array('d') of count elements built by repeating a small pattern (no per-element Python floats)"""
+    pattern = array.array('d', [float(i) for i in range(min(count, PATTERN_ELEMENTS))])
+    values = pattern * (count // len(pattern))
+    values.extend(pattern[:count % len(pattern)])
+    return values
+
+
+def _tuple_getter(indices: List[int]) -> Callable:
+    """operator.itemgetter that returns a tuple even for a single index"""
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda seq: (seq[index],)
+    return operator.itemgetter(*indices)
+
+
+def _build_chain(count: int, stride: int, spread_lines: bool = False) -> Tuple[array.array, int]:
+    """Random cyclic pointer chain: count nodes, stride slots (8 B each) apart
+    
+    Each node holds the slot index of the next node in a random permutation of
+    all nodes, so walking it is a chain of dependent loads the prefetcher can't
+    follow. spread_lines puts each node at a random cache line within its stride,
+    so page-sized strides don't all map to the same cache sets. Returns the
+    chain and a slot on it to start from.
+    """
+    chain = array.array('Q', [0]) * (CHASE_PAD_SLOTS + count * stride)
+    return chain, _link_chain(chain, count, stride, spread_lines)
+
+
+def _link_chain(chain, count: int, stride: int, spread_lines: bool = False) -> int:
+    """Write a random cyclic chain (see _build_chain) into any 8-byte-slot buffer; returns a start slot"""
+    lines = stride * 8 // CACHE_LINE if spread_lines else 1
+    line_slots = CACHE_LINE // 8
+    if has_numpy:
+        rng = np.random.default_rng()
+        slots = rng.permutation(count).astype(np.intp) * stride + CHASE_PAD_SLOTS
+        if lines > 1:
+            slots += rng.integers(0, lines, count, dtype=np.intp) * line_slots
+        view = np.frombuffer(chain, dtype=np.uint64)
+        view[slots] = np.roll(slots, -1)
+        del view
+    else:
+        slots = [CHASE_PAD_SLOTS + node * stride for node in range(count)]
+        if lines > 1:
+            slots = [slot + random.randrange(lines) * line_slots for slot in slots]
+        random.shuffle(slots)
+        for here, following in zip(slots, slots[1:] + slots[:1]):
+            chain[here] = following
+    return int(slots[0])
+
+
+def _chase(chain: array.array, start: int, rounds: int) -> int:
+    """Follow the chain for rounds * 8 dependent loads; returns the last slot reached"""
+    i = start
+    for _ in range(rounds):
+        i = chain[chain[chain[chain[chain[chain[chain[chain[i]]]]]]]]
+    return i
+
+
+def _time_chase(chain: array.array, start: int, rounds: int) -> float:
+    """ns per dependent load for one walk of rounds * 8 loads"""
+    begin = time.perf_counter()
+    _chase(chain, start, rounds)
+    return (time.perf_counter() - begin) / (rounds * 8) * 1e9
+
+
+def _expected_level(size: int, caches: List[CacheInfo]) -> str:
+    """Smallest data cache that holds size bytes, per sysfs"""
+    for cache in caches:
+        if size <= cache.size:
+            return cache.name
+    return "DRAM"
+
+
+def _find_boundaries(sizes: List[int], net_latencies: List[float], overhead: float) -> List[Tuple[int, float]]:
+    """(size, rise in ns) for each working-set size after which latency steps up
+    
+    Net latencies are compared against their running maximum, so a single fast
+    outlier doesn't register as a dip followed by a step; the ratio test is on
+    the full per-load time (net + loop overhead).
+    """
+    boundaries = []
+    level = net_latencies[0]
+    for i in range(1, len(sizes)):
+        rise = net_latencies[i] - level
+        if rise > BOUNDARY_MIN_NS and net_latencies[i] + overhead > (level + overhead) * BOUNDARY_RATIO:
+            boundaries.append((sizes[i - 1], rise))
+        level = max(level, net_latencies[i])
+    return boundaries
+
+
+def _parallel_bandwidth_worker(cpu: Optional[int], size: int, kernel: str, duration: float,
+                               barrier, results) -> None:
+    """Pin to one CPU, fault in a private buffer there, wait for the others, then stream over it"""
+    if cpu is not None:
+        os.sched_setaffinity(0, {cpu})
+    # First touch happens after pinning, so the pages come from this CPU's local memory
+    buffer = _make_buffer(size)
+    if kernel == "copy":
+        source = memoryview(_make_buffer(size))
+        destination = memoryview(buffer)
+        
+        def run():
+            destination[:] = source
+    elif kernel == "write":
+        address = _buffer_address(buffer)
+        
+        def run():
+            ctypes.memset(address, FILL_BYTE, size)
+    else:
+        def run():
+            _read_pass(buffer)
+    
+    run()  # Warm up
+    barrier.wait()
+    passes = 0
+    start = time.perf_counter()
+    end = start + duration
+    while passes == 0 or time.perf_counter() < end:
+        run()
+        passes += 1
+    results.put((cpu, passes * size * PARALLEL_KERNELS[kernel][1], time.perf_counter() - start))
+
+
+def _numa_worker(conn, node_cpus: Dict[int, int], memory_nodes: List[int], size: int, chain_bytes: int,
+                 iterations: int, accesses: int) -> None:
+    """For each memory node: first-touch a buffer and a pointer chain from one of its CPUs,
+    then re-pin to a CPU of every node in turn and measure read bandwidth and load latency
+    
+    Sends (cpu node, memory node, best GB/s, ns/load, loop overhead ns) per pair.
+    """
+    rounds = max(1, accesses // 8)
+    baseline = array.array('Q', [CHASE_PAD_SLOTS]) * (CHASE_PAD_SLOTS + 1)
+    for memory_node in memory_nodes:
+        os.sched_setaffinity(0, {node_cpus[memory_node]})
+        buffer = _make_buffer(size)
+        chain, start = _build_chain(chain_bytes // CACHE_LINE, CACHE_LINE // 8)
+        for cpu_node, cpu in node_cpus.items():
+            os.sched_setaffinity(0, {cpu})
+            _read_pass(buffer)  # Warm up on the new CPU
+            best = float("inf")
+            for _ in range(iterations):
+                begin = time.perf_counter()
+                _read_pass(buffer)
+                best = min(best, time.perf_counter() - begin)
+            start = _chase(chain, start, rounds)
+            latency = min(_time_chase(chain, start, rounds) for _ in range(CHASE_REPEATS))
+            overhead = min(_time_chase(baseline, CHASE_PAD_SLOTS, rounds) for _ in range(CHASE_REPEATS))
+            conn.send((cpu_node, memory_node, _gbps(size, best), latency, overhead))
+        del buffer, chain
+    conn.close()
+
+
+def _repeated(kernel: Callable[[], Any], passes: int) -> Callable[[], Any]:
+    """kernel run `passes` times per call (streamed mode: same bytes per call from a smaller buffer)"""
+    if passes == 1:
+        return kernel
+    
+    def run():
+        for _ in range(passes):
+            kernel()
+    return run
+
+
+def _gbps(num_bytes: float, seconds: float) -> float:
+    """Bandwidth in GB/s (GiB, as the other memory tests report)"""
+    return (num_bytes / (1024 ** 3)) / seconds if seconds > 0 else 0.0
 
 
 @dataclass
@@ -19,6 +293,10 @@ class MemoryBenchmarkResult:
     bandwidth_gbps: float
     score: float
     buffer_size: Optional[str] = None
+    latency_ns: Optional[float] = None
+    downscaled: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
 
 
 class MemoryBenchmark:
@@ -26,96 +304,184 @@ class MemoryBenchmark:
     
     def __init__(self):
         """Initialize memory benchmark"""
-        pass
+        self.resources = detect_resources()
+        self.caches = data_caches()
     
-    def sequential_read(self, size_mb: int = 100, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test sequential memory read bandwidth"""
-        size = size_mb * 1024 * 1024
-        
-        # Create test array
-        test_array = array.array('d', [float(i) for i in range(size // 8)])
-        
-        iterations = 10
-        start_time = time.time()
+    def cache_level(self, level: int) -> Optional[CacheInfo]:
+        """The data/unified cache at a level, per sysfs (None if not reported)"""
+        return next((cache for cache in self.caches if cache.level == level), None)
+    
+    def has_cache_level(self, level: int) -> bool:
+        """True when sysfs reports a data/unified cache at this level"""
+        return self.cache_level(level) is not None
+    
+    def _plan(self, size_mb: int, copies: float = 1, streamed: bool = False) -> MemoryPlan:
+        """plan_memory() against the memory budget, re-read before every test"""
+        self.resources = detect_resources()
+        llc_size = self.caches[-1].size if self.caches else 0
+        return plan_memory(size_mb, self.resources.usable_memory(), copies, streamed, llc_size)
+    
+    def _fit_size_mb(self, size_mb: int, copies: float = 1) -> int:
+        """Cap a buffer size so `copies` live copies fit in the memory budget"""
+        return self._plan(size_mb, copies).size_mb
+    
+    def _buffer_label(self, size_mb: int, requested_mb: int) -> str:
+        """Buffer size label, noting when the requested size was capped"""
+        return MemoryPlan(requested_mb, size_mb).label
+    
+    def _downscale_note(self, size_mb: int, requested_mb: int) -> Optional[str]:
+        """Downscale note for a test capped by _fit_size_mb (None when it was not)"""
+        llc_size = self.caches[-1].size if self.caches else 0
+        return MemoryPlan(requested_mb, size_mb, usable=self.resources.usable_memory(), llc_size=llc_size).note
+    
+    def _begin_setup(self) -> Tuple[float, Optional[int]]:
+        """Start timing buffer setup; resets the peak-RSS watermark where the kernel allows it"""
+        rss_before = read_process_memory()[0] if reset_peak_rss() else None
+        return time.perf_counter(), rss_before
+    
+    def _end_setup(self, token: Tuple[float, Optional[int]]) -> Dict[str, Any]:
+        """Setup time and peak RSS growth since _begin_setup(), for the result details"""
+        start, rss_before = token
+        info = {"setup s": f"{time.perf_counter() - start:.3f}"}
+        peak = read_process_memory()[1]
+        if rss_before is not None and peak is not None:
+            info["setup peak RSS +"] = format_bytes(max(0, peak - rss_before))
+        return info
+    
+    def _best_of(self, kernel: Callable[[], Any], repeats: int,
+                 progress_callback: Optional[Callable] = None, progress_base: float = 0.0,
+                 progress_span: float = 100.0) -> Tuple[List[float], float]:
+        """Time kernel() repeats times after one untimed warm-up call (as STREAM does)
         
-        for iteration in range(iterations):
-            # Sequential read
-            total = 0.0
-            for i in range(len(test_array)):
-                total += test_array[i]
+        Returns (per-call times in seconds, total elapsed seconds including warm-up).
+        """
+        start_time = time.perf_counter()
+        kernel()
+        times = []
+        for repeat in range(repeats):
+            start = time.perf_counter()
+            kernel()
+            times.append(time.perf_counter() - start)
             
             if progress_callback:
-                progress = ((iteration + 1) / iterations) * 100
-                progress_callback(progress)
-        
-        duration = time.time() - start_time
-        bytes_transferred = size * iterations
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / duration
-        score = bandwidth_gbps
-        
+                progress_callback(progress_base + (repeat + 1) / repeats * progress_span)
+        return times, time.perf_counter() - start_time
+    
+    def _time_bounded(self, kernel: Callable[[], Any], duration: float,
+                      progress_callback: Optional[Callable] = None) -> Tuple[List[float], float]:
+        """Time kernel() repeatedly until the duration is spent; returns (per-call times, elapsed)"""
+        start_time = time.perf_counter()
+        end_time = start_time + duration
+        kernel()
+        times = []
+        while not times or time.perf_counter() < end_time:
+            start = time.perf_counter()
+            kernel()
+            times.append(time.perf_counter() - start)
+            
+            if progress_callback and len(times) % 10 == 0:
+                progress = ((time.perf_counter() - start_time) / duration) * 100
+                progress_callback(min(progress, 100))
+        return times, time.perf_counter() - start_time
+    
+    def _bandwidth_result(self, test_name: str, times: List[float], elapsed: float, bytes_per_call: int,
+                          buffer_size: str, details: Optional[Dict[str, Any]] = None,
+                          downscaled: Optional[str] = None) -> MemoryBenchmarkResult:
+        """Build a result whose bandwidth is the best call (STREAM convention), with the average in details"""
+        best_gbps = _gbps(bytes_per_call, min(times))
+        avg_gbps = _gbps(bytes_per_call, sum(times) / len(times))
+        details = dict(details or {})
+        details.setdefault("best of", len(times))
+        details.setdefault("avg GB/s", f"{avg_gbps:.2f}")
         return MemoryBenchmarkResult(
-            test_name="Sequential Read",
-            duration=duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size=f"{size_mb} MB"
+            test_name=test_name,
+            duration=elapsed,
+            bytes_transferred=bytes_per_call * (len(times) + 1),
+            bandwidth_gbps=best_gbps,
+            score=best_gbps,
+            buffer_size=buffer_size,
+            downscaled=downscaled,
+            details=details
         )
     
-    def sequential_write(self, size_mb: int = 100, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test sequential memory write bandwidth"""
-        size = size_mb * 1024 * 1024
+    def sequential_read(self, size_mb: int = 100, iterations: int = 10,
+                        progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test sequential memory read bandwidth (memchr over the whole buffer, best of N)"""
+        plan = self._plan(size_mb, copies=1, streamed=True)
+        size = plan.size_mb * 1024 * 1024
         
-        iterations = 10
-        start_time = time.time()
+        setup = self._begin_setup()
+        buffer = _make_buffer(size)
+        setup_info = self._end_setup(setup)
+        times, elapsed = self._best_of(_repeated(lambda: _read_pass(buffer), plan.passes),
+                                       iterations, progress_callback)
         
-        for iteration in range(iterations):
-            # Sequential write
-            test_array = array.array('d', [0.0] * (size // 8))
-            for i in range(len(test_array)):
-                test_array[i] = float(i)
-            
-            if progress_callback:
-                progress = ((iteration + 1) / iterations) * 100
-                progress_callback(progress)
+        return self._bandwidth_result("Sequential Read", times, elapsed, size * plan.passes,
+                                      plan.label, {"kernel": "memchr", **setup_info}, plan.note)
+    
+    def sequential_write(self, size_mb: int = 100, iterations: int = 10,
+                         progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test sequential memory write bandwidth (memset into one pre-faulted buffer, best of N)"""
+        plan = self._plan(size_mb, copies=1, streamed=True)
+        size = plan.size_mb * 1024 * 1024
         
-        duration = time.time() - start_time
-        bytes_transferred = size * iterations
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / duration
-        score = bandwidth_gbps
+        # Allocated and faulted in once, so page-fault cost stays out of the timing
+        setup = self._begin_setup()
+        buffer = _make_buffer(size)
+        setup_info = self._end_setup(setup)
+        address = _buffer_address(buffer)
+        fill_values = iter(range(1 << 30))
         
-        return MemoryBenchmarkResult(
-            test_name="Sequential Write",
-            duration=duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size=f"{size_mb} MB"
-        )
+        def write_pass():
+            ctypes.memset(address, next(fill_values) & 0xFF, size)
+        
+        times, elapsed = self._best_of(_repeated(write_pass, plan.passes), iterations, progress_callback)
+        
+        return self._bandwidth_result("Sequential Write", times, elapsed, size * plan.passes,
+                                      plan.label, {"kernel": "memset", **setup_info}, plan.note)
     
     def random_access(self, size_mb: int = 100, num_accesses: int = 1000000, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test random memory access patterns"""
+        """Test random memory access patterns (bulk gathers of random elements)"""
+        # Peak footprint: the array (the index chunks are small next to it)
+        requested_mb = size_mb
+        size_mb = self._fit_size_mb(size_mb, copies=1)
         size = size_mb * 1024 * 1024
         
-        # Create test array
-        test_array = array.array('d', [float(i) for i in range(size // 8)])
+        setup = self._begin_setup()
+        test_array = _make_double_array(size // 8)
         array_len = len(test_array)
         
-        # Pre-generate random indices
-        indices = [random.randint(0, array_len - 1) for _ in range(num_accesses)]
+        # Index chunks: NumPy fancy indexing over one precomputed index array (8 B per
+        # access), or itemgetter's C loop without NumPy. The itemgetter chunks hold
+        # Python ints, so they are built one at a time outside the timed gather
+        # instead of all up front (~100 B per access)
+        offsets = range(0, num_accesses, GATHER_CHUNK)
+        if has_numpy:
+            values = np.frombuffer(test_array, dtype=np.float64)
+            indices = np.random.default_rng().integers(0, array_len, num_accesses, dtype=np.intp)
+            make_chunk = lambda offset: indices[offset:offset + GATHER_CHUNK]
+            gather = lambda chunk: values.take(chunk).sum()
+            kernel = "numpy take"
+        else:
+            population = range(array_len)
+            make_chunk = lambda offset: _tuple_getter(random.choices(population, k=min(GATHER_CHUNK, num_accesses - offset)))
+            gather = lambda getter: sum(getter(test_array))
+            kernel = "itemgetter"
+        setup_info = self._end_setup(setup)
         
-        start_time = time.time()
-        
-        # Random access
+        # Random access (only the gathers are timed)
         total = 0.0
-        for i, idx in enumerate(indices):
-            total += test_array[idx]
+        duration = 0.0
+        for i, offset in enumerate(offsets):
+            chunk = make_chunk(offset)
+            gather_start = time.perf_counter()
+            total += gather(chunk)
+            duration += time.perf_counter() - gather_start
             
-            if progress_callback and i % 10000 == 0:
-                progress = (i / num_accesses) * 100
+            if progress_callback and i % 16 == 0:
+                progress = (i / len(offsets)) * 100
                 progress_callback(progress)
         
-        duration = time.time() - start_time
         bytes_transferred = num_accesses * 8  # 8 bytes per double
         bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / duration
         score = bandwidth_gbps * 10  # Scale up since random is typically slower
@@ -126,140 +492,677 @@ class MemoryBenchmark:
             bytes_transferred=bytes_transferred,
             bandwidth_gbps=bandwidth_gbps,
             score=score,
-            buffer_size=f"{size_mb} MB"
+            buffer_size=self._buffer_label(size_mb, requested_mb),
+            downscaled=self._downscale_note(size_mb, requested_mb),
+            details={"kernel": kernel, "ns/access": f"{duration / num_accesses * 1e9:.1f}", **setup_info}
         )
     
+    def cache_test_level(self, level: int, duration: float = 5.0,
+                         progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Read bandwidth of a buffer sized to CACHE_FILL_FRACTION of one cache level (sysfs)"""
+        cache = self.cache_level(level)
+        if cache is not None:
+            size = int(cache.size * CACHE_FILL_FRACTION) // CACHE_LINE * CACHE_LINE
+            label = f"{format_bytes(size)} of {format_bytes(cache.size)}"
+            topology = {
+                "sysfs size": format_bytes(cache.size),
+                "line": f"{cache.line_size} B" if cache.line_size else "-",
+                "ways": cache.ways or "-",
+                "shared by": f"{len(cache.shared_cpus)} CPU(s)"
+            }
+        elif level in FALLBACK_CACHE_SIZES:
+            size = FALLBACK_CACHE_SIZES[level]
+            label = format_bytes(size)
+            topology = {"sysfs size": "not available (default buffer)"}
+        else:
+            raise RuntimeError(f"No L{level} cache is reported in sysfs.")
+        
+        setup = self._begin_setup()
+        buffer = _make_buffer(size)
+        setup_info = self._end_setup(setup)
+        passes = max(1, CACHE_SAMPLE_BYTES // size)
+        
+        def read_sample():
+            for _ in range(passes):
+                buffer.find(READ_NEEDLE)
+        
+        times, elapsed = self._time_bounded(read_sample, duration, progress_callback)
+        return self._bandwidth_result(f"L{level} Cache", times, elapsed, size * passes, label,
+                                      {**topology, "kernel": "memchr", "passes/sample": passes, **setup_info})
+    
     def cache_test_l1(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test L1 cache performance (small array fits in L1)"""
-        # L1 cache is typically 32-64KB, use 16KB to be safe
-        size = 16 * 1024
-        test_array = array.array('d', [float(i) for i in range(size // 8)])
+        """Test L1 cache performance (buffer sized from the L1 data cache)"""
+        return self.cache_test_level(1, duration, progress_callback)
+    
+    def cache_test_l2(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test L2 cache performance (buffer sized from the L2 cache)"""
+        return self.cache_test_level(2, duration, progress_callback)
+    
+    def cache_test_l3(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test L3 cache performance (buffer sized from the L3 cache)"""
+        return self.cache_test_level(3, duration, progress_callback)
+    
+    def cache_test_l4(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test L4 cache performance (eDRAM/system-level cache, where sysfs reports one)"""
+        return self.cache_test_level(4, duration, progress_callback)
+    
+    def memory_copy(self, size_mb: int = 100, iterations: int = 10,
+                    progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Test memory copy bandwidth (memoryview slice assignment = memcpy, best of N)"""
+        plan = self._plan(size_mb, copies=2, streamed=True)
+        size = plan.size_mb * 1024 * 1024
         
-        start_time = time.time()
-        end_time = start_time + duration
-        iterations = 0
+        setup = self._begin_setup()
+        source = memoryview(_make_buffer(size))
+        destination = memoryview(_make_buffer(size))
+        setup_info = self._end_setup(setup)
+        
+        def copy_pass():
+            destination[:] = source
+        
+        times, elapsed = self._best_of(_repeated(copy_pass, plan.passes), iterations, progress_callback)
+        
+        # Copy involves read + write
+        return self._bandwidth_result("Memory Copy", times, elapsed, size * 2 * plan.passes,
+                                      plan.label, {"kernel": "memcpy", **setup_info}, plan.note)
+    
+    def stream_test(self, size_mb: int = 100, iterations: int = 10,
+                    progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """STREAM Copy/Scale/Add/Triad over three arrays of doubles (best of N per kernel)
+        
+        Bytes are counted as the reference STREAM does (2 or 3 arrays per element)
+        and rates are also given in MB/s = 10^6 B/s for direct comparison. Copy uses
+        memcpy; Scale, Add and Triad need NumPy and are skipped without it. NumPy
+        runs Triad as two passes, so it reads somewhat lower than compiled STREAM.
+        """
+        plan = self._plan(size_mb, copies=3, streamed=True)
+        n = plan.size_mb * 1024 * 1024 // 8
+        passes = plan.passes
+        scalar = 3.0
         
-        while time.time() < end_time:
-            total = 0.0
-            for i in range(len(test_array)):
-                total += test_array[i]
-            iterations += 1
+        setup = self._begin_setup()
+        if has_numpy:
+            a = np.full(n, 1.0)
+            b = np.full(n, 2.0)
+            c = np.zeros(n)
+            kernels = {
+                "Copy": lambda: np.copyto(c, a),
+                "Scale": lambda: np.multiply(c, scalar, out=b),
+                "Add": lambda: np.add(a, b, out=c),
+                "Triad": lambda: np.add(b, np.multiply(c, scalar, out=a), out=a),
+            }
+        else:
+            a = memoryview(_make_buffer(n * 8))
+            c = memoryview(_make_buffer(n * 8))
             
-            if progress_callback and iterations % 100 == 0:
-                progress = ((time.time() - start_time) / duration) * 100
-                progress_callback(min(progress, 100))
+            def copy_kernel():
+                c[:] = a
+            
+            kernels = {"Copy": copy_kernel}
+        setup_info = self._end_setup(setup)
+        
+        rows = []
+        best_gbps = {}
+        total_time = 0.0
+        span = 100.0 / len(kernels)
+        for idx, (name, arrays) in enumerate(STREAM_KERNELS):
+            if name not in kernels:
+                rows.append({"kernel": name, "best MB/s": None, "avg ms": None, "min ms": None, "max ms": None})
+                continue
+            bytes_per_call = arrays * 8 * n * passes
+            times, elapsed = self._best_of(_repeated(kernels[name], passes), iterations, progress_callback,
+                                           progress_base=len(best_gbps) * span, progress_span=span)
+            total_time += elapsed
+            best_gbps[name] = _gbps(bytes_per_call, min(times))
+            rows.append({
+                "kernel": name,
+                "best MB/s": bytes_per_call / min(times) / 1e6,
+                "avg ms": sum(times) / len(times) * 1000,
+                "min ms": min(times) * 1000,
+                "max ms": max(times) * 1000
+            })
         
-        actual_duration = time.time() - start_time
-        bytes_transferred = size * iterations
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / actual_duration
-        score = bandwidth_gbps
+        headline = "Triad" if "Triad" in best_gbps else "Copy"
+        details = {
+            "array": f"{n:,} doubles x 3" + (f", {passes} passes" if passes > 1 else ""),
+            "best of": iterations,
+            "headline": headline,
+            **setup_info,
+            "rows": rows
+        }
+        if not has_numpy:
+            details["scale/add/triad"] = "need NumPy"
+        if self.caches and n * 8 < STREAM_LLC_MULTIPLE * self.caches[-1].size:
+            llc = self.caches[-1]
+            details["sizing"] = (f"arrays < {STREAM_LLC_MULTIPLE}x {llc.name} ({format_bytes(llc.size)}), "
+                                 "so part of the traffic may be cache hits")
         
         return MemoryBenchmarkResult(
-            test_name="L1 Cache",
-            duration=actual_duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size="16 KB"
+            test_name=f"STREAM ({headline})",
+            duration=total_time,
+            bytes_transferred=sum(arrays * 8 * n * passes * (iterations + 1)
+                                  for name, arrays in STREAM_KERNELS if name in kernels),
+            bandwidth_gbps=best_gbps[headline],
+            score=best_gbps[headline],
+            buffer_size=plan.label + " x 3",
+            downscaled=plan.note,
+            details=details
         )
     
-    def cache_test_l2(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test L2 cache performance (array fits in L2)"""
-        # L2 cache is typically 256KB-1MB, use 256KB
-        size = 256 * 1024
-        test_array = array.array('d', [float(i) for i in range(size // 8)])
+    def _chase_points(self, points: List[Tuple[int, int, bool]], accesses: int,
+                      progress_callback: Optional[Callable] = None) -> Tuple[List[float], List[float], float, float]:
+        """ns per dependent load for each (nodes, stride slots, spread_lines) point
         
-        start_time = time.time()
-        end_time = start_time + duration
-        iterations = 0
+        Each point is timed best-of-CHASE_REPEATS, interleaved with a one-node chain
+        that points at itself (same interpreter work, always an L1 hit); the
+        difference is the net load latency, which keeps clock drift between points
+        out of the comparison. Returns (ns per load, net ns per load, median loop
+        overhead ns, elapsed seconds). Progress is weighted by chain size, since
+        building the large chains dominates.
+        """
+        rounds = max(1, accesses // 8)
+        start_time = time.perf_counter()
+        baseline = array.array('Q', [CHASE_PAD_SLOTS]) * (CHASE_PAD_SLOTS + 1)
+        _chase(baseline, CHASE_PAD_SLOTS, rounds)
         
-        while time.time() < end_time:
-            total = 0.0
-            for i in range(len(test_array)):
-                total += test_array[i]
-            iterations += 1
+        total_weight = sum(nodes * stride for nodes, stride, _ in points)
+        done_weight = 0
+        latencies = []
+        net_latencies = []
+        overheads = []
+        for nodes, stride, spread_lines in points:
+            chain, start = _build_chain(nodes, stride, spread_lines)
+            # The warm-up walk also faults in the pages and fills the TLB/caches
+            start = _chase(chain, start, max(rounds, nodes // 8))
+            chain_times = []
+            baseline_times = []
+            for _ in range(CHASE_REPEATS):
+                chain_times.append(_time_chase(chain, start, rounds))
+                baseline_times.append(_time_chase(baseline, CHASE_PAD_SLOTS, rounds))
+            del chain
+            latencies.append(min(chain_times))
+            overheads.append(min(baseline_times))
+            net_latencies.append(max(0.0, latencies[-1] - overheads[-1]))
             
-            if progress_callback and iterations % 10 == 0:
-                progress = ((time.time() - start_time) / duration) * 100
-                progress_callback(min(progress, 100))
+            done_weight += nodes * stride
+            if progress_callback:
+                progress_callback(done_weight / total_weight * 100)
+        overhead = sorted(overheads)[len(overheads) // 2]
+        return latencies, net_latencies, overhead, time.perf_counter() - start_time
+    
+    def latency_sweep_test(self, max_size_mb: int = LATENCY_MAX_MB, accesses: int = 131072,
+                           progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Dependent-load latency over working sets from 4 KB doubling up to max_size_mb
+        
+        Each working set is a random cyclic chain with one node per cache line.
+        "net ns" subtracts the interpreter's per-load cost (measured on a one-node
+        chain between timings), so it approximates the hardware load-to-use latency; steps between
+        L1 and L2 are a few ns and can sit near the noise floor. Detected latency
+        steps are checked against the cache sizes in sysfs.
+        """
+        caches = self.caches
+        requested_mb = max_size_mb
+        max_size_mb = self._fit_size_mb(max_size_mb, copies=1.3 if has_numpy else 1.6)
+        downscaled = self._downscale_note(max_size_mb, requested_mb)
+        if not has_numpy:
+            max_size_mb = min(max_size_mb, CHASE_MAX_MB_WITHOUT_NUMPY)
+        sizes = []
+        size = CHASE_MIN_BYTES
+        while size <= max_size_mb * 1024 * 1024:
+            sizes.append(size)
+            size *= 2
         
-        actual_duration = time.time() - start_time
-        bytes_transferred = size * iterations
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / actual_duration
-        score = bandwidth_gbps
+        points = [(size // CACHE_LINE, CACHE_LINE // 8, False) for size in sizes]
+        latencies, net_latencies, overhead, elapsed = self._chase_points(points, accesses, progress_callback)
         
+        rows = [{
+            "working set": format_bytes(size),
+            "ns/load": latency,
+            "net ns": net,
+            "sysfs level": _expected_level(size, caches)
+        } for size, latency, net in zip(sizes, latencies, net_latencies)]
+        
+        details: Dict[str, Any] = {"loop overhead ns": f"{overhead:.1f}"}
+        boundaries = _find_boundaries(sizes, net_latencies, overhead)
+        for cache in caches:
+            # A cache shows up as a step once the working set nears its size (the largest step counts)
+            matched = [b for b in boundaries if cache.size / 8 < b[0] <= cache.size]
+            label = f"{cache.name} {format_bytes(cache.size)}"
+            if matched:
+                size, rise = max(matched, key=lambda b: b[1])
+                details[label] = f"step after {format_bytes(size)} (+{rise:.1f} ns)"
+                boundaries.remove((size, rise))
+            else:
+                details[label] = "no step seen"
+        if boundaries:
+            details["other steps after"] = ", ".join(f"{format_bytes(size)} (+{rise:.1f} ns)"
+                                                      for size, rise in boundaries)
+        if not caches:
+            details["sysfs caches"] = "not available"
+        details["rows"] = rows
+        
+        headline = rows[-1]["net ns"]
         return MemoryBenchmarkResult(
-            test_name="L2 Cache",
-            duration=actual_duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size="256 KB"
+            test_name=f"Load Latency ({rows[-1]['sysfs level']})",
+            duration=elapsed,
+            bytes_transferred=len(sizes) * (accesses // 8) * 8 * 4 * CACHE_LINE,
+            bandwidth_gbps=_gbps(CACHE_LINE, headline / 1e9) if headline > 0 else 0.0,
+            score=100 / max(headline, 1.0),  # Normalize score (100 ns -> 1.0)
+            buffer_size=f"4 KB - {self._buffer_label(sizes[-1] // (1024 * 1024), requested_mb)}",
+            latency_ns=headline,
+            downscaled=downscaled,
+            details=details
         )
     
-    def cache_test_l3(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test L3 cache performance (array fits in L3)"""
-        # L3 cache is typically 8-32MB, use 8MB
-        size = 8 * 1024 * 1024
-        test_array = array.array('d', [float(i) for i in range(size // 8)])
+    def tlb_sweep_test(self, max_pages: int = 16384, accesses: int = 131072,
+                       progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Dependent-load latency with one node per 4 KB page, doubling the page count from 16
         
-        start_time = time.time()
-        end_time = start_time + duration
-        iterations = 0
+        Each node sits at a random line of its page, so the cache footprint stays at one
+        line per page while the page count grows; a latency step marks the point where
+        the pages stop fitting in a TLB level (reach = pages x 4 KB).
+        """
+        page_counts = []
+        pages = 16
+        while pages <= max_pages:
+            page_counts.append(pages)
+            pages *= 2
+        
+        stride = PAGE_SIZE // 8
+        points = [(pages, stride, True) for pages in page_counts]
+        latencies, net_latencies, overhead, elapsed = self._chase_points(points, accesses, progress_callback)
         
-        while time.time() < end_time:
-            total = 0.0
-            for i in range(len(test_array)):
-                total += test_array[i]
-            iterations += 1
+        rows = [{
+            "pages": pages,
+            "span": format_bytes(pages * PAGE_SIZE),
+            "line footprint": format_bytes(pages * CACHE_LINE),
+            "ns/load": latency,
+            "net ns": net
+        } for pages, latency, net in zip(page_counts, latencies, net_latencies)]
+        
+        boundaries = _find_boundaries(page_counts, net_latencies, overhead)
+        details: Dict[str, Any] = {
+            "loop overhead ns": f"{overhead:.1f}",
+            "steps after": ", ".join(f"{pages} pages ({format_bytes(pages * PAGE_SIZE)} reach, +{rise:.1f} ns)"
+                                     for pages, rise in boundaries) or "none",
+            "rows": rows
+        }
+        
+        headline = rows[-1]["net ns"]
+        return MemoryBenchmarkResult(
+            test_name="TLB Reach Sweep",
+            duration=elapsed,
+            bytes_transferred=len(page_counts) * (accesses // 8) * 8 * 4 * CACHE_LINE,
+            bandwidth_gbps=_gbps(CACHE_LINE, headline / 1e9) if headline > 0 else 0.0,
+            score=100 / max(headline, 1.0),  # Normalize score (100 ns -> 1.0)
+            buffer_size=f"{page_counts[0]} - {page_counts[-1]} pages",
+            latency_ns=headline,
+            details=details
+        )
+    
+    def _run_parallel(self, cpus: List[Optional[int]], size: int, kernel: str, duration: float) -> List[float]:
+        """Run one bandwidth worker per CPU entry simultaneously; returns per-worker GB/s"""
+        barrier = multiprocessing.Barrier(len(cpus))
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_parallel_bandwidth_worker,
+                                    args=(cpu, size, kernel, duration, barrier, results), daemon=True)
+            for cpu in cpus
+        ]
+        for worker in workers:
+            worker.start()
+        # Generous timeout: each worker faults in its buffer before the barrier
+        rates = []
+        for _ in workers:
+            _, num_bytes, elapsed = results.get(timeout=duration + 120)
+            rates.append(_gbps(num_bytes, elapsed))
+        for worker in workers:
+            worker.join()
+        return rates
+    
+    def parallel_bandwidth_test(self, size_mb: int = 100, kernel: str = "read", duration: float = 3.0,
+                                max_workers: Optional[int] = None,
+                                progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Aggregate bandwidth of 1, 2, 4, ... concurrent processes, each streaming its own buffer
+        
+        Workers are pinned one per physical core before taking SMT siblings, fault in
+        a private buffer after pinning (so pages are local to the worker), and start
+        together from a barrier. The headline is the peak aggregate GB/s; the
+        saturation point is the first worker count within SATURATION_FRACTION of it.
+        """
+        if kernel not in PARALLEL_KERNELS:
+            raise ValueError(f"Unknown kernel '{kernel}' (expected one of {', '.join(PARALLEL_KERNELS)})")
+        routine, multiplier = PARALLEL_KERNELS[kernel]
+        max_workers = max_workers or self.resources.effective_cpus
+        cpu_order = spread_cpu_order() if hasattr(os, "sched_setaffinity") else []
+        
+        counts = []
+        workers = 1
+        while workers < max_workers:
+            counts.append(workers)
+            workers *= 2
+        counts.append(max_workers)
+        
+        # Every worker of the largest step is alive at once (copy needs two buffers each)
+        requested_mb = size_mb
+        size_mb = self._fit_size_mb(size_mb, copies=max_workers * (2 if kernel == "copy" else 1))
+        size = size_mb * 1024 * 1024
+        
+        rows = []
+        start_time = time.time()
+        for idx, workers in enumerate(counts):
+            cpus = [cpu_order[i % len(cpu_order)] if cpu_order else None for i in range(workers)]
+            rates = self._run_parallel(cpus, size, kernel, duration)
+            aggregate = sum(rates)
+            single = rows[0]["aggregate GB/s"] if rows else aggregate
+            rows.append({
+                "workers": workers,
+                "aggregate GB/s": aggregate,
+                "per worker GB/s": aggregate / workers,
+                "slowest GB/s": min(rates),
+                "scaling": f"{aggregate / single:.2f}x",
+                "efficiency": f"{aggregate / (single * workers) * 100:.0f}%" if single > 0 else "-"
+            })
             
             if progress_callback:
-                progress = ((time.time() - start_time) / duration) * 100
-                progress_callback(min(progress, 100))
+                progress_callback((idx + 1) / len(counts) * 100)
         
-        actual_duration = time.time() - start_time
-        bytes_transferred = size * iterations
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / actual_duration
-        score = bandwidth_gbps
+        peak = max(rows, key=lambda row: row["aggregate GB/s"])
+        saturation = next(row for row in rows if row["aggregate GB/s"] >= peak["aggregate GB/s"] * SATURATION_FRACTION)
+        details = {
+            "kernel": routine,
+            "pinning": "one per core, then SMT siblings" if cpu_order else "none (no sched_setaffinity)",
+            "saturates at": f"{saturation['workers']} of {max_workers} processes ({saturation['aggregate GB/s']:.2f} GB/s)",
+            "rows": rows
+        }
+        if len(cpu_order) and max_workers > len(cpu_order):
+            details["oversubscribed"] = f"{max_workers} processes on {len(cpu_order)} CPUs"
         
         return MemoryBenchmarkResult(
-            test_name="L3 Cache",
-            duration=actual_duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size="8 MB"
+            test_name=f"Parallel {kernel.title()} (up to {max_workers} procs)",
+            duration=time.time() - start_time,
+            bytes_transferred=int(sum(row["aggregate GB/s"] for row in rows) * duration * 1024 ** 3),
+            bandwidth_gbps=peak["aggregate GB/s"],
+            score=peak["aggregate GB/s"],
+            buffer_size=f"{self._buffer_label(size_mb, requested_mb)} x {max_workers}",
+            downscaled=self._downscale_note(size_mb, requested_mb),
+            details=details
         )
     
-    def memory_copy(self, size_mb: int = 100, progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
-        """Test memory copy bandwidth"""
+    def numa_test(self, size_mb: int = 100, iterations: int = 5, accesses: int = 131072,
+                  progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Node-to-node read bandwidth and load latency matrix
+        
+        For each NUMA node, a worker pinned to one of its CPUs first-touches a buffer
+        and a pointer chain (so the kernel places the pages on that node), then
+        re-pins to a CPU of every node and measures best-of-N memchr bandwidth and
+        dependent-load latency. Machines with one node get a single-cell report.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            raise RuntimeError("NUMA placement requires os.sched_setaffinity (Linux only).")
+        
+        nodes = numa_nodes()
+        # First touch needs a CPU on the node, so memory-only nodes (CXL, HBM) are left out
+        node_cpus = {node.node: node.cpus[0] for node in nodes if node.cpus}
+        memory_only = [node.node for node in nodes if not node.cpus]
+        memory_nodes = list(node_cpus)
+        
+        requested_mb = size_mb
+        size_mb = self._fit_size_mb(size_mb, copies=1.3 if has_numpy else 1.6)
         size = size_mb * 1024 * 1024
+        # The chain should reach DRAM; without NumPy it is capped to keep the build time sane
+        chain_mb = size_mb if has_numpy else min(size_mb, CHASE_MAX_MB_WITHOUT_NUMPY)
+        total_pairs = len(node_cpus) * len(memory_nodes)
         
-        # Create source array
-        source = array.array('d', [float(i) for i in range(size // 8)])
+        parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(target=_numa_worker, daemon=True,
+                                         args=(child_conn, node_cpus, memory_nodes, size,
+                                               chain_mb * 1024 * 1024, iterations, accesses))
         
-        iterations = 10
         start_time = time.time()
+        worker.start()
+        child_conn.close()
+        
+        cells = {}
+        try:
+            while len(cells) < total_pairs:
+                cpu_node, memory_node, gbps, latency, overhead = parent_conn.recv()
+                cells[(cpu_node, memory_node)] = (gbps, latency, max(0.0, latency - overhead))
+                if progress_callback:
+                    progress_callback(len(cells) / total_pairs * 100)
+        except EOFError:
+            pass
+        finally:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        
+        if len(cells) < total_pairs:
+            raise RuntimeError("NUMA worker exited without reporting every node pair.")
         
-        for iteration in range(iterations):
-            # Copy array
-            destination = array.array('d', source)
+        # sysfs distance lists are positional over the online nodes, not indexed by node id
+        distances = {node.node: node.distances for node in nodes}
+        position = {node.node: idx for idx, node in enumerate(nodes)}
+        rows = []
+        for cpu_node in node_cpus:
+            row: Dict[str, Any] = {"CPU node": f"{cpu_node} (cpu {node_cpus[cpu_node]})"}
+            for memory_node in memory_nodes:
+                row[f"mem {memory_node} GB/s"] = cells[(cpu_node, memory_node)][0]
+            for memory_node in memory_nodes:
+                row[f"mem {memory_node} ns"] = cells[(cpu_node, memory_node)][2]
+            node_distances = distances.get(cpu_node) or []
+            row["sysfs distance"] = " ".join(str(node_distances[position[m]]) for m in memory_nodes
+                                             if position[m] < len(node_distances)) or "-"
+            rows.append(row)
+        
+        local = [cells[(node, node)] for node in node_cpus]
+        remote = [cell for (cpu_node, memory_node), cell in cells.items() if cpu_node != memory_node]
+        local_gbps = sum(cell[0] for cell in local) / len(local)
+        details: Dict[str, Any] = {
+            "nodes": len(nodes),
+            "placement": "first touch",
+            "latency": f"net ns/load over {format_bytes(chain_mb * 1024 * 1024)} chain"
+        }
+        if remote:
+            remote_gbps = sum(cell[0] for cell in remote) / len(remote)
+            local_ns = sum(cell[2] for cell in local) / len(local)
+            remote_ns = sum(cell[2] for cell in remote) / len(remote)
+            details["remote/local GB/s"] = f"{remote_gbps / local_gbps:.2f}x"
+            details["remote/local ns"] = f"{remote_ns / local_ns:.2f}x" if local_ns > 0 else "-"
+        else:
+            details["topology"] = "single NUMA node (no remote memory)"
+        if memory_only:
+            details["memory-only nodes"] = ", ".join(str(node) for node in memory_only) + " (skipped: no CPU for first touch)"
+        if numa_balancing_enabled():
+            details["numa_balancing"] = "on (pages may migrate toward the reader)"
+        details["rows"] = rows
+        
+        return MemoryBenchmarkResult(
+            test_name=f"NUMA Matrix ({len(node_cpus)} node{'s' if len(node_cpus) != 1 else ''})",
+            duration=time.time() - start_time,
+            bytes_transferred=size * (iterations + 1) * total_pairs,
+            bandwidth_gbps=local_gbps,
+            score=local_gbps,
+            buffer_size=self._buffer_label(size_mb, requested_mb),
+            downscaled=self._downscale_note(size_mb, requested_mb),
+            details=details
+        )
+    
+    def _measure_mapping(self, size: int, advice: Optional[int], iterations: int,
+                         accesses: int) -> Dict[str, Any]:
+        """First-touch faults, steady read/write bandwidth and page-stride latency of one anonymous mmap"""
+        # Private, not mmap's default shared mapping: shared anonymous memory is shmem,
+        # whose huge pages follow shmem_enabled rather than madvise
+        region = mmap.mmap(-1, size, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        try:
+            if advice is not None:
+                region.madvise(advice)
+            address = ctypes.addressof(ctypes.c_char.from_buffer(region))
+            huge_before = read_anon_huge_pages()
+            
+            # First touch: every page faults in during this memset
+            faults_before = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+            start = time.perf_counter()
+            ctypes.memset(address, FILL_BYTE, size)
+            touch_time = time.perf_counter() - start
+            faults = resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults_before
+            huge_after = read_anon_huge_pages()
+            
+            # Steady state over the same, now resident, pages
+            read_times = []
+            write_times = []
+            for repeat in range(iterations + 1):
+                start = time.perf_counter()
+                region.find(READ_NEEDLE)
+                read_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                ctypes.memset(address, FILL_BYTE + repeat % 2, size)
+                write_times.append(time.perf_counter() - start)
+            
+            # Dependent loads, one per 4 KB page, so every load needs a fresh translation
+            chain = memoryview(region).cast('Q')
+            pages = size // PAGE_SIZE - 1
+            chain_start = _link_chain(chain, pages, PAGE_SIZE // 8, spread_lines=True)
+            rounds = max(1, accesses // 8)
+            chain_start = _chase(chain, chain_start, max(rounds, pages // 8))
+            latency = min(_time_chase(chain, chain_start, rounds) for _ in range(CHASE_REPEATS))
+            baseline = array.array('Q', [CHASE_PAD_SLOTS]) * (CHASE_PAD_SLOTS + 1)
+            overhead = min(_time_chase(baseline, CHASE_PAD_SLOTS, rounds) for _ in range(CHASE_REPEATS))
+            chain.release()
+            del address
+        finally:
+            region.close()
+        
+        huge = (huge_after - huge_before) if huge_before is not None and huge_after is not None else None
+        return {
+            "faults": faults,
+            "µs/fault": touch_time / faults * 1e6 if faults else None,
+            "touch GB/s": _gbps(size, touch_time),
+            "read GB/s": _gbps(size, min(read_times[1:])),
+            "write GB/s": _gbps(size, min(write_times[1:])),
+            "page net ns": max(0.0, latency - overhead),
+            "huge": format_bytes(max(0, huge)) if huge is not None else "-"
+        }
+    
+    def huge_pages_test(self, size_mb: int = 256, iterations: int = 5, accesses: int = 131072,
+                        progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Page-fault cost and steady-state performance of anonymous mmap with 4 KB pages vs THP
+        
+        Each mode maps a fresh region, madvises it (MADV_NOHUGEPAGE / MADV_HUGEPAGE),
+        and times the first-touch memset with getrusage minor-fault counts; then
+        best-of-N read/write bandwidth and a page-stride pointer chase over the same,
+        already resident, pages. Modes whose advice this platform lacks are skipped.
+        """
+        requested_mb = size_mb
+        size_mb = self._fit_size_mb(size_mb, copies=1)
+        size = size_mb * 1024 * 1024
+        modes = [(label, getattr(mmap, advice, None)) for label, advice in HUGE_PAGE_MODES]
+        
+        rows = []
+        start_time = time.time()
+        for idx, (label, advice) in enumerate(modes):
+            # Without MADV_NOHUGEPAGE the baseline runs with default pages; without MADV_HUGEPAGE THP is skipped
+            if advice is None and idx > 0:
+                rows.append({"pages": label, "faults": None, "µs/fault": None, "touch GB/s": None,
+                             "read GB/s": None, "write GB/s": None, "page net ns": None, "huge": "-"})
+            else:
+                rows.append({"pages": label, **self._measure_mapping(size, advice, iterations, accesses)})
             
             if progress_callback:
-                progress = ((iteration + 1) / iterations) * 100
-                progress_callback(progress)
+                progress_callback((idx + 1) / len(modes) * 100)
         
-        duration = time.time() - start_time
-        # Copy involves read + write
-        bytes_transferred = size * iterations * 2
-        bandwidth_gbps = (bytes_transferred / (1024 ** 3)) / duration
-        score = bandwidth_gbps
+        details: Dict[str, Any] = {}
+        thp = transparent_hugepage_mode()
+        details["THP enabled"] = thp.get("enabled", "not available")
+        if "defrag" in thp:
+            details["THP defrag"] = thp["defrag"]
+        base, huge = rows[0], rows[-1]
+        if huge["touch GB/s"] is not None and huge is not base:
+            details["THP first touch"] = f"{huge['touch GB/s'] / base['touch GB/s']:.2f}x"
+            if base["page net ns"] > 0:
+                details["THP page-stride latency"] = f"{huge['page net ns'] / base['page net ns']:.2f}x"
+        else:
+            details["THP"] = "madvise(MADV_HUGEPAGE) not available"
+        details["rows"] = rows
         
+        measured = [row for row in rows if row["touch GB/s"] is not None]
+        best = max(measured, key=lambda row: row["touch GB/s"])
         return MemoryBenchmarkResult(
-            test_name="Memory Copy",
-            duration=duration,
-            bytes_transferred=bytes_transferred,
-            bandwidth_gbps=bandwidth_gbps,
-            score=score,
-            buffer_size=f"{size_mb} MB"
+            test_name=f"Page Faults & THP ({best['pages']} fastest)",
+            duration=time.time() - start_time,
+            bytes_transferred=size * (2 * iterations + 3) * len(measured),
+            bandwidth_gbps=best["touch GB/s"],
+            score=best["touch GB/s"],
+            buffer_size=self._buffer_label(size_mb, requested_mb),
+            downscaled=self._downscale_note(size_mb, requested_mb),
+            details=details
+        )
+    
+    def stride_sweep_test(self, size_mb: int = 100, iterations: int = 5,
+                          progress_callback: Optional[Callable] = None) -> MemoryBenchmarkResult:
+        """Strided read over a buffer larger than the LLC, strides 8 B to 64 KB (best of N per stride)
+        
+        Each pass is one bytearray extended slice, whose C loop gathers one byte
+        per stride. Strides with few elements take several passes per sample, each
+        shifted by a cache line so no pass re-reads lines of the one before.
+        "effective GB/s" counts the cache lines the pattern pulls in (64 B per
+        element once the stride reaches a line).
+        """
+        requested_mb = size_mb
+        llc = self.caches[-1].size if self.caches else 0
+        wanted_mb = max(size_mb, -(-STRIDE_LLC_MULTIPLE * llc // (1024 * 1024)))
+        size_mb = self._fit_size_mb(wanted_mb, copies=1)
+        size = size_mb * 1024 * 1024
+        
+        setup = self._begin_setup()
+        buffer = _make_buffer(size)
+        setup_info = self._end_setup(setup)
+        
+        rows = []
+        total_time = 0.0
+        total_bytes = 0
+        span = 100.0 / len(STRIDES)
+        for idx, stride in enumerate(STRIDES):
+            elements = size // stride
+            passes = max(1, STRIDE_SAMPLE_ELEMENTS // elements)
+            offsets = max(1, stride // CACHE_LINE)
+            pass_counter = iter(range(1 << 62))
+            
+            def strided_sample():
+                for _ in range(passes):
+                    offset = next(pass_counter) % offsets * CACHE_LINE
+                    buffer[offset::stride]
+            
+            times, elapsed = self._best_of(strided_sample, iterations, progress_callback,
+                                           progress_base=idx * span, progress_span=span)
+            # Below a line per element every line is pulled in; above it, one line per element
+            sample_bytes = passes * (size if stride < CACHE_LINE else elements * CACHE_LINE)
+            total_time += elapsed
+            total_bytes += sample_bytes * (iterations + 1)
+            rows.append({
+                "stride": format_bytes(stride),
+                "elements": elements,
+                "ns/element": min(times) / (elements * passes) * 1e9,
+                "effective GB/s": _gbps(sample_bytes, min(times))
+            })
+        
+        details: Dict[str, Any] = {"kernel": "bytearray[::stride]", "best of": iterations}
+        if llc:
+            details["vs LLC"] = f"{size / llc:.1f}x {format_bytes(llc)}"
+        details.update(setup_info)
+        steps = _find_boundaries(STRIDES, [row["ns/element"] for row in rows], 0.0)
+        details["ns/element steps after"] = ", ".join(f"{format_bytes(stride)} (+{rise:.1f} ns)"
+                                                       for stride, rise in steps) or "none"
+        details["rows"] = rows
+        
+        sequential = rows[0]["effective GB/s"]
+        return MemoryBenchmarkResult(
+            test_name="Stride Sweep (8 B - 64 KB)",
+            duration=total_time,
+            bytes_transferred=total_bytes,
+            bandwidth_gbps=sequential,
+            score=sequential,
+            buffer_size=self._buffer_label(size_mb, max(requested_mb, wanted_mb)),
+            downscaled=self._downscale_note(size_mb, max(requested_mb, wanted_mb)),
+            details=details
         )
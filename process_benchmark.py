@@ -0,0 +1,206 @@
+"""
+Process and Thread Creation Benchmarking Module
+Provides fork, exec, multiprocessing start-method, pool startup and thread latency testing
+"""
+
+import os
+import sys
+import time
+import shutil
+import threading
+import subprocess
+import multiprocessing
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_utils import latency_summary
+from resources import detect_resources
+from telemetry import TelemetrySummary
+
+
+def _noop(*args) -> None:
+    """Target for spawned processes/threads and pool tasks"""
+    return None
+
+
+@dataclass
+class ProcessBenchmarkResult:
+    """Results from a process/thread creation benchmark test"""
+    test_name: str
+    duration: float
+    operations: int
+    ops_per_second: float
+    p50_ms: float
+    p99_ms: float
+    score: float
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+
+class ProcessBenchmark:
+    """Process and thread creation benchmarking tool"""
+    
+    def __init__(self):
+        """Initialize process benchmark"""
+        self.resources = detect_resources()
+        self.has_fork = hasattr(os, "fork")
+        self.start_methods = multiprocessing.get_all_start_methods()
+        self.true_binary = shutil.which("true") or sys.executable
+    
+    def _measure(self, create: Callable[[], None], duration: float, max_iterations: int,
+                 progress_callback: Optional[Callable] = None, progress_base: float = 0.0,
+                 progress_span: float = 100.0) -> List[float]:
+        """Time create() repeatedly until the time budget or iteration cap is reached"""
+        samples = []
+        start_time = time.perf_counter()
+        end_time = start_time + duration
+        while len(samples) < max_iterations:
+            start = time.perf_counter()
+            create()
+            samples.append(time.perf_counter() - start)
+            now = time.perf_counter()
+            if progress_callback and len(samples) % 10 == 0:
+                fraction = min((now - start_time) / duration, 1.0)
+                progress_callback(progress_base + fraction * progress_span)
+            if now >= end_time and len(samples) >= 3:
+                break
+        return samples
+    
+    def _result(self, test_name: str, samples: List[float], duration: float, score_scale: float,
+                details: Optional[Dict[str, Any]] = None) -> ProcessBenchmarkResult:
+        """Build a result from latency samples (seconds)"""
+        summary = latency_summary(samples, scale=1000)
+        rate = len(samples) / sum(samples) if samples else 0.0
+        return ProcessBenchmarkResult(
+            test_name=test_name,
+            duration=duration,
+            operations=len(samples),
+            ops_per_second=rate,
+            p50_ms=summary["p50"],
+            p99_ms=summary["p99"],
+            score=rate / score_scale,  # Normalize score
+            details=details
+        )
+    
+    def fork_test(self, duration: float = 5.0, max_iterations: int = 5000,
+                  progress_callback: Optional[Callable] = None) -> ProcessBenchmarkResult:
+        """Test os.fork() + child exit + waitpid latency"""
+        if not self.has_fork:
+            raise RuntimeError("os.fork is not available on this platform.")
+        
+        def fork_and_wait():
+            pid = os.fork()
+            if pid == 0:
+                os._exit(0)
+            os.waitpid(pid, 0)
+        
+        start_time = time.time()
+        samples = self._measure(fork_and_wait, duration, max_iterations, progress_callback)
+        return self._result("Fork + Exit", samples, time.time() - start_time, score_scale=100)
+    
+    def exec_test(self, duration: float = 5.0, max_iterations: int = 2000,
+                  progress_callback: Optional[Callable] = None) -> ProcessBenchmarkResult:
+        """Test subprocess exec of a trivial binary (fork/posix_spawn + exec + wait)"""
+        binary = self.true_binary
+        args = [binary] if binary != sys.executable else [binary, "-c", "pass"]
+        
+        start_time = time.time()
+        samples = self._measure(lambda: subprocess.run(args, check=True), duration, max_iterations, progress_callback)
+        return self._result("Subprocess Exec", samples, time.time() - start_time, score_scale=10,
+                            details={"binary": os.path.basename(binary)})
+    
+    def start_method_test(self, duration: float = 5.0, max_iterations: int = 500,
+                          progress_callback: Optional[Callable] = None) -> ProcessBenchmarkResult:
+        """Test multiprocessing.Process start + join latency under each start method
+        
+        The headline numbers are for the platform default method; every method gets a details row.
+        """
+        default_method = multiprocessing.get_start_method(allow_none=True) or self.start_methods[0]
+        per_method = duration / len(self.start_methods)
+        rows = []
+        default_samples = []
+        start_time = time.time()
+        
+        for idx, method in enumerate(self.start_methods):
+            context = multiprocessing.get_context(method)
+            
+            def start_and_join():
+                process = context.Process(target=_noop)
+                process.start()
+                process.join()
+            
+            # The first start of forkserver pays for launching the server itself
+            start_and_join()
+            span = 100.0 / len(self.start_methods)
+            samples = self._measure(start_and_join, per_method, max_iterations, progress_callback,
+                                    progress_base=idx * span, progress_span=span)
+            summary = latency_summary(samples, scale=1000)
+            rows.append({
+                "start method": method,
+                "count": len(samples),
+                "p50 ms": summary["p50"],
+                "p90 ms": summary["p90"],
+                "p99 ms": summary["p99"],
+                "rate/sec": len(samples) / sum(samples)
+            })
+            if method == default_method:
+                default_samples = samples
+        
+        return self._result(f"Process Start ({default_method})", default_samples, time.time() - start_time,
+                            score_scale=10, details={"latency": "start + join", "rows": rows})
+    
+    def pool_startup_test(self, duration: float = 5.0, workers: Optional[int] = None,
+                          progress_callback: Optional[Callable] = None) -> ProcessBenchmarkResult:
+        """Test multiprocessing.Pool construction time for N workers under each start method
+        
+        Timing covers construction until every worker has completed one task (shutdown is
+        reported separately). Headline numbers are for the platform default method.
+        """
+        default_method = multiprocessing.get_start_method(allow_none=True) or self.start_methods[0]
+        workers = workers or self.resources.effective_cpus
+        per_method = duration / len(self.start_methods)
+        rows = []
+        default_samples = []
+        start_time = time.time()
+        
+        for idx, method in enumerate(self.start_methods):
+            context = multiprocessing.get_context(method)
+            ready_samples = []
+            
+            def build_pool():
+                start = time.perf_counter()
+                with context.Pool(workers) as pool:
+                    pool.map(_noop, range(workers), chunksize=1)
+                    ready_samples.append(time.perf_counter() - start)
+            
+            build_pool()  # Warm up (forkserver launch, import caches)
+            ready_samples.clear()
+            span = 100.0 / len(self.start_methods)
+            samples = self._measure(build_pool, per_method, 50, progress_callback,
+                                    progress_base=idx * span, progress_span=span)
+            ready = latency_summary(ready_samples, scale=1000)
+            total = latency_summary(samples, scale=1000)
+            rows.append({
+                "start method": method,
+                "count": len(samples),
+                "ready p50 ms": ready["p50"],
+                "ready p99 ms": ready["p99"],
+                "with shutdown p50 ms": total["p50"]
+            })
+            if method == default_method:
+                default_samples = list(ready_samples)
+        
+        return self._result(f"Pool Startup ({default_method}, {workers} workers)", default_samples,
+                            time.time() - start_time, score_scale=1, details={"workers": workers, "rows": rows})
+    
+    def thread_test(self, duration: float = 5.0, max_iterations: int = 100000,
+                    progress_callback: Optional[Callable] = None) -> ProcessBenchmarkResult:
+        """Test threading.Thread start + join latency"""
+        def start_and_join():
+            thread = threading.Thread(target=_noop)
+            thread.start()
+            thread.join()
+        
+        start_time = time.time()
+        samples = self._measure(start_and_join, duration, max_iterations, progress_callback)
+        return self._result("Thread Start/Join", samples, time.time() - start_time, score_scale=1000)
@@ -0,0 +1,296 @@
+"""
+Resource Detection Module
+Effective CPU and memory budget from cgroup v1/v2 limits, CPU affinity and /proc/meminfo,
+buffer sizing against that budget, plus this process's RSS, peak RSS and transparent
+huge page state
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from bench_utils import format_bytes, read_text
+
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+THP_ROOT = "/sys/kernel/mm/transparent_hugepage"
+
+# cgroup v1 reports "unlimited" memory as a huge page-aligned number
+_V1_UNLIMITED = 1 << 60
+
+# Fraction of usable memory (MemAvailable / cgroup headroom) a test may occupy; checked
+# before every test, since earlier tests and other processes change what is available
+MEMORY_BUDGET_FRACTION = 0.5
+
+
+@dataclass
+class ResourceLimits:
+    """CPU and memory budget available to this process"""
+    logical_cpus: int
+    affinity_cpus: int
+    effective_cpus: int
+    cpu_quota: Optional[float] = None
+    memory_total: Optional[int] = None
+    memory_available: Optional[int] = None
+    memory_limit: Optional[int] = None
+    memory_usage: Optional[int] = None
+    cgroup_version: Optional[int] = None
+    
+    def usable_memory(self) -> Optional[int]:
+        """Bytes that can be allocated without hitting MemAvailable or the cgroup limit"""
+        candidates = []
+        if self.memory_available is not None:
+            candidates.append(self.memory_available)
+        if self.memory_limit is not None:
+            candidates.append(max(0, self.memory_limit - (self.memory_usage or 0)))
+        return min(candidates) if candidates else None
+    
+    def describe(self) -> str:
+        """One-line summary for display"""
+        cpu_parts = []
+        if self.cpu_quota is not None:
+            cpu_parts.append(f"quota {self.cpu_quota:.1f}")
+        cpu_parts.append(f"affinity {self.affinity_cpus}/{self.logical_cpus}")
+        cpu = f"{self.effective_cpus} CPUs ({', '.join(cpu_parts)})"
+        memory = f"{format_bytes(self.memory_limit)} limit" if self.memory_limit is not None else "no memory limit"
+        usable = self.usable_memory()
+        if usable is not None:
+            memory += f", {format_bytes(usable)} usable"
+        return f"{cpu}, {memory}"
+
+
+@dataclass
+class MemoryPlan:
+    """Buffer size a test runs with after the memory budget check"""
+    requested_mb: int
+    size_mb: int
+    passes: int = 1
+    usable: Optional[int] = None
+    llc_size: int = 0
+    
+    @property
+    def label(self) -> str:
+        """Buffer size label, noting when the requested size was capped or streamed"""
+        if self.passes > 1:
+            return f"{self.size_mb} MB x {self.passes} passes (streamed, {self.requested_mb} MB requested)"
+        if self.size_mb < self.requested_mb:
+            return f"{self.size_mb} MB (capped from {self.requested_mb} MB)"
+        return f"{self.size_mb} MB"
+    
+    @property
+    def note(self) -> Optional[str]:
+        """Why and how the test was downscaled (None when it runs at the requested size)"""
+        if self.passes == 1 and self.size_mb >= self.requested_mb:
+            return None
+        budget = (f"{self.requested_mb} MB does not fit in {MEMORY_BUDGET_FRACTION:.0%} of "
+                  f"{format_bytes(self.usable or 0)} usable")
+        if self.passes > 1:
+            note = f"{budget}, streamed as {self.passes} passes over {self.size_mb} MB"
+        else:
+            note = f"{budget}, capped to {self.size_mb} MB"
+        if self.size_mb * 1024 * 1024 < self.llc_size:
+            note += f" (below the {format_bytes(self.llc_size)} LLC, so partly cache-resident)"
+        return note
+
+
+def plan_memory(size_mb: int, usable: Optional[int], copies: float = 1, streamed: bool = False,
+                llc_size: int = 0) -> MemoryPlan:
+    """Fit `copies` live buffers of size_mb into MEMORY_BUDGET_FRACTION of usable bytes
+    
+    A request that does not fit is capped; with streamed=True it instead makes
+    several passes over a smaller working buffer, so each timed call still moves
+    the requested number of bytes.
+    """
+    if usable is None:
+        return MemoryPlan(size_mb, size_mb)
+    max_mb = max(1, int(usable * MEMORY_BUDGET_FRACTION / copies / (1024 * 1024)))
+    if size_mb <= max_mb:
+        return MemoryPlan(size_mb, size_mb, usable=usable, llc_size=llc_size)
+    if not streamed:
+        return MemoryPlan(size_mb, max_mb, usable=usable, llc_size=llc_size)
+    passes = -(-size_mb // max_mb)
+    return MemoryPlan(size_mb, -(-size_mb // passes), passes, usable, llc_size)
+
+
+def _cgroup_paths() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return (v2 path, v1 cpu path, v1 memory path) from /proc/self/cgroup"""
+    text = read_text("/proc/self/cgroup")
+    if not text:
+        return None, None, None
+    v2_path = v1_cpu = v1_memory = None
+    for line in text.splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        _, controllers, path = parts
+        if controllers == "":
+            v2_path = path
+        for controller in controllers.split(","):
+            if controller == "cpu":
+                v1_cpu = path
+            elif controller == "memory":
+                v1_memory = path
+    return v2_path, v1_cpu, v1_memory
+
+
+def _candidate_dirs(mount: str, path: str):
+    """cgroup directories from this process's group up to the root (most specific first)
+    
+    Inside containers the cgroup namespace usually makes the mount itself
+    the process's group, so the mount root is always included last.
+    """
+    path = path.strip("/")
+    while path:
+        yield os.path.join(mount, path)
+        path = os.path.dirname(path)
+    yield mount
+
+
+def _tighter_memory(current: Tuple[Optional[int], Optional[int]], limit: int,
+                    usage: Optional[int]) -> Tuple[Optional[int], Optional[int]]:
+    """(limit, usage) of whichever cgroup level leaves less headroom
+    
+    Usage is read from the same directory as its limit: a limit set on a parent
+    (e.g. a Kubernetes pod) is shared with sibling groups, whose usage counts too.
+    """
+    current_limit, current_usage = current
+    if current_limit is not None and current_limit - (current_usage or 0) <= limit - (usage or 0):
+        return current
+    return limit, usage
+
+
+def _read_v2_limits(path: str) -> Tuple[Optional[float], Optional[int], Optional[int]]:
+    """Most restrictive cpu.max quota (CPUs) and memory.max headroom along the v2 hierarchy
+    
+    Returns (quota, memory limit, memory usage), the last two from the level with
+    the least memory.max - memory.current.
+    """
+    quota = None
+    memory = (None, None)
+    for directory in _candidate_dirs(CGROUP_ROOT, path):
+        cpu_max = read_text(os.path.join(directory, "cpu.max"))
+        if cpu_max:
+            fields = cpu_max.split()
+            if fields[0] != "max" and len(fields) == 2:
+                cpus = int(fields[0]) / int(fields[1])
+                quota = cpus if quota is None else min(quota, cpus)
+        mem_max = read_text(os.path.join(directory, "memory.max"))
+        if mem_max and mem_max != "max":
+            current = read_text(os.path.join(directory, "memory.current"))
+            memory = _tighter_memory(memory, int(mem_max), int(current) if current else None)
+    return (quota, *memory)
+
+
+def _read_v1_limits(cpu_path: Optional[str], memory_path: Optional[str]) -> Tuple[Optional[float], Optional[int], Optional[int]]:
+    """CFS quota (CPUs) and memory.limit_in_bytes headroom from the v1 hierarchy (as _read_v2_limits)"""
+    quota = None
+    memory = (None, None)
+    if cpu_path is not None:
+        for mount in ("cpu,cpuacct", "cpu"):
+            for directory in _candidate_dirs(os.path.join(CGROUP_ROOT, mount), cpu_path):
+                quota_us = read_text(os.path.join(directory, "cpu.cfs_quota_us"))
+                period_us = read_text(os.path.join(directory, "cpu.cfs_period_us"))
+                if quota_us and period_us and int(quota_us) > 0:
+                    cpus = int(quota_us) / int(period_us)
+                    quota = cpus if quota is None else min(quota, cpus)
+    if memory_path is not None:
+        for directory in _candidate_dirs(os.path.join(CGROUP_ROOT, "memory"), memory_path):
+            limit = read_text(os.path.join(directory, "memory.limit_in_bytes"))
+            if limit and int(limit) < _V1_UNLIMITED:
+                usage = read_text(os.path.join(directory, "memory.usage_in_bytes"))
+                memory = _tighter_memory(memory, int(limit), int(usage) if usage else None)
+    return (quota, *memory)
+
+
+def read_meminfo() -> Tuple[Optional[int], Optional[int]]:
+    """(MemTotal, MemAvailable) in bytes from /proc/meminfo"""
+    text = read_text("/proc/meminfo")
+    if not text:
+        return None, None
+    values = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        fields = rest.split()
+        if fields:
+            values[key] = int(fields[0]) * 1024
+    return values.get("MemTotal"), values.get("MemAvailable")
+
+
+def read_process_memory() -> Tuple[Optional[int], Optional[int]]:
+    """(VmRSS, VmHWM) of this process in bytes from /proc/self/status"""
+    text = read_text("/proc/self/status")
+    if not text:
+        return None, None
+    values = {}
+    for line in text.splitlines():
+        key, _, rest = line.partition(":")
+        fields = rest.split()
+        if key in ("VmRSS", "VmHWM") and fields:
+            values[key] = int(fields[0]) * 1024
+    return values.get("VmRSS"), values.get("VmHWM")
+
+
+def reset_peak_rss() -> bool:
+    """Reset VmHWM to the current RSS (Linux 4.0+); False if unsupported"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def read_anon_huge_pages() -> Optional[int]:
+    """Bytes of this process's anonymous memory backed by transparent huge pages"""
+    text = read_text("/proc/self/smaps_rollup")
+    if not text:
+        return None
+    for line in text.splitlines():
+        if line.startswith("AnonHugePages:"):
+            return int(line.split()[1]) * 1024
+    return None
+
+
+def transparent_hugepage_mode() -> Dict[str, str]:
+    """Selected THP 'enabled' and 'defrag' modes (the [bracketed] choice in sysfs)"""
+    modes = {}
+    for name in ("enabled", "defrag"):
+        text = read_text(os.path.join(THP_ROOT, name))
+        if text and "[" in text:
+            modes[name] = text[text.index("[") + 1:text.index("]")]
+    return modes
+
+
+def detect_resources() -> ResourceLimits:
+    """Detect the effective CPU and memory budget for this process"""
+    logical = os.cpu_count() or 1
+    affinity = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else logical
+    
+    quota = memory_limit = memory_usage = None
+    cgroup_version = None
+    v2_path, v1_cpu, v1_memory = _cgroup_paths()
+    if v2_path is not None and os.path.exists(os.path.join(CGROUP_ROOT, "cgroup.controllers")):
+        cgroup_version = 2
+        quota, memory_limit, memory_usage = _read_v2_limits(v2_path)
+    elif v1_cpu is not None or v1_memory is not None:
+        cgroup_version = 1
+        quota, memory_limit, memory_usage = _read_v1_limits(v1_cpu, v1_memory)
+    
+    effective = affinity
+    if quota is not None:
+        effective = max(1, min(affinity, math.ceil(quota)))
+    
+    memory_total, memory_available = read_meminfo()
+    
+    return ResourceLimits(
+        logical_cpus=logical,
+        affinity_cpus=affinity,
+        effective_cpus=effective,
+        cpu_quota=quota,
+        memory_total=memory_total,
+        memory_available=memory_available,
+        memory_limit=memory_limit,
+        memory_usage=memory_usage,
+        cgroup_version=cgroup_version
+    )
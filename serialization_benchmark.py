@@ -0,0 +1,232 @@
+"""
+Serialization Performance Benchmarking Module
+Provides pickle, json, marshal and struct round-trip throughput testing
+"""
+
+import time
+import json
+import pickle
+import marshal
+import struct
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bench_utils import geometric_mean
+from telemetry import TelemetrySummary
+
+
+# === Payload generators ===
+# Deterministic, representative payloads shared with other benchmark modules
+# (e.g. IPC message bodies). Each returns (payload, object_count).
+
+def make_flat_dict(num_keys: int = 1000, seed: int = 42) -> Tuple[Dict[str, Any], int]:
+    """Flat str-keyed dict with int/float/str values (config blobs, cache entries)"""
+    rng = random.Random(seed)
+    payload = {}
+    for i in range(num_keys):
+        kind = i % 3
+        if kind == 0:
+            payload[f"field_{i}"] = rng.randint(0, 1 << 30)
+        elif kind == 1:
+            payload[f"field_{i}"] = rng.random()
+        else:
+            payload[f"field_{i}"] = f"value-{rng.randint(0, 99999):05d}"
+    return payload, num_keys
+
+
+def make_nested_records(num_records: int = 1000, seed: int = 42) -> Tuple[List[Dict[str, Any]], int]:
+    """List of nested records (RPC responses, ORM rows)"""
+    rng = random.Random(seed)
+    payload = []
+    for i in range(num_records):
+        payload.append({
+            "id": i,
+            "name": f"user_{rng.randint(0, 999999):06d}",
+            "score": rng.random() * 100,
+            "active": bool(i % 2),
+            "tags": [f"tag{rng.randint(0, 50)}" for _ in range(3)],
+            "attrs": {"region": f"r{i % 8}", "tier": i % 4, "weight": rng.random()},
+        })
+    return payload, num_records
+
+
+def make_float_list(num_floats: int = 100000, seed: int = 42) -> Tuple[List[float], int]:
+    """Large list of floats (metrics, feature vectors)"""
+    rng = random.Random(seed)
+    return [rng.random() for _ in range(num_floats)], num_floats
+
+
+def make_bytes_blob(size: int = 1024 * 1024, seed: int = 42) -> Tuple[bytes, int]:
+    """Opaque bytes blob (images, compressed chunks)"""
+    rng = random.Random(seed)
+    return rng.getrandbits(size * 8).to_bytes(size, "little"), 1
+
+
+PAYLOAD_GENERATORS = {
+    "flat_dict": make_flat_dict,
+    "nested_records": make_nested_records,
+    "float_list": make_float_list,
+    "bytes_blob": make_bytes_blob,
+}
+
+
+def make_payloads() -> Dict[str, Tuple[Any, int]]:
+    """Build every standard payload with its default size"""
+    return {name: generator() for name, generator in PAYLOAD_GENERATORS.items()}
+
+
+# === struct codecs ===
+# struct only handles fixed layouts, so it covers the payloads with a fixed
+# schema: the float list, the bytes blob and the fixed-width record fields.
+
+_RECORD_STRUCT = struct.Struct("<i16sd?")
+
+
+def _struct_codec(name: str, payload: Any) -> Optional[Tuple[Callable, Callable]]:
+    """Return (encode, decode) struct functions for a payload, or None if unsupported"""
+    if name == "float_list":
+        layout = struct.Struct(f"<{len(payload)}d")
+        return (lambda p: layout.pack(*p)), (lambda b: list(layout.unpack(b)))
+    if name == "bytes_blob":
+        return (lambda p: struct.pack("<I", len(p)) + p), (lambda b: b[4:4 + struct.unpack_from("<I", b)[0]])
+    if name == "nested_records":
+        def encode(records):
+            return b"".join(_RECORD_STRUCT.pack(r["id"], r["name"].encode(), r["score"], r["active"]) for r in records)
+        
+        def decode(data):
+            return [{"id": i, "name": n.rstrip(b"\0").decode(), "score": s, "active": a}
+                    for i, n, s, a in _RECORD_STRUCT.iter_unpack(data)]
+        return encode, decode
+    return None
+
+
+@dataclass
+class SerializationBenchmarkResult:
+    """Results from a serialization benchmark test"""
+    test_name: str
+    duration: float
+    operations: int
+    ops_per_second: float
+    encode_mbps: float
+    decode_mbps: float
+    score: float
+    details: Optional[Dict[str, Any]] = None
+    telemetry: Optional[TelemetrySummary] = None
+
+
+class SerializationBenchmark:
+    """Serialization performance benchmarking tool"""
+    
+    def __init__(self):
+        """Initialize serialization benchmark"""
+        self._payloads = None
+    
+    @property
+    def payloads(self) -> Dict[str, Tuple[Any, int]]:
+        """Standard payloads, generated once on first use"""
+        if self._payloads is None:
+            self._payloads = make_payloads()
+        return self._payloads
+    
+    def _time_calls(self, func: Callable, arg: Any, budget: float) -> Tuple[int, float]:
+        """Call func(arg) repeatedly for at least `budget` seconds"""
+        calls = 0
+        batch = 1
+        start = time.perf_counter()
+        while True:
+            for _ in range(batch):
+                func(arg)
+            calls += batch
+            elapsed = time.perf_counter() - start
+            if elapsed >= budget:
+                return calls, elapsed
+            batch = min(batch * 2, 1024)
+    
+    def _run_codecs(self, test_name: str, codecs: Dict[str, Callable[[str, Any], Optional[Tuple[Callable, Callable]]]],
+                    duration: float, progress_callback: Optional[Callable]) -> SerializationBenchmarkResult:
+        """Round-trip every payload through each codec and collect per-pair rates"""
+        pairs = []
+        for codec_name, factory in codecs.items():
+            for payload_name, (payload, objects) in self.payloads.items():
+                funcs = factory(payload_name, payload)
+                if funcs is not None:
+                    pairs.append((codec_name, payload_name, payload, objects, funcs))
+        
+        # Half the budget each for encode and decode
+        budget = max(duration / (len(pairs) * 2), 0.01)
+        
+        rows = []
+        encode_rates, decode_rates, object_rates = [], [], []
+        operations = 0
+        start_time = time.time()
+        
+        for idx, (codec_name, payload_name, payload, objects, (encode, decode)) in enumerate(pairs):
+            encoded = encode(payload)
+            size_mb = len(encoded) / (1024 * 1024)
+            
+            enc_calls, enc_time = self._time_calls(encode, payload, budget)
+            dec_calls, dec_time = self._time_calls(decode, encoded, budget)
+            
+            encode_mbps = enc_calls * size_mb / enc_time
+            decode_mbps = dec_calls * size_mb / dec_time
+            # Objects per second for a full encode + decode round trip
+            objects_per_second = objects / (enc_time / enc_calls + dec_time / dec_calls)
+            
+            rows.append({
+                "codec": codec_name,
+                "payload": payload_name,
+                "size": f"{len(encoded) / 1024:.0f} KB",
+                "encode MB/s": encode_mbps,
+                "decode MB/s": decode_mbps,
+                "objects/sec": objects_per_second
+            })
+            encode_rates.append(encode_mbps)
+            decode_rates.append(decode_mbps)
+            object_rates.append(objects_per_second)
+            operations += enc_calls + dec_calls
+            
+            if progress_callback:
+                progress_callback((idx + 1) / len(pairs) * 100)
+        
+        actual_duration = time.time() - start_time
+        encode_mbps = geometric_mean(encode_rates)
+        decode_mbps = geometric_mean(decode_rates)
+        score = geometric_mean([encode_mbps, decode_mbps]) / 10  # Normalize score
+        
+        return SerializationBenchmarkResult(
+            test_name=test_name,
+            duration=actual_duration,
+            operations=operations,
+            ops_per_second=geometric_mean(object_rates),
+            encode_mbps=encode_mbps,
+            decode_mbps=decode_mbps,
+            score=score,
+            details={"rows": rows}
+        )
+    
+    def pickle_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> SerializationBenchmarkResult:
+        """Test pickle round-trip throughput for every protocol"""
+        codecs = {}
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            codecs[f"pickle-{protocol}"] = (
+                lambda name, payload, _p=protocol: (lambda obj: pickle.dumps(obj, protocol=_p), pickle.loads)
+            )
+        return self._run_codecs("Pickle", codecs, duration, progress_callback)
+    
+    def json_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> SerializationBenchmarkResult:
+        """Test json round-trip throughput (bytes payloads are not JSON-serializable and are skipped)"""
+        codecs = {
+            "json": lambda name, payload: None if isinstance(payload, bytes) else (json.dumps, json.loads)
+        }
+        return self._run_codecs("JSON", codecs, duration, progress_callback)
+    
+    def marshal_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> SerializationBenchmarkResult:
+        """Test marshal round-trip throughput"""
+        codecs = {"marshal": lambda name, payload: (marshal.dumps, marshal.loads)}
+        return self._run_codecs("Marshal", codecs, duration, progress_callback)
+    
+    def struct_test(self, duration: float = 5.0, progress_callback: Optional[Callable] = None) -> SerializationBenchmarkResult:
+        """Test struct pack/unpack throughput for fixed-layout payloads"""
+        codecs = {"struct": _struct_codec}
+        return self._run_codecs("Struct", codecs, duration, progress_callback)
@@ -0,0 +1,200 @@
+"""
+Hardware Telemetry Module
+Background sampling of CPU temperature, frequency and throttle counters (Linux sysfs)
+"""
+
+import glob
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from bench_utils import read_text
+
+
+# Thermal zone types that report the CPU package/die temperature
+CPU_THERMAL_TYPES = ("x86_pkg_temp", "cpu", "cpu-thermal", "cpu_thermal", "soc_thermal", "tcpu")
+
+# hwmon drivers that expose CPU temperatures
+CPU_HWMON_NAMES = ("coretemp", "k10temp", "zenpower", "cpu_thermal", "soc_thermal")
+
+
+@dataclass
+class TelemetrySummary:
+    """Telemetry collected while a test was running"""
+    samples: int
+    interval: float
+    temp_min: Optional[float] = None
+    temp_avg: Optional[float] = None
+    temp_max: Optional[float] = None
+    freq_min_mhz: Optional[float] = None
+    freq_avg_mhz: Optional[float] = None
+    freq_max_mhz: Optional[float] = None
+    throttle_events: Optional[int] = None
+    timestamps: List[float] = field(default_factory=list)
+    temp_series: List[Optional[float]] = field(default_factory=list)
+    freq_series_mhz: List[Optional[float]] = field(default_factory=list)
+    
+    def has_data(self) -> bool:
+        """True if any temperature or frequency source was readable"""
+        return self.temp_max is not None or self.freq_max_mhz is not None
+
+
+def _read_number(path: str) -> Optional[float]:
+    """Read a single numeric sysfs value"""
+    try:
+        with open(path) as f:
+            return float(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def find_temperature_sources() -> List[str]:
+    """Find sysfs files reporting CPU temperature in millidegrees C"""
+    sources = []
+    for zone in sorted(glob.glob("/sys/class/thermal/thermal_zone*")):
+        zone_type = (read_text(os.path.join(zone, "type")) or "").lower()
+        temp_path = os.path.join(zone, "temp")
+        if zone_type in CPU_THERMAL_TYPES and os.path.exists(temp_path):
+            sources.append(temp_path)
+    
+    for hwmon in sorted(glob.glob("/sys/class/hwmon/hwmon*")):
+        if (read_text(os.path.join(hwmon, "name")) or "").lower() in CPU_HWMON_NAMES:
+            sources.extend(sorted(glob.glob(os.path.join(hwmon, "temp*_input"))))
+    
+    # No fallback to unlabelled zones (board, wifi, battery, GPU): with no CPU sensor
+    # the temperature is reported as unavailable
+    return sources
+
+
+def find_frequency_sources() -> List[str]:
+    """Find per-CPU current frequency files (kHz)"""
+    return sorted(glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq"))
+
+
+def find_throttle_sources() -> List[str]:
+    """Find per-CPU thermal throttle event counters"""
+    return sorted(glob.glob("/sys/devices/system/cpu/cpu[0-9]*/thermal_throttle/*_throttle_count"))
+
+
+def read_cpu_temperature(sources: Optional[List[str]] = None) -> Optional[float]:
+    """Current (hottest) CPU temperature in degrees C, or None if unavailable"""
+    readings = [_read_number(path) for path in (sources if sources is not None else find_temperature_sources())]
+    readings = [value / 1000.0 for value in readings if value is not None and value > 0]
+    return max(readings) if readings else None
+
+
+def read_cpu_frequency(sources: Optional[List[str]] = None) -> Optional[float]:
+    """Average current CPU frequency in MHz, or None if unavailable"""
+    readings = [_read_number(path) for path in (sources if sources is not None else find_frequency_sources())]
+    readings = [value for value in readings if value is not None]
+    return (sum(readings) / len(readings)) / 1000.0 if readings else None
+
+
+def read_throttle_count(sources: Optional[List[str]] = None) -> Optional[int]:
+    """Total thermal throttle events across all CPUs, or None if unavailable"""
+    counts = [_read_number(path) for path in (sources if sources is not None else find_throttle_sources())]
+    counts = [value for value in counts if value is not None]
+    return int(sum(counts)) if counts else None
+
+
+class TelemetrySampler:
+    """Low-overhead background sampler for temperature, frequency and throttling
+    
+    Usage:
+        sampler = TelemetrySampler(interval=0.5)
+        sampler.start()
+        ... run test ...
+        summary = sampler.stop()
+    """
+    
+    def __init__(self, interval: float = 0.5):
+        """
+        Initialize telemetry sampler
+        
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.temp_sources = find_temperature_sources()
+        self.freq_sources = find_frequency_sources()
+        self.throttle_sources = find_throttle_sources()
+        
+        self._timestamps: List[float] = []
+        self._temps: List[Optional[float]] = []
+        self._freqs: List[Optional[float]] = []
+        self._start_time = 0.0
+        self._start_throttle: Optional[int] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def is_available(self) -> bool:
+        """Check if any telemetry source exists on this system"""
+        return bool(self.temp_sources or self.freq_sources)
+    
+    def sample(self):
+        """Take one sample now"""
+        self._timestamps.append(time.time() - self._start_time)
+        self._temps.append(read_cpu_temperature(self.temp_sources))
+        self._freqs.append(read_cpu_frequency(self.freq_sources))
+    
+    def _run(self):
+        """Sampling loop (runs in the background thread)"""
+        while not self._stop_event.is_set():
+            self.sample()
+            self._stop_event.wait(self.interval)
+    
+    def start(self):
+        """Start sampling in a background daemon thread"""
+        self._timestamps, self._temps, self._freqs = [], [], []
+        self._start_time = time.time()
+        self._start_throttle = read_throttle_count(self.throttle_sources)
+        self._stop_event.clear()
+        if not self.is_available():
+            return
+        self._thread = threading.Thread(target=self._run, name="benchlab-telemetry", daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> TelemetrySummary:
+        """Stop sampling and summarize what was collected"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            # Closing sample so short tests still get an end reading
+            self.sample()
+        return self.summary()
+    
+    def summary(self) -> TelemetrySummary:
+        """Summarize samples collected so far"""
+        temps = [t for t in self._temps if t is not None]
+        freqs = [f for f in self._freqs if f is not None]
+        
+        throttle_events = None
+        end_throttle = read_throttle_count(self.throttle_sources)
+        if self._start_throttle is not None and end_throttle is not None:
+            throttle_events = end_throttle - self._start_throttle
+        
+        return TelemetrySummary(
+            samples=len(self._timestamps),
+            interval=self.interval,
+            temp_min=min(temps) if temps else None,
+            temp_avg=sum(temps) / len(temps) if temps else None,
+            temp_max=max(temps) if temps else None,
+            freq_min_mhz=min(freqs) if freqs else None,
+            freq_avg_mhz=sum(freqs) / len(freqs) if freqs else None,
+            freq_max_mhz=max(freqs) if freqs else None,
+            throttle_events=throttle_events,
+            timestamps=list(self._timestamps),
+            temp_series=list(self._temps),
+            freq_series_mhz=list(self._freqs)
+        )
+    
+    def __enter__(self):
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
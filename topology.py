@@ -0,0 +1,226 @@
+"""
+CPU Topology Module
+Reads logical CPU, core-type, isolation and cache information from Linux sysfs
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from bench_utils import format_bytes, read_text
+
+
+SYSFS_CPU = "/sys/devices/system/cpu"
+SYSFS_NODE = "/sys/devices/system/node"
+
+
+@dataclass
+class CacheInfo:
+    """One cache as seen from a CPU (/sys/devices/system/cpu/cpuN/cache/indexM)"""
+    level: int
+    cache_type: str
+    size: int
+    line_size: Optional[int] = None
+    ways: Optional[int] = None
+    shared_cpus: List[int] = field(default_factory=list)
+    
+    @property
+    def name(self) -> str:
+        """Short name such as 'L1d', 'L1i', 'L2'"""
+        suffix = {"Data": "d", "Instruction": "i"}.get(self.cache_type, "")
+        return f"L{self.level}{suffix}"
+    
+    @property
+    def holds_data(self) -> bool:
+        """True for data and unified caches"""
+        return self.cache_type != "Instruction"
+
+
+@dataclass
+class NumaNode:
+    """One NUMA node (/sys/devices/system/node/nodeN)"""
+    node: int
+    cpus: List[int]
+    memory_total: Optional[int] = None
+    distances: List[int] = field(default_factory=list)
+
+
+def parse_cpu_list(text: str) -> List[int]:
+    """Parse a kernel CPU list such as '0-3,8,10-11' into sorted CPU ids"""
+    cpus: Set[int] = set()
+    for part in text.strip().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def read_cpu_list(path: str) -> Optional[List[int]]:
+    """Read a sysfs CPU list file (None if it doesn't exist)"""
+    try:
+        with open(path) as f:
+            return parse_cpu_list(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def usable_cpus() -> List[int]:
+    """Logical CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def isolated_cpus() -> List[int]:
+    """CPUs removed from the scheduler with isolcpus= (empty if none)"""
+    return read_cpu_list(os.path.join(SYSFS_CPU, "isolated")) or []
+
+
+def hybrid_core_types() -> Dict[int, str]:
+    """Map CPU id -> core type on hybrid parts; empty on uniform CPUs
+    
+    Intel hybrid parts expose P/E cores as cpu_core/cpu_atom PMU devices;
+    ARM big.LITTLE parts report a per-CPU relative capacity instead.
+    """
+    core_types = {}
+    for device, label in (("cpu_core", "P"), ("cpu_atom", "E")):
+        cpus = read_cpu_list(f"/sys/devices/{device}/cpus")
+        for cpu in cpus or []:
+            core_types[cpu] = label
+    if core_types:
+        return core_types
+    
+    capacities = {}
+    for cpu in usable_cpus():
+        try:
+            with open(os.path.join(SYSFS_CPU, f"cpu{cpu}", "cpu_capacity")) as f:
+                capacities[cpu] = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+    if len(set(capacities.values())) > 1:
+        return {cpu: f"cap {capacity}" for cpu, capacity in capacities.items()}
+    return {}
+
+
+def smt_sibling_groups() -> List[List[int]]:
+    """Usable logical CPUs grouped by physical core (one list per core)"""
+    usable = set(usable_cpus())
+    groups = []
+    seen: Set[int] = set()
+    for cpu in sorted(usable):
+        if cpu in seen:
+            continue
+        siblings = read_cpu_list(os.path.join(SYSFS_CPU, f"cpu{cpu}", "topology", "thread_siblings_list"))
+        group = [sibling for sibling in (siblings or [cpu]) if sibling in usable] or [cpu]
+        seen.update(group)
+        groups.append(group)
+    return groups
+
+
+def spread_cpu_order() -> List[int]:
+    """Usable CPUs ordered one per physical core first, then the remaining SMT siblings"""
+    groups = smt_sibling_groups()
+    depth = max((len(group) for group in groups), default=0)
+    return [group[i] for i in range(depth) for group in groups if i < len(group)]
+
+
+def parse_size(text: str) -> int:
+    """Parse a sysfs cache size such as '48K', '2048K' or '32M' into bytes"""
+    text = text.strip().upper()
+    multipliers = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    if text and text[-1] in multipliers:
+        return int(text[:-1]) * multipliers[text[-1]]
+    return int(text)
+
+
+def cache_hierarchy(cpu: Optional[int] = None) -> List[CacheInfo]:
+    """Caches visible from one CPU, ordered by level (empty if sysfs has no cache info)"""
+    if cpu is None:
+        cpu = usable_cpus()[0]
+    caches = []
+    cache_dir = os.path.join(SYSFS_CPU, f"cpu{cpu}", "cache")
+    try:
+        entries = sorted(entry for entry in os.listdir(cache_dir) if entry.startswith("index"))
+    except OSError:
+        return []
+    for entry in entries:
+        path = os.path.join(cache_dir, entry)
+        level = read_text(os.path.join(path, "level"))
+        size = read_text(os.path.join(path, "size"))
+        if not level or not size:
+            continue
+        line_size = read_text(os.path.join(path, "coherency_line_size"))
+        ways = read_text(os.path.join(path, "ways_of_associativity"))
+        caches.append(CacheInfo(
+            level=int(level),
+            cache_type=read_text(os.path.join(path, "type")) or "Unified",
+            size=parse_size(size),
+            line_size=int(line_size) if line_size else None,
+            ways=int(ways) if ways else None,
+            shared_cpus=read_cpu_list(os.path.join(path, "shared_cpu_list")) or [cpu]
+        ))
+    return sorted(caches, key=lambda cache: (cache.level, cache.cache_type))
+
+
+def data_caches(cpu: Optional[int] = None) -> List[CacheInfo]:
+    """Data/unified caches from smallest level to last-level cache"""
+    return [cache for cache in cache_hierarchy(cpu) if cache.holds_data]
+
+
+def describe_caches(caches: List[CacheInfo]) -> str:
+    """One-line summary such as 'L1d 48 KB, L2 2 MB, L3 32 MB (x8 CPUs) | 64 B lines'"""
+    if not caches:
+        return "not reported by sysfs"
+    parts = []
+    for cache in caches:
+        text = f"{cache.name} {format_bytes(cache.size)}"
+        if len(cache.shared_cpus) > 1:
+            text += f" (x{len(cache.shared_cpus)} CPUs)"
+        parts.append(text)
+    line_sizes = sorted({cache.line_size for cache in caches if cache.line_size})
+    summary = ", ".join(parts)
+    if line_sizes:
+        summary += " | " + "/".join(str(size) for size in line_sizes) + " B lines"
+    return summary
+
+
+def numa_nodes() -> List[NumaNode]:
+    """NUMA nodes with their usable CPUs, memory size and sysfs distances
+    
+    Machines without NUMA (or without the sysfs node tree) report a single node 0
+    holding every usable CPU.
+    """
+    usable = set(usable_cpus())
+    online = read_cpu_list(os.path.join(SYSFS_NODE, "online"))
+    if not online:
+        return [NumaNode(node=0, cpus=sorted(usable))]
+    
+    nodes = []
+    for node in online:
+        path = os.path.join(SYSFS_NODE, f"node{node}")
+        cpus = [cpu for cpu in read_cpu_list(os.path.join(path, "cpulist")) or [] if cpu in usable]
+        memory_total = None
+        try:
+            with open(os.path.join(path, "meminfo")) as f:
+                for line in f:
+                    # "Node 0 MemTotal:        5340920 kB"
+                    if "MemTotal:" in line:
+                        memory_total = int(line.split()[3]) * 1024
+                        break
+        except (OSError, ValueError, IndexError):
+            pass
+        distances = (read_text(os.path.join(path, "distance")) or "").split()
+        nodes.append(NumaNode(node=node, cpus=cpus, memory_total=memory_total,
+                              distances=[int(distance) for distance in distances]))
+    return nodes
+
+
+def numa_balancing_enabled() -> Optional[bool]:
+    """Whether automatic NUMA balancing (page migration toward the accessing node) is on"""
+    value = read_text("/proc/sys/kernel/numa_balancing")
+    return None if value is None else value != "0"